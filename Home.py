@@ -188,7 +188,7 @@ with st.expander("🧪 Phase 1: Firebase & Cache Testing", expanded=False):
             with st.spinner("Testing data operations..."):
                 try:
                     import polars as pl
-                    from src.services.firebase_service import FirebaseService
+                    from src.services.firebase_service import get_firebase_service
 
                     # Create test data
                     test_data = pl.DataFrame({
@@ -196,7 +196,7 @@ with st.expander("🧪 Phase 1: Firebase & Cache Testing", expanded=False):
                         "value": [100.0, 101.5, 99.8]
                     })
 
-                    firebase = FirebaseService()
+                    firebase = get_firebase_service()
 
                     # Test save
                     test_metadata = {
@@ -432,7 +432,7 @@ with st.expander("🧪 Phase 3: FRED API Integration Testing", expanded=False):
         with st.spinner("Fetching treasury yields..."):
             try:
                 from src.services.fred_api import FredService
-                from src.data.cache_manager import CacheManager
+                from src.data.cache_manager import CacheManager, FetchRequest
                 from src.data.fred_datasets import get_category
                 import plotly.graph_objects as go
 
@@ -448,19 +448,22 @@ with st.expander("🧪 Phase 3: FRED API Integration Testing", expanded=False):
 
                     st.info(f"Fetching {len(series_ids)} series: {', '.join(series_ids)}")
 
-                    # Fetch each series through cache
-                    all_data = {}
-                    for series_id in series_ids:
-                        data = cache.get_or_fetch(
+                    # Fetch all series through cache concurrently
+                    failed = {}
+                    all_data = cache.get_or_fetch_many([
+                        FetchRequest(
                             source="fred",
                             source_id=series_id,
                             fetch_fn=lambda sid=series_id: fred.get_series(sid),
                             frequency="daily",
                             metadata_fn=lambda sid=series_id: fred.get_series_metadata(sid)
                         )
-                        all_data[series_id] = data
+                        for series_id in series_ids
+                    ], errors=failed)
 
                     st.success(f"[OK] Fetched {len(all_data)} series")
+                    for series_id, error in failed.items():
+                        st.warning(f"[WARN] {series_id}: {str(error)}")
 
                     # Plot yield curve
                     fig = go.Figure()
@@ -716,24 +719,29 @@ with st.expander("🧪 Phase 4: Stats Canada & yfinance Integration Testing", ex
         with st.spinner(f"Fetching {len(tickers_selected)} tickers..."):
             try:
                 from src.services.yfinance_service import YFinanceService
-                from src.data.cache_manager import CacheManager
+                from src.data.cache_manager import CacheManager, FetchRequest
                 import plotly.graph_objects as go
 
                 yf_service = YFinanceService()
                 cache = CacheManager()
 
-                # Fetch all tickers
-                all_data = {}
-                for ticker in tickers_selected:
-                    data = cache.get_or_fetch(
+                # Fetch all tickers (cache misses are downloaded in one request)
+                batch_fetch = lambda tickers: yf_service.get_many_histories(tickers, period="6mo")
+                failed = {}
+                all_data = cache.get_or_fetch_many([
+                    FetchRequest(
                         source="yfinance",
                         source_id=ticker,
                         fetch_fn=lambda t=ticker: yf_service.get_ticker_history(t, period="6mo"),
-                        frequency="1d"
+                        frequency="1d",
+                        batch_fetch_fn=batch_fetch
                     )
-                    all_data[ticker] = data
+                    for ticker in tickers_selected
+                ], errors=failed)
 
                 st.success(f"[OK] Fetched {len(all_data)} tickers")
+                for ticker, error in failed.items():
+                    st.warning(f"[WARN] {ticker}: {str(error)}")
 
                 # Create normalized comparison chart (base = 100)
                 fig = go.Figure()
@@ -6,7 +6,8 @@ import streamlit as st
 import polars as pl
 from datetime import datetime
 
-from src.data.cache_manager import CacheManager
+from src.data.cache_manager import CacheManager, FetchRequest
+from src.data.memory_cache import get_memory_cache
 from src.services.fred_api import FredService
 from src.services.yfinance_service import YFinanceService
 from src.data.fred_datasets import get_series_config
@@ -135,6 +136,7 @@ with st.sidebar:
     if render_refresh_controls():
         st.cache_data.clear()
         st.cache_resource.clear()
+        get_memory_cache().clear()
         st.success("Cache cleared! Refresh the data using the fetch buttons.")
 
 
@@ -190,40 +192,46 @@ def render_chart1_money_supply_vs_sp500():
     if st.session_state.get("chart1_fetched", False):
         try:
             with st.spinner("Fetching M2, GDP, and S&P 500 data..."):
-                # Fetch ALL available historical data (no date limits)
-                # This ensures cache contains full dataset, then we filter client-side
+                # FRED series are fetched in full; S&P 500 only needs to be cached
+                # from start_date on (date_range), and range_fetch_fn downloads just
+                # the missing days when the selected range goes back further.
+                # Everything is then filtered to the selected range client-side
 
-                # Fetch M2SL from FRED (all historical data)
+                # Fetch MMMFFAQ027S, GDP (FRED) and S&P 500 (yfinance) in one batch
                 moneymarket_fund_config = get_series_config("MMMFFAQ027S")
-                moneymarket_fund_df = cache.get_or_fetch(
-                    source="fred",
-                    source_id="MMMFFAQ027S",
-                    fetch_fn=lambda: fred.get_series("MMMFFAQ027S"),
-                    frequency=moneymarket_fund_config.frequency,
-                    metadata_fn=lambda: fred.get_series_metadata("MMMFFAQ027S"),
-                    force_refresh=False
-                ).with_columns(pl.col("date").cast(pl.Datetime)) # Cast to datetime
-
-                # Fetch GDP from FRED (all historical data)
                 gdp_config = get_series_config("GDP")
-                gdp_df = cache.get_or_fetch(
+                frames = cache.get_or_fetch_many([
+                    FetchRequest(
+                        source="fred",
+                        source_id="MMMFFAQ027S",
+                        fetch_fn=lambda: fred.get_series("MMMFFAQ027S"),
+                        frequency=moneymarket_fund_config.frequency,
+                        metadata_fn=lambda: fred.get_series_metadata("MMMFFAQ027S")
+                    ),
+                    FetchRequest(
                         source="fred",
                         source_id="GDP",
                         fetch_fn=lambda: fred.get_series("GDP"),
                         frequency=gdp_config.frequency,
-                        metadata_fn=lambda: fred.get_series_metadata("GDP"),
-                        force_refresh=False
-                    ).with_columns(pl.col("date").cast(pl.Datetime)) # Cast to datetime
-
-                # Fetch S&P 500 from yfinance (all historical data)
-                sp500_df = cache.get_or_fetch(
-                    source="yfinance",
-                    source_id="^GSPC",
-                    fetch_fn=lambda: yf_service.get_ticker_history("^GSPC", period="max", interval="1d"),
-                    frequency="daily",
-                    metadata_fn=lambda: {"ticker": "^GSPC", "name": "S&P 500"},
-                    force_refresh=False
-                ).with_columns(pl.col("date").cast(pl.Datetime)) # Cast to datetime
+                        metadata_fn=lambda: fred.get_series_metadata("GDP")
+                    ),
+                    FetchRequest(
+                        source="yfinance",
+                        source_id="^GSPC",
+                        fetch_fn=lambda: yf_service.get_ticker_history("^GSPC", period="max", interval="1d"),
+                        frequency="daily",
+                        metadata_fn=lambda: {"ticker": "^GSPC", "name": "S&P 500"},
+                        delta_fetch_fn=lambda since: yf_service.get_ticker_history_since("^GSPC", since),
+                        columns=["date", "close"],
+                        date_range=(start_date, None),
+                        range_fetch_fn=lambda start, end: yf_service.get_ticker_history("^GSPC", period="max", start=start, end=end)
+                    )
+                ])
+
+                # Cast to datetime
+                moneymarket_fund_df = frames["MMMFFAQ027S"].with_columns(pl.col("date").cast(pl.Datetime))
+                gdp_df = frames["GDP"].with_columns(pl.col("date").cast(pl.Datetime))
+                sp500_df = frames["^GSPC"].with_columns(pl.col("date").cast(pl.Datetime))
 
                 # Calculate max date across all fetched series
                 max_date_across_all_series = max(
@@ -371,48 +379,23 @@ def render_chart2_tbill_vs_inflation():
                 # Fetch ALL available historical data (no date limits)
                 # This ensures cache contains full dataset, then we filter client-side
 
-                # Fetch TB3MS from FRED (all historical data)
-                tbill_config = get_series_config("TB3MS")
-                tbill_df = cache.get_or_fetch(
-                    source="fred",
-                    source_id="TB3MS",
-                    fetch_fn=lambda: fred.get_series("TB3MS"),
-                    frequency=tbill_config.frequency,
-                    metadata_fn=lambda: fred.get_series_metadata("TB3MS"),
-                    force_refresh=False
-                ).with_columns(pl.col("date").cast(pl.Datetime)) # Cast to datetime
-
-                # Fetch CPIAUCSL from FRED (all historical data)
-                cpi_config = get_series_config("CPIAUCSL")
-                cpi_df = cache.get_or_fetch(
-                    source="fred",
-                    source_id="CPIAUCSL",
-                    fetch_fn=lambda: fred.get_series("CPIAUCSL"),
-                    frequency=cpi_config.frequency,
-                    metadata_fn=lambda: fred.get_series_metadata("CPIAUCSL"),
-                    force_refresh=False
-                ).with_columns(pl.col("date").cast(pl.Datetime)) # Cast to datetime
-
-                # Fetch M2SL from FRED (all historical data)
-                moneymarket_fund_config = get_series_config("MMMFFAQ027S")
-                mmFund_df = cache.get_or_fetch(
-                    source="fred",
-                    source_id="MMMFFAQ027S",
-                    fetch_fn=lambda: fred.get_series("MMMFFAQ027S"),
-                    frequency=moneymarket_fund_config.frequency,
-                    metadata_fn=lambda: fred.get_series_metadata("MMMFFAQ027S"),
-                    force_refresh=False
-                ).with_columns(pl.col("date").cast(pl.Datetime)) # Cast to datetime
-                # Fetch GDP from FRED (all historical data)
-                gdp_config = get_series_config("GDP")
-                gdp_df = cache.get_or_fetch(
+                # Fetch TB3MS, CPIAUCSL, MMMFFAQ027S and GDP from FRED in one batch
+                frames = cache.get_or_fetch_many([
+                    FetchRequest(
                         source="fred",
-                        source_id="GDP",
-                        fetch_fn=lambda: fred.get_series("GDP"),
-                        frequency=gdp_config.frequency,
-                        metadata_fn=lambda: fred.get_series_metadata("GDP"),
-                        force_refresh=False
-                    ).with_columns(pl.col("date").cast(pl.Datetime)) # Cast to datetime
+                        source_id=series_id,
+                        fetch_fn=lambda sid=series_id: fred.get_series(sid),
+                        frequency=get_series_config(series_id).frequency,
+                        metadata_fn=lambda sid=series_id: fred.get_series_metadata(sid)
+                    )
+                    for series_id in ["TB3MS", "CPIAUCSL", "MMMFFAQ027S", "GDP"]
+                ])
+
+                # Cast to datetime
+                tbill_df = frames["TB3MS"].with_columns(pl.col("date").cast(pl.Datetime))
+                cpi_df = frames["CPIAUCSL"].with_columns(pl.col("date").cast(pl.Datetime))
+                mmFund_df = frames["MMMFFAQ027S"].with_columns(pl.col("date").cast(pl.Datetime))
+                gdp_df = frames["GDP"].with_columns(pl.col("date").cast(pl.Datetime))
 
                 # Calculate max date across all fetched series
                 max_date_across_all_series = max(
@@ -731,41 +714,31 @@ def render_chart1_hyg_tlt_vs_sp500():
 
         try:
             with st.spinner("Fetching HYG, TLT, and S&P 500 data..."):
-                # Calculate period for yfinance (max to get all historical data)
-                yf_period = "max"
-
-                # Fetch HYG from yfinance
-                # force_refresh=True to invalidate old date-limited cache
-                hyg_df = cache.get_or_fetch(
-                    source="yfinance",
-                    source_id="HYG",
-                    fetch_fn=lambda: yf_service.get_ticker_history("HYG", period=yf_period, interval="1d"),
-                    frequency="daily",
-                    metadata_fn=lambda: {"ticker": "HYG", "name": YFINANCE_TICKERS["HYG"]["name"]},
-                    force_refresh=True
-                ).with_columns(pl.col("date").cast(pl.Datetime)) # Cast to datetime
-
-                # Fetch TLT from yfinance
-                # force_refresh=True to invalidate old date-limited cache
-                tlt_df = cache.get_or_fetch(
-                    source="yfinance",
-                    source_id="TLT",
-                    fetch_fn=lambda: yf_service.get_ticker_history("TLT", period=yf_period, interval="1d"),
-                    frequency="daily",
-                    metadata_fn=lambda: {"ticker": "TLT", "name": YFINANCE_TICKERS["TLT"]["name"]},
-                    force_refresh=True
-                ).with_columns(pl.col("date").cast(pl.Datetime)) # Cast to datetime
-
-                # Fetch S&P 500 from yfinance
-                # force_refresh=True to invalidate old date-limited cache
-                sp500_df = cache.get_or_fetch(
-                    source="yfinance",
-                    source_id="^GSPC",
-                    fetch_fn=lambda: yf_service.get_ticker_history("^GSPC", period=yf_period, interval="1d"),
-                    frequency="daily",
-                    metadata_fn=lambda: {"ticker": "^GSPC", "name": "S&P 500"},
-                    force_refresh=True
-                ).with_columns(pl.col("date").cast(pl.Datetime)) # Cast to datetime
+                # Fetch HYG, TLT and S&P 500 from yfinance (max to get all
+                # historical data); cache misses are downloaded in one request
+                batch_fetch = lambda tickers: yf_service.get_many_histories(tickers, period="max", interval="1d")
+                ticker_names = {
+                    "HYG": YFINANCE_TICKERS["HYG"]["name"],
+                    "TLT": YFINANCE_TICKERS["TLT"]["name"],
+                    "^GSPC": "S&P 500"
+                }
+                frames = cache.get_or_fetch_many([
+                    FetchRequest(
+                        source="yfinance",
+                        source_id=ticker,
+                        fetch_fn=lambda t=ticker: yf_service.get_ticker_history(t, period="max", interval="1d"),
+                        frequency="daily",
+                        metadata_fn=lambda t=ticker, name=name: {"ticker": t, "name": name},
+                        columns=["date", "close"],
+                        batch_fetch_fn=batch_fetch
+                    )
+                    for ticker, name in ticker_names.items()
+                ])
+
+                # Cast to datetime
+                hyg_df = frames["HYG"].with_columns(pl.col("date").cast(pl.Datetime))
+                tlt_df = frames["TLT"].with_columns(pl.col("date").cast(pl.Datetime))
+                sp500_df = frames["^GSPC"].with_columns(pl.col("date").cast(pl.Datetime))
 
                 # Calculate max date across all fetched series
                 max_date_across_all_series = max(
@@ -1037,59 +1010,45 @@ def render_chart1_recessionary_indicators():
     if st.session_state.get("chart_rec_fetched", False):
         try:
             with st.spinner("Fetching unemployment, treasury rates, S&P 500, and recession data..."):
-                # Fetch UNRATE from FRED (monthly)
-                unrate_config = get_series_config("UNRATE")
-                unrate_df = cache.get_or_fetch(
-                    source="fred",
-                    source_id="UNRATE",
-                    fetch_fn=lambda: fred.get_series("UNRATE"),
-                    frequency=unrate_config.frequency,
-                    metadata_fn=lambda: fred.get_series_metadata("UNRATE"),
-                    force_refresh=False
-                ).with_columns(pl.col("date").cast(pl.Datetime)) # Cast to datetime
-
-                # Fetch DGS10 from FRED (daily)
-                dgs10_config = get_series_config("DGS10")
-                dgs10_df = cache.get_or_fetch(
-                    source="fred",
-                    source_id="DGS10",
-                    fetch_fn=lambda: fred.get_series("DGS10"),
-                    frequency=dgs10_config.frequency,
-                    metadata_fn=lambda: fred.get_series_metadata("DGS10"),
-                    force_refresh=False
-                ).with_columns(pl.col("date").cast(pl.Datetime)) # Cast to datetime
-
-                # Fetch DGS1 from FRED (daily)
-                dgs1_config = get_series_config("DGS1")
-                dgs1_df = cache.get_or_fetch(
-                    source="fred",
-                    source_id="DGS1",
-                    fetch_fn=lambda: fred.get_series("DGS1"),
-                    frequency=dgs1_config.frequency,
-                    metadata_fn=lambda: fred.get_series_metadata("DGS1"),
-                    force_refresh=False
-                ).with_columns(pl.col("date").cast(pl.Datetime)) # Cast to datetime
-
-                # Fetch JHDUSRGDPBR from FRED (quarterly)
-                recession_config = get_series_config("JHDUSRGDPBR")
-                recession_df = cache.get_or_fetch(
-                    source="fred",
-                    source_id="JHDUSRGDPBR",
-                    fetch_fn=lambda: fred.get_series("JHDUSRGDPBR"),
-                    frequency=recession_config.frequency,
-                    metadata_fn=lambda: fred.get_series_metadata("JHDUSRGDPBR"),
-                    force_refresh=False
-                ).with_columns(pl.col("date").cast(pl.Datetime)) # Cast to datetime
-
-                # Fetch S&P 500 from yfinance (daily)
-                sp500_df = cache.get_or_fetch(
-                    source="yfinance",
-                    source_id="^GSPC",
-                    fetch_fn=lambda: yf_service.get_ticker_history("^GSPC", period="max", interval="1d"),
-                    frequency="daily",
-                    metadata_fn=lambda: {"ticker": "^GSPC", "name": "S&P 500"},
-                    force_refresh=False
-                ).with_columns(pl.col("date").cast(pl.Datetime)) # Cast to datetime
+                # Fetch UNRATE (monthly), DGS10/DGS1 (daily), JHDUSRGDPBR (quarterly)
+                # from FRED and S&P 500 (daily) from yfinance in one batch. S&P 500
+                # is only required from start_date on (date_range); older days are
+                # downloaded by range_fetch_fn when the selected range grows
+                fred_requests = [
+                    FetchRequest(
+                        source="fred",
+                        source_id=series_id,
+                        fetch_fn=lambda sid=series_id: fred.get_series(sid),
+                        frequency=get_series_config(series_id).frequency,
+                        metadata_fn=lambda sid=series_id: fred.get_series_metadata(sid),
+                        # Daily yields only need the latest observations on refresh
+                        delta_fetch_fn=(
+                            (lambda since, sid=series_id: fred.get_series(sid, observation_start=since.isoformat()))
+                            if series_id in ("DGS10", "DGS1") else None
+                        )
+                    )
+                    for series_id in ["UNRATE", "DGS10", "DGS1", "JHDUSRGDPBR"]
+                ]
+                frames = cache.get_or_fetch_many(fred_requests + [
+                    FetchRequest(
+                        source="yfinance",
+                        source_id="^GSPC",
+                        fetch_fn=lambda: yf_service.get_ticker_history("^GSPC", period="max", interval="1d"),
+                        frequency="daily",
+                        metadata_fn=lambda: {"ticker": "^GSPC", "name": "S&P 500"},
+                        delta_fetch_fn=lambda since: yf_service.get_ticker_history_since("^GSPC", since),
+                        columns=["date", "close"],
+                        date_range=(start_date, None),
+                        range_fetch_fn=lambda start, end: yf_service.get_ticker_history("^GSPC", period="max", start=start, end=end)
+                    )
+                ])
+
+                # Cast to datetime
+                unrate_df = frames["UNRATE"].with_columns(pl.col("date").cast(pl.Datetime))
+                dgs10_df = frames["DGS10"].with_columns(pl.col("date").cast(pl.Datetime))
+                dgs1_df = frames["DGS1"].with_columns(pl.col("date").cast(pl.Datetime))
+                recession_df = frames["JHDUSRGDPBR"].with_columns(pl.col("date").cast(pl.Datetime))
+                sp500_df = frames["^GSPC"].with_columns(pl.col("date").cast(pl.Datetime))
 
                 # Calculate max date across all fetched series
                 max_date_across_all_series = max(
@@ -14,7 +14,7 @@ from datetime import datetime
 import streamlit as st
 from google.cloud import firestore
 
-from src.services.firebase_service import FirebaseService
+from src.services.gcp_clients import get_firestore_client
 
 
 def initialize_auth_state() -> None:
@@ -137,9 +137,8 @@ def log_user_login() -> None:
         return
 
     try:
-        # Get Firebase service
-        firebase_service = FirebaseService()
-        db = firebase_service.db
+        # Shared Firestore client (no Cloud Storage client is built)
+        db = get_firestore_client()
 
         # Use email as document ID (sanitize for Firestore path)
         user_email = st.user.email
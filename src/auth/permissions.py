@@ -13,7 +13,7 @@ from datetime import datetime
 import streamlit as st
 
 from src.config.settings import get_app_config
-from src.services.firebase_service import FirebaseService
+from src.services.gcp_clients import get_firestore_client
 
 
 def is_admin(email: str = None) -> bool:
@@ -114,9 +114,8 @@ def get_all_users() -> List[Dict[str, Any]]:
         raise PermissionError("Only administrators can view user list")
 
     try:
-        # Get Firebase service
-        firebase_service = FirebaseService()
-        db = firebase_service.db
+        # Shared Firestore client (no Cloud Storage client is built)
+        db = get_firestore_client()
 
         # Query all users
         users_ref = db.collection("users")
@@ -175,9 +174,8 @@ def get_user_login_info(email: str) -> Dict[str, Any]:
         raise PermissionError("Only administrators can view user information")
 
     try:
-        # Get Firebase service
-        firebase_service = FirebaseService()
-        db = firebase_service.db
+        # Shared Firestore client (no Cloud Storage client is built)
+        db = get_firestore_client()
 
         # Sanitize email for document ID
         doc_id = email.replace(".", "_").replace("@", "_at_")
@@ -7,8 +7,10 @@ from datetime import datetime
 from typing import Dict, Any
 
 from src.data.cache_manager import CacheManager
+from src.data.memory_cache import get_memory_cache
 from src.services.fred_api import FredService
 from src.services.yfinance_service import YFinanceService
+from src.services.rate_limiter import get_rate_limiter_stats
 # from src.services.statscan_api import StatscanService # Assuming it exists
 
 def render_admin_dashboard(cache_manager: CacheManager, fred_service: FredService, yf_service: YFinanceService): #, statscan_service: StatscanService):
@@ -21,11 +23,20 @@ def render_admin_dashboard(cache_manager: CacheManager, fred_service: FredServic
     st.subheader("Cache Management")
     st.info("Here you can view cache statistics and force a refresh of data from various sources.")
 
-    cache_stats = cache_manager.get_cache_stats()
+    cache_stats = cache_manager.get_stats()
 
     if cache_stats:
         st.write("### Cache Statistics")
-        st.dataframe(pl.DataFrame(cache_stats).to_pandas(), use_container_width=True) # Display as DataFrame
+        by_source = cache_stats.get("by_source", {})
+        st.dataframe(pl.DataFrame([
+            {"source": source, **counts} for source, counts in by_source.items()
+        ]).to_pandas(), use_container_width=True) # Display as DataFrame
+        st.caption(
+            f"{cache_stats['total_datasets']} datasets, {cache_stats['total_files']} files, "
+            f"{cache_stats['total_size_mb']} MB"
+        )
+
+        render_cache_metrics(cache_manager)
 
         st.write("### Force Data Refresh")
         col1, col2, col3 = st.columns(3)
@@ -55,6 +66,7 @@ def render_admin_dashboard(cache_manager: CacheManager, fred_service: FredServic
         if st.button("Clear ALL Streamlit Caches (Full Refresh)", key="clear_all_st_caches", type="secondary", use_container_width=True):
             st.cache_data.clear()
             st.cache_resource.clear()
+            get_memory_cache().clear()
             st.rerun()
             st.success("All Streamlit caches cleared. Page will re-run and re-fetch all data.")
     else:
@@ -64,3 +76,71 @@ def render_admin_dashboard(cache_manager: CacheManager, fred_service: FredServic
     st.write(f"**Current Time:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     st.write(f"**Streamlit Version:** {st.__version__}")
     # Add more system info if needed
+
+
+def render_cache_metrics(cache_manager: CacheManager):
+    """
+    Renders hit rates, tier usage, bytes transferred and latency percentiles
+    recorded by this app process since it started (or the last reset).
+    """
+    metrics = cache_manager.get_metrics()
+
+    st.write("### Cache Performance")
+    st.caption(f"This process since {metrics['since'][:19].replace('T', ' ')}")
+
+    sources = sorted(set(metrics["counters"]) | set(metrics["tiers"]) | set(metrics["bytes"]))
+    if not sources:
+        st.info("No cache activity recorded yet.")
+        return
+
+    rows = []
+    for source in sources:
+        counters = metrics["counters"].get(source, {})
+        tiers = metrics["tiers"].get(source, {})
+        transferred = metrics["bytes"].get(source, {})
+        rows.append({
+            "source": source,
+            "hit_rate_%": round(counters.get("hit_rate", 0.0) * 100, 1),
+            "hits": counters.get("hit", 0),
+            "stale": counters.get("stale", 0),
+            "misses": counters.get("miss", 0),
+            "not_found": counters.get("not_found", 0),
+            "errors": counters.get("error", 0),
+            "stale_fallbacks": counters.get("stale_fallback", 0),
+            "revalidated": counters.get("revalidated", 0),
+            "memory": tiers.get("memory", 0),
+            "local": tiers.get("local", 0),
+            "remote": tiers.get("remote", 0),
+            "downloaded_mb": round(transferred.get("downloaded", 0) / (1024 * 1024), 2),
+            "uploaded_mb": round(transferred.get("uploaded", 0) / (1024 * 1024), 2)
+        })
+    st.dataframe(pl.DataFrame(rows).to_pandas(), use_container_width=True, hide_index=True)
+
+    latency_rows = [
+        {
+            "operation": operation,
+            "source": source,
+            "count": summary["count"],
+            "mean_ms": summary["mean_ms"],
+            "p50_ms": summary["p50_ms"],
+            "p95_ms": summary["p95_ms"],
+            "max_ms": summary["max_ms"]
+        }
+        for operation, by_source in metrics["latency"].items()
+        for source, summary in by_source.items()
+    ]
+    if latency_rows:
+        st.write("**Latency** (p50/p95 are histogram bucket upper bounds)")
+        st.dataframe(pl.DataFrame(latency_rows).to_pandas(), use_container_width=True, hide_index=True)
+
+    limiter_rows = [
+        {"upstream": upstream, **stats}
+        for upstream, stats in sorted(get_rate_limiter_stats().items())
+    ]
+    if limiter_rows:
+        st.write("**Upstream Rate Limiters** (requests/sec, shared by all sessions)")
+        st.dataframe(pl.DataFrame(limiter_rows).to_pandas(), use_container_width=True, hide_index=True)
+
+    if st.button("Reset Cache Metrics", key="reset_cache_metrics"):
+        cache_manager.reset_metrics()
+        st.rerun()
@@ -30,6 +30,34 @@ YFINANCE_UPDATE_LOGS_COLLECTION = "yfinance_update_logs"
 STATSCAN_METADATA_COLLECTION = "statscan_metadata"
 STATSCAN_UPDATE_LOGS_COLLECTION = "statscan_update_logs"
 
+# Update logs for all sources, in one collection so recent logs can be read
+# with a single time-ordered query. The per-source log collections above are
+# no longer written, but are still read until FirebaseService.migrate_legacy_logs()
+# has copied them here. Filtering by source needs the composite index declared
+# in firestore.indexes.json (source ASC, timestamp DESC).
+UPDATE_LOGS_COLLECTION = "update_logs"
+
+# One marker document per legacy log collection already copied into
+# UPDATE_LOGS_COLLECTION (doc id = legacy collection name)
+UPDATE_LOGS_MIGRATIONS_COLLECTION = "update_logs_migrations"
+
+# Max writes per Firestore batch commit
+FIRESTORE_BATCH_LIMIT = 500
+
+# Update log entries are buffered and written in batches, when this many are
+# pending or after this many seconds, whichever comes first
+LOG_BATCH_SIZE = 50
+LOG_FLUSH_INTERVAL_SECONDS = 5.0
+LOG_BUFFER_MAX_ENTRIES = 1000  # Oldest entries are dropped if writes keep failing
+
+# Running totals (datasets, rows, files, bytes per source), updated on every
+# save/delete so cache statistics are a single document read
+CACHE_STATS_COLLECTION = "cache_stats"
+CACHE_STATS_DOC_ID = "totals"
+# Field written only by a full rebuild; until it is present the doc may hold
+# increments from saves alone (e.g. the first save of an existing deployment)
+CACHE_STATS_INITIALIZED_FIELD = "initialized_at"
+
 # =============================================================================
 # CLOUD STORAGE PATHS
 # =============================================================================
@@ -42,6 +70,22 @@ STATSCAN_STORAGE_PREFIX = "statscan"
 # File format
 DATA_FILE_FORMAT = "parquet"  # Use Parquet for all data storage
 
+# Rows per Parquet row group; smaller groups let date-range reads skip more
+# of the file using row-group min/max statistics
+PARQUET_ROW_GROUP_SIZE = 4096
+
+# Projected loads (columns / date range) of blobs at least this large read
+# only the footer and needed row groups via ranged Cloud Storage requests
+# instead of downloading the whole file
+REMOTE_PUSHDOWN_MIN_BYTES = 256 * 1024  # 256 KB
+REMOTE_READ_CHUNK_BYTES = 256 * 1024    # Bytes fetched per ranged request
+
+# Long daily histories are stored as one Parquet file per calendar year,
+# listed in a partition manifest in the metadata doc. Appends only rewrite
+# the partitions they touch and date-range reads only fetch overlapping ones.
+PARTITIONED_FREQUENCIES = ["daily", "1d"]
+PARTITION_DIR = "partitions"  # {prefix}/{source_id}/partitions/{YYYY}/{YYYYMMDD}.parquet
+
 # =============================================================================
 # RETENTION POLICIES
 # =============================================================================
@@ -49,6 +93,78 @@ DATA_FILE_FORMAT = "parquet"  # Use Parquet for all data storage
 # Keep last N versions of each dataset before cleanup
 KEEP_VERSIONS = 3
 
+# =============================================================================
+# STORAGE BACKEND
+# =============================================================================
+
+# "gcp" = Firestore + Cloud Storage; "local" = SQLite + files under
+# LOCAL_STORAGE_DIR (for running/benchmarking the cache layer without GCP)
+STORAGE_BACKEND = "gcp"
+LOCAL_STORAGE_DIR = ".storage"
+
+# =============================================================================
+# LOCAL CACHE TIERS
+# =============================================================================
+
+# Local on-disk Parquet tier checked before Cloud Storage downloads
+LOCAL_CACHE_DIR = ".cache/parquet"
+LOCAL_CACHE_MAX_BYTES = 512 * 1024 * 1024  # 512 MB, LRU-evicted beyond this
+
+# In-process tier of decoded DataFrames shared across Streamlit sessions
+MEMORY_CACHE_MAX_BYTES = 256 * 1024 * 1024  # 256 MB of estimated frame size
+
+# Cross-process refresh lease recorded in the metadata doc, so multiple app
+# replicas don't all refetch the same stale series at once (opt-in)
+REFRESH_LEASE_ENABLED = False
+REFRESH_LEASE_TTL_SECONDS = 120     # Lease expires if the holder dies mid-fetch
+REFRESH_LEASE_WAIT_SECONDS = 30     # Max time to wait for another replica's refresh
+REFRESH_LEASE_POLL_SECONDS = 1.0    # Metadata poll interval while waiting
+
+# Connections kept open by the shared Cloud Storage HTTP session (requests'
+# default of 10 is below concurrent downloads across sessions)
+GCS_HTTP_POOL_SIZE = 32
+
+# FRED observations backend: "fredapi" (library, pandas-based) or "http"
+# (direct JSON requests over a pooled session, decoded straight to Polars).
+# Overridable with [fred] backend in secrets or per FredService.get_series call.
+FRED_BACKEND = "fredapi"
+
+# Upstream API rate limits (token buckets shared by all sessions in the
+# process, see services/rate_limiter.py). A bucket allows `burst` requests
+# back to back, then `rate` per second; burst + rate * window stays within
+# each documented limit:
+# - FRED: 120 requests per minute per API key
+# - Stats Canada WDS: 25 requests per second per server
+# - Yahoo Finance: no published limit; kept conservative to avoid throttling
+UPSTREAM_RATE_LIMITS = {
+    "fred": {"rate": 1.8, "burst": 10},
+    "yfinance": {"rate": 5.0, "burst": 5},
+    "statscan": {"rate": 20.0, "burst": 5}
+}
+
+# Batched loads (CacheManager.get_or_fetch_many)
+BATCH_LOAD_WORKERS = 8  # Concurrent Cloud Storage downloads per batch
+
+# Max concurrent upstream fetches per source within a batch
+SOURCE_FETCH_CONCURRENCY = {
+    "fred": 4,
+    "yfinance": 4,
+    "statscan": 2
+}
+
+# Incremental (delta) refresh: days of already-cached history re-fetched so
+# late revisions overwrite cached values, keyed by data frequency
+INCREMENTAL_OVERLAP_DAYS = {
+    "daily": 7,
+    "1d": 7,
+    "weekly": 28,
+    "1wk": 28,
+    "monthly": 93,
+    "1mo": 93,
+    "quarterly": 190,
+    "annual": 730
+}
+
 # Cache freshness thresholds (in hours)
 # Data is considered stale if older than these thresholds
 FRESHNESS_THRESHOLDS = {
@@ -73,6 +189,53 @@ FRESHNESS_THRESHOLDS = {
     }
 }
 
+# Stale-while-revalidate: past its freshness threshold, cached data is still
+# served instantly (and refreshed in the background) for this fraction of the
+# threshold. E.g. daily data (24h) is served stale for up to 12 more hours.
+STALE_GRACE_FACTOR = 0.5
+
+# Background threads running stale-while-revalidate refreshes
+BACKGROUND_REFRESH_WORKERS = 2
+
+# Release-aware freshness: FRED and Stats Canada data is revalidated at
+# least this often (capping the thresholds above), but with a cheap "has
+# anything been released since?" check; the full fetch only happens when
+# the source published new data (see src/data/release_calendar.py)
+RELEASE_AWARE_FRESHNESS = True
+RELEASE_CHECK_INTERVAL_HOURS = {
+    "fred": 24,
+    "statscan": 24
+}
+
+# Stats Canada publishes at 08:30 Eastern; changed-cube lists are read once
+# per day after that, and only this many days back
+STATSCAN_TIMEZONE = "America/Toronto"
+STATSCAN_RELEASE_TIME = "08:30"
+STATSCAN_CHANGE_LOOKBACK_DAYS = 31
+
+# Datasets that do not exist upstream (unknown ticker, invalid FRED ID, empty
+# Stats Canada vectors) fail fast for this long instead of being refetched
+NEGATIVE_CACHE_TTL_SECONDS = 300
+
+# Cache instrumentation (src/data/metrics.py): latency histogram bucket upper
+# bounds in milliseconds, from memory-tier speed to slow upstream fetches
+METRICS_LATENCY_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+# Warm-up job (python -m src.data.warmup): datasets are refreshed once they
+# reach this fraction of their freshness threshold, so a job run on a
+# schedule renews them before users ever see them expire
+WARMUP_REFRESH_AHEAD_FACTOR = 0.8
+WARMUP_WORKERS = 8  # Concurrent refreshes (still capped per source)
+
+# Write-behind persistence: fetched data is returned immediately and the
+# upload, metadata write, version cleanup and audit log run in background
+# workers (opt-in; pending writes are flushed at interpreter exit)
+WRITE_BEHIND_ENABLED = False
+WRITE_BEHIND_WORKERS = 2                # Writes for one dataset always share a worker
+WRITE_BEHIND_MAX_PENDING = 32           # Per worker; further submits block (backpressure)
+WRITE_BEHIND_MAX_RETRIES = 3
+WRITE_BEHIND_RETRY_DELAY_SECONDS = 1.0  # Doubles after each failed attempt
+
 # =============================================================================
 # FRED SERIES TO TRACK
 # =============================================================================
@@ -419,13 +582,16 @@ def get_storage_prefix(source: str) -> str:
     return prefixes[source]
 
 
-def get_freshness_threshold(source: str, frequency: str) -> int:
+def get_freshness_threshold(source: str, frequency: str, release_checked: bool = False) -> int:
     """
     Get cache freshness threshold in hours for a given source and frequency.
 
     Args:
         source: Data source identifier ("fred", "yfinance", "statscan")
         frequency: Data frequency (e.g., "daily", "monthly", "1d", etc.)
+        release_checked: If True, stale data is revalidated with a release
+                        check, so the threshold is capped at
+                        RELEASE_CHECK_INTERVAL_HOURS for the source
 
     Returns:
         int: Freshness threshold in hours
@@ -438,6 +604,29 @@ def get_freshness_threshold(source: str, frequency: str) -> int:
 
     if frequency not in FRESHNESS_THRESHOLDS[source]:
         # Default to daily if frequency not found
-        return FRESHNESS_THRESHOLDS[source].get("daily", 24)
+        threshold = FRESHNESS_THRESHOLDS[source].get("daily", 24)
+    else:
+        threshold = FRESHNESS_THRESHOLDS[source][frequency]
+
+    if release_checked and source in RELEASE_CHECK_INTERVAL_HOURS:
+        return min(threshold, RELEASE_CHECK_INTERVAL_HOURS[source])
+
+    return threshold
 
-    return FRESHNESS_THRESHOLDS[source][frequency]
+
+def get_stale_grace_hours(source: str, frequency: str, release_checked: bool = False) -> float:
+    """
+    Get how long past its freshness threshold data may be served stale.
+
+    Args:
+        source: Data source identifier ("fred", "yfinance", "statscan")
+        frequency: Data frequency (e.g., "daily", "monthly", "1d", etc.)
+        release_checked: See get_freshness_threshold
+
+    Returns:
+        float: Grace window in hours (after the freshness threshold)
+
+    Raises:
+        ValueError: If source is not recognized
+    """
+    return get_freshness_threshold(source, frequency, release_checked) * STALE_GRACE_FACTOR
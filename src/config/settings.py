@@ -11,6 +11,20 @@ stored in .streamlit/secrets.toml.
 import streamlit as st
 from typing import Dict, Any
 
+from src.config.constants import (
+    LOCAL_CACHE_DIR,
+    LOCAL_CACHE_MAX_BYTES,
+    MEMORY_CACHE_MAX_BYTES,
+    REFRESH_LEASE_ENABLED,
+    WRITE_BEHIND_ENABLED,
+    RELEASE_AWARE_FRESHNESS,
+    NEGATIVE_CACHE_TTL_SECONDS,
+    STORAGE_BACKEND,
+    LOCAL_STORAGE_DIR,
+    FRED_BACKEND,
+    UPSTREAM_RATE_LIMITS
+)
+
 
 def get_firebase_config() -> Dict[str, Any]:
     """
@@ -52,13 +66,17 @@ def get_fred_config() -> Dict[str, str]:
     Returns:
         dict: FRED configuration containing:
             - api_key: FRED API key
+            - backend: Observations backend, "fredapi" or "http" (optional,
+              defaults to FRED_BACKEND)
 
     Raises:
         KeyError: If FRED API key is missing
     """
     try:
+        fred_secrets = st.secrets["fred"]
         return {
-            "api_key": st.secrets["fred"]["api_key"]
+            "api_key": fred_secrets["api_key"],
+            "backend": fred_secrets.get("backend", FRED_BACKEND)
         }
     except KeyError as e:
         raise KeyError(
@@ -118,6 +136,93 @@ def get_auth_config() -> Dict[str, str]:
         )
 
 
+def get_cache_config() -> Dict[str, Any]:
+    """
+    Load optional local cache configuration from st.secrets.
+
+    The [cache] section is optional. Any missing value falls back to the
+    defaults in constants.py so the app runs without extra configuration.
+
+    Returns:
+        dict: Cache configuration containing:
+            - local_dir: Directory for the on-disk Parquet tier
+            - local_max_bytes: Byte budget for the on-disk Parquet tier
+            - memory_max_bytes: Byte budget for the in-process DataFrame tier
+            - refresh_lease: Whether replicas coordinate refreshes via a lease
+            - write_behind: Whether fetched data is persisted in the background
+            - release_checks: Whether stale FRED/Stats Canada data is
+              revalidated with a release check before refetching
+            - negative_ttl_seconds: How long datasets not found upstream
+              fail fast (0 disables the negative cache)
+    """
+    try:
+        cache_secrets = dict(st.secrets.get("cache", {}))
+    except Exception:
+        # No secrets.toml available (e.g. headless scripts)
+        cache_secrets = {}
+
+    return {
+        "local_dir": cache_secrets.get("local_dir", LOCAL_CACHE_DIR),
+        "local_max_bytes": int(cache_secrets.get("local_max_bytes", LOCAL_CACHE_MAX_BYTES)),
+        "memory_max_bytes": int(cache_secrets.get("memory_max_bytes", MEMORY_CACHE_MAX_BYTES)),
+        "refresh_lease": bool(cache_secrets.get("refresh_lease", REFRESH_LEASE_ENABLED)),
+        "write_behind": bool(cache_secrets.get("write_behind", WRITE_BEHIND_ENABLED)),
+        "release_checks": bool(cache_secrets.get("release_checks", RELEASE_AWARE_FRESHNESS)),
+        "negative_ttl_seconds": float(cache_secrets.get("negative_ttl_seconds", NEGATIVE_CACHE_TTL_SECONDS))
+    }
+
+
+def get_storage_config() -> Dict[str, Any]:
+    """
+    Load optional storage backend configuration from st.secrets.
+
+    The [storage] section is optional; without it the Firestore + Cloud
+    Storage backend is used.
+
+    Returns:
+        dict: Storage configuration containing:
+            - backend: "gcp" or "local"
+            - local_dir: Root directory for the local backend
+    """
+    try:
+        storage_secrets = dict(st.secrets.get("storage", {}))
+    except Exception:
+        # No secrets.toml available (e.g. headless scripts)
+        storage_secrets = {}
+
+    return {
+        "backend": storage_secrets.get("backend", STORAGE_BACKEND),
+        "local_dir": storage_secrets.get("local_dir", LOCAL_STORAGE_DIR)
+    }
+
+
+def get_rate_limit_config() -> Dict[str, Dict[str, float]]:
+    """
+    Load upstream API rate limits, with optional overrides from st.secrets.
+
+    The [rate_limits] section is optional, e.g.:
+        [rate_limits]
+        fred = { rate = 1.0, burst = 5 }
+
+    Returns:
+        dict: {upstream: {"rate": requests per second, "burst": max back-to-back requests}}
+    """
+    try:
+        limit_secrets = dict(st.secrets.get("rate_limits", {}))
+    except Exception:
+        # No secrets.toml available (e.g. headless scripts)
+        limit_secrets = {}
+
+    limits = {}
+    for upstream, defaults in UPSTREAM_RATE_LIMITS.items():
+        overrides = dict(limit_secrets.get(upstream, {}))
+        limits[upstream] = {
+            "rate": float(overrides.get("rate", defaults["rate"])),
+            "burst": float(overrides.get("burst", defaults["burst"]))
+        }
+    return limits
+
+
 def verify_all_configs() -> Dict[str, bool]:
     """
     Verify that all required configurations are present in secrets.toml.
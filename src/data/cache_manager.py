@@ -2,19 +2,103 @@
 Smart Cache Manager for multi-source data.
 
 Implements get-or-fetch pattern with freshness detection:
-1. Check if data exists in cache
-2. Check if cached data is fresh (based on source update frequency)
-3. Return cached data if fresh, otherwise fetch new data
-4. Save new data to cache and return
+1. Check the in-process memory tier (shared across sessions)
+2. Check if data exists in cache
+3. Check if cached data is fresh (based on source update frequency)
+4. Return cached data if fresh; if stale, ask the source whether anything
+   was released since (FRED / Stats Canada) and keep the cache if not
+5. Otherwise fetch new data, save it to cache and return
 
 Supports: FRED, yfinance, Stats Canada
 """
 
+import os
+import socket
+import threading
+import time
+import uuid
 import polars as pl
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from datetime import datetime, timedelta, date
-from typing import Callable, Optional, Literal
-from src.services.firebase_service import FirebaseService, DataSource
-from src.config.constants import get_freshness_threshold
+from typing import Callable, Dict, List, Optional, Literal, Tuple, Union
+from src.services.errors import DataNotFoundError
+from src.services.firebase_service import FirebaseService, DataSource, get_firebase_service
+from src.data.coverage import (
+    FULL_COVERAGE,
+    coverage_from_metadata,
+    coverage_to_metadata,
+    coverage_union,
+    covers,
+    format_coverage,
+    missing_ranges,
+    normalize_coverage
+)
+from src.data.memory_cache import MemoryFrameCache, get_memory_cache
+from src.data.metrics import get_cache_metrics
+from src.data.negative_cache import NegativeCache
+from src.data.projection import DateRange, apply_projection
+from src.data.release_calendar import ReleaseCalendar
+from src.data.single_flight import SingleFlight
+from src.data.versions import diff_frames
+from src.data.write_behind import WriteBehindQueue
+from src.config.constants import (
+    get_freshness_threshold,
+    RELEASE_CHECK_INTERVAL_HOURS,
+    REFRESH_LEASE_TTL_SECONDS,
+    REFRESH_LEASE_WAIT_SECONDS,
+    REFRESH_LEASE_POLL_SECONDS,
+    BATCH_LOAD_WORKERS,
+    SOURCE_FETCH_CONCURRENCY,
+    INCREMENTAL_OVERLAP_DAYS,
+    BACKGROUND_REFRESH_WORKERS,
+    WARMUP_REFRESH_AHEAD_FACTOR,
+    WARMUP_WORKERS,
+    WRITE_BEHIND_WORKERS,
+    WRITE_BEHIND_MAX_PENDING,
+    WRITE_BEHIND_MAX_RETRIES,
+    WRITE_BEHIND_RETRY_DELAY_SECONDS,
+    get_stale_grace_hours
+)
+from src.config.settings import get_cache_config
+
+@dataclass
+class FetchRequest:
+    """One dataset requested through CacheManager.get_or_fetch_many()."""
+
+    source: DataSource
+    source_id: str
+    fetch_fn: Callable[[], pl.DataFrame]
+    frequency: str
+    metadata_fn: Optional[Callable[[], dict]] = None
+    force_refresh: bool = False
+    key: Optional[str] = None  # Result key; defaults to source_id
+    delta_fetch_fn: Optional[Callable[[date], pl.DataFrame]] = None  # See get_or_fetch()
+    stale_while_revalidate: bool = True  # See get_or_fetch()
+    columns: Optional[List[str]] = None  # See get_or_fetch()
+    date_range: Optional[DateRange] = None  # See get_or_fetch()
+    range_fetch_fn: Optional[Callable[[Optional[date], Optional[date]], pl.DataFrame]] = None  # See get_or_fetch()
+    batch_fetch_fn: Optional[Callable[[List[str]], Dict[str, pl.DataFrame]]] = None  # See get_or_fetch_many()
+
+    @property
+    def result_key(self) -> str:
+        """Key under which this request's frame is returned."""
+        return self.key or self.source_id
+
+    @property
+    def needed_range(self) -> DateRange:
+        """Dates a cached copy must cover to serve this request (see coverage.py)."""
+        return normalize_coverage(self.date_range)
+
+    @property
+    def is_projected(self) -> bool:
+        """Whether only some columns or dates of the dataset were requested."""
+        return self.columns is not None or bool(self.date_range)
+
+    def project(self, data: pl.DataFrame) -> pl.DataFrame:
+        """Apply this request's column/date-range projection to a full frame."""
+        return apply_projection(data, self.columns, self.date_range)
+
 
 class CacheManager:
     """
@@ -23,9 +107,126 @@ class CacheManager:
     Uses Firebase service for storage and implements get-or-fetch pattern.
     """
 
-    def __init__(self):
-        """Initialize cache manager with Firebase service."""
-        self.firebase = FirebaseService()
+    def __init__(
+        self,
+        firebase: Optional[FirebaseService] = None,
+        release_calendar: Optional[ReleaseCalendar] = None,
+        memory_cache: Optional[MemoryFrameCache] = None
+    ):
+        """
+        Initialize cache manager with Firebase service and memory tier.
+
+        Args:
+            firebase: Service to use instead of the shared one built from settings
+                     (e.g. backed by LocalStorageBackend for benchmarks)
+            release_calendar: Release checks to use instead of the default
+                     (only used when release checks are enabled in settings)
+            memory_cache: Memory tier to use instead of the process-wide one
+        """
+        self.firebase = firebase or get_firebase_service()
+        cache_config = get_cache_config()
+
+        # Stale FRED/Stats Canada data is revalidated with a cheap release
+        # check before anything is refetched
+        self.release_calendar = None
+        if cache_config["release_checks"]:
+            self.release_calendar = release_calendar or ReleaseCalendar()
+
+        # Process-wide tier of decoded frames, shared by every page's CacheManager
+        self.memory_cache = memory_cache or get_memory_cache()
+
+        # Hit/miss counters and latency histograms (shared with FirebaseService)
+        self.metrics = get_cache_metrics()
+
+        # Datasets found not to exist upstream fail fast for a short while
+        self.negative_cache = NegativeCache(ttl_seconds=cache_config["negative_ttl_seconds"])
+
+        # One upstream fetch per dataset at a time within this process...
+        self._flights = SingleFlight()
+
+        # ...and optionally across replicas, via a lease in the metadata doc
+        self.use_refresh_lease = cache_config["refresh_lease"]
+        self._lease_owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+        # Caps concurrent upstream fetches per source in batched loads
+        self._source_semaphores = {
+            src: threading.BoundedSemaphore(limit)
+            for src, limit in SOURCE_FETCH_CONCURRENCY.items()
+        }
+
+        # Stale-while-revalidate refreshes, at most one queued per dataset
+        self._background_executor = ThreadPoolExecutor(
+            max_workers=BACKGROUND_REFRESH_WORKERS,
+            thread_name_prefix="cache-refresh"
+        )
+        self._background_lock = threading.Lock()
+        self._background_keys = set()
+
+        # Optional write-behind persistence of fetched data
+        self.write_queue = None
+        if cache_config["write_behind"]:
+            self.write_queue = WriteBehindQueue(
+                workers=WRITE_BEHIND_WORKERS,
+                max_pending=WRITE_BEHIND_MAX_PENDING,
+                max_retries=WRITE_BEHIND_MAX_RETRIES,
+                retry_delay_seconds=WRITE_BEHIND_RETRY_DELAY_SECONDS
+            )
+
+    @staticmethod
+    def _to_datetime(last_updated) -> Optional[datetime]:
+        """
+        Normalize a metadata timestamp to a naive local datetime.
+
+        Args:
+            last_updated: Firestore timestamp, date or datetime
+
+        Returns:
+            datetime, or None if no timestamp is available
+        """
+        # Handle Firestore timestamp
+        if hasattr(last_updated, 'timestamp'):
+            return datetime.fromtimestamp(last_updated.timestamp())
+        elif isinstance(last_updated, date) and not isinstance(last_updated, datetime):
+            # Convert date to datetime at midnight
+            return datetime(last_updated.year, last_updated.month, last_updated.day)
+        # Assume it's already a datetime (or missing)
+        return last_updated
+
+    def _release_checked(self, source: DataSource) -> bool:
+        """Whether stale data from a source is revalidated with a release check."""
+        return self.release_calendar is not None and source in RELEASE_CHECK_INTERVAL_HOURS
+
+    def _memory_expiry(
+        self,
+        source: DataSource,
+        frequency: str,
+        metadata: Optional[dict] = None
+    ) -> float:
+        """
+        Compute when a frame held in memory stops being fresh.
+
+        The memory tier never outlives the freshness threshold of the cached
+        data, so serving from memory gives the same answer as the metadata check.
+
+        Args:
+            source: Data source
+            frequency: Data frequency for freshness check
+            metadata: Metadata of the cached data (None for just-fetched data)
+
+        Returns:
+            Expiry as epoch seconds
+        """
+        threshold_seconds = get_freshness_threshold(
+            source, frequency, self._release_checked(source)
+        ) * 3600
+
+        last_updated_dt = None
+        if metadata:
+            last_updated_dt = self._to_datetime(metadata.get("last_updated"))
+
+        if last_updated_dt is None:
+            return time.time() + threshold_seconds
+        return last_updated_dt.timestamp() + threshold_seconds
 
     def _is_data_fresh(
         self,
@@ -45,27 +246,44 @@ class CacheManager:
         if not metadata or "last_updated" not in metadata:
             return False
 
-        last_updated = metadata["last_updated"]
-
-        # Handle Firestore timestamp
-        if hasattr(last_updated, 'timestamp'):
-            last_updated_dt = datetime.fromtimestamp(last_updated.timestamp())
-        elif isinstance(last_updated, date) and not isinstance(last_updated, datetime):
-            # Convert date to datetime at midnight
-            last_updated_dt = datetime(last_updated.year, last_updated.month, last_updated.day)
-        else:
-            # Assume it's already a datetime
-            last_updated_dt = last_updated
-
         # Get freshness threshold for this source and frequency
         source = metadata.get("source", "fred")
-        threshold_hours = get_freshness_threshold(source, frequency)
+        threshold_hours = get_freshness_threshold(source, frequency, self._release_checked(source))
 
-        # Calculate age of cached data
-        age = datetime.now() - last_updated_dt
-        age_hours = age.total_seconds() / 3600
+        return self._age_hours(metadata) < threshold_hours
+
+    def _age_hours(self, metadata: dict) -> float:
+        """Age of cached data in hours, from its last_updated timestamp."""
+        age = datetime.now() - self._to_datetime(metadata["last_updated"])
+        return age.total_seconds() / 3600
+
+    def _is_within_stale_grace(
+        self,
+        metadata: dict,
+        frequency: str
+    ) -> bool:
+        """
+        Check if stale cached data may still be served while it is refreshed.
+
+        Args:
+            metadata: Metadata from Firestore containing last_updated timestamp
+            frequency: Data frequency (e.g., "daily", "monthly", "1d")
+
+        Returns:
+            True if age is within freshness threshold + grace window (see
+            STALE_GRACE_FACTOR) and a cached file exists
+        """
+        if not metadata or "last_updated" not in metadata or not metadata.get("storage_path"):
+            return False
+
+        source = metadata.get("source", "fred")
+        release_checked = self._release_checked(source)
+        max_age_hours = (
+            get_freshness_threshold(source, frequency, release_checked)
+            + get_stale_grace_hours(source, frequency, release_checked)
+        )
 
-        return age_hours < threshold_hours
+        return self._age_hours(metadata) < max_age_hours
 
     def get_or_fetch(
         self,
@@ -74,11 +292,21 @@ class CacheManager:
         fetch_fn: Callable[[], pl.DataFrame],
         frequency: str,
         metadata_fn: Optional[Callable[[], dict]] = None,
-        force_refresh: bool = False
+        force_refresh: bool = False,
+        delta_fetch_fn: Optional[Callable[[date], pl.DataFrame]] = None,
+        stale_while_revalidate: bool = True,
+        columns: Optional[List[str]] = None,
+        date_range: Optional[DateRange] = None,
+        range_fetch_fn: Optional[Callable[[Optional[date], Optional[date]], pl.DataFrame]] = None
     ) -> pl.DataFrame:
         """
         Get data from cache or fetch if stale/missing.
 
+        The cache records which dates its copy covers. Requests for dates
+        outside that coverage are not served from cache: with range_fetch_fn
+        only the missing dates are fetched and merged in, otherwise fetch_fn
+        refetches full history.
+
         Args:
             source: Data source ("fred", "yfinance", "statscan")
             source_id: Source-specific identifier (series_id, ticker, product_id)
@@ -87,9 +315,27 @@ class CacheManager:
                       (e.g., "daily", "monthly", "1d", etc.)
             metadata_fn: Optional function to generate source-specific metadata
             force_refresh: If True, skip cache and always fetch fresh data
+            delta_fetch_fn: Optional function fetching only observations on or
+                      after a given date. When set, a stale cache is refreshed
+                      incrementally instead of re-downloading full history.
+                      Only use for series whose history is not retroactively
+                      adjusted (indices, yields).
+            stale_while_revalidate: If True, data that is stale but within the
+                      grace window is returned immediately and refreshed on a
+                      background thread; the next rerun picks up the new data.
+            columns: Optional columns to return. Cached Parquet is read with
+                      column projection, so unused columns are never decoded.
+            date_range: Optional inclusive (start, end) dates to return; either
+                      bound may be None. Cached Parquet is read with row-group
+                      pruning on the "date" column.
+            range_fetch_fn: Optional function fetching observations between
+                      two dates (inclusive; None = unbounded). When set, only
+                      date_range is fetched on a miss instead of full history,
+                      and a cache covering a narrower window is extended by
+                      fetching just the missing dates.
 
         Returns:
-            Polars DataFrame with data
+            Polars DataFrame with data (projected if columns/date_range given)
 
         Example:
             >>> cache = CacheManager()
@@ -106,26 +352,804 @@ class CacheManager:
             >>>     metadata_fn=get_metadata
             >>> )
         """
-        # Check if cache exists and is fresh (unless force refresh)
+        request = FetchRequest(
+            source=source,
+            source_id=source_id,
+            fetch_fn=fetch_fn,
+            frequency=frequency,
+            metadata_fn=metadata_fn,
+            force_refresh=force_refresh,
+            delta_fetch_fn=delta_fetch_fn,
+            stale_while_revalidate=stale_while_revalidate,
+            columns=columns,
+            date_range=date_range,
+            range_fetch_fn=range_fetch_fn
+        )
+        memory_key = (source, source_id)
+        metadata = None
+
+        # Check if cache exists, covers the dates and is fresh (unless force refresh)
         if not force_refresh:
-            metadata = self.firebase.get_metadata(source, source_id)
+            # Decoded frame already shared in this process
+            data = self.memory_cache.get(memory_key, request.needed_range)
+            if data is not None:
+                self._record_memory_hit(source)
+                return request.project(data)
+
+            # Recently found not to exist upstream (e.g. a mistyped ticker)
+            self._raise_if_known_missing(request)
 
-            if metadata and self._is_data_fresh(metadata, frequency):
-                # Cache is fresh, load and return
-                print(f"[OK] Using cached data for {source}:{source_id}")
-                data = self.firebase.load_data_complete(source, source_id)
+            # {} = read and not cached, so the fetch path doesn't read it again
+            metadata = self.firebase.get_metadata(source, source_id) or {}
+            covered = self._covers(metadata, request)
+
+            if metadata and covered and self._is_data_fresh(metadata, frequency):
+                # Cache is fresh, load and return (local disk first, then Cloud Storage)
+                data = self._load_fresh(request, metadata)
 
                 if data is not None:
+                    self.metrics.increment(source, "hit")
                     return data
                 else:
                     print(f"[WARN] Cached data missing, fetching fresh data")
 
-        # Cache is stale, missing, or force refresh requested
-        print(f"[FETCH] Fetching fresh data for {source}:{source_id}")
+            elif covered and stale_while_revalidate and self._is_within_stale_grace(metadata, frequency):
+                # Serve stale data now, refresh off the request path
+                data = self._load_stale_and_revalidate(request, metadata)
+                if data is not None:
+                    self.metrics.increment(source, "stale")
+                    return data
 
+        # Cache is stale, missing, too narrow, or force refresh requested.
+        # Concurrent callers for the same dataset share a single fetch.
+        self.metrics.increment(source, "miss")
         try:
-            # Fetch fresh data
-            data = fetch_fn()
+            return request.project(self._refresh_covering(request, metadata))
+        except Exception:
+            self.metrics.increment(source, "error")
+            raise
+
+    def get_or_fetch_many(
+        self,
+        requests: List[FetchRequest],
+        errors: Optional[Dict[str, Exception]] = None
+    ) -> Dict[str, pl.DataFrame]:
+        """
+        Get several datasets at once, with latency bounded by the slowest one.
+
+        1. Serve what is already in the memory tier
+        2. Resolve all remaining metadata in a single Firestore read
+        3. Load fresh datasets concurrently (local disk / Cloud Storage)
+        4. Fetch stale or missing datasets concurrently, capped per source
+
+        Requests sharing a batch_fetch_fn (the same callable object) are
+        fetched together in step 4: it is called once with the source_ids
+        that need fetching and returns {source_id: full-history frame}, e.g.
+        YFinanceService.get_many_histories. Each returned frame is then
+        cached per dataset as if its own fetch_fn had returned it; datasets
+        missing from the result (or a failed batch) use their fetch_fn.
+
+        Args:
+            requests: Datasets to load (see FetchRequest)
+            errors: Optional dictionary to collect failures in. When given,
+                   a dataset that cannot be loaded (not found upstream, or a
+                   fetch error with no stale fallback) is recorded here under
+                   its result key and left out of the result, and every other
+                   dataset is still returned. When None, the first failure is
+                   raised.
+
+        Returns:
+            Dictionary mapping each request's result key (source_id by default)
+            to its Polars DataFrame
+
+        Raises:
+            Exception: The first fetch error that had no stale cache fallback
+                      (only when errors is None)
+
+        Example:
+            >>> frames = cache.get_or_fetch_many([
+            >>>     FetchRequest("fred", "GDP", lambda: fred.get_series("GDP"), "quarterly"),
+            >>>     FetchRequest("fred", "UNRATE", lambda: fred.get_series("UNRATE"), "monthly"),
+            >>> ])
+            >>> gdp_df = frames["GDP"]
+            >>>
+            >>> failed = {}
+            >>> frames = cache.get_or_fetch_many(ticker_requests, errors=failed)
+        """
+        results: Dict[str, pl.DataFrame] = {}
+        pending: List[FetchRequest] = []
+
+        # 1. Memory tier (and datasets recently found not to exist)
+        for request in requests:
+            if not request.force_refresh:
+                data = self.memory_cache.get((request.source, request.source_id), request.needed_range)
+                if data is not None:
+                    self._record_memory_hit(request.source)
+                    results[request.result_key] = request.project(data)
+                    continue
+                try:
+                    self._raise_if_known_missing(request)
+                except DataNotFoundError as e:
+                    if errors is None:
+                        raise
+                    errors[request.result_key] = e
+                    continue
+            pending.append(request)
+
+        if not pending:
+            return results
+
+        # 2. One multi-document metadata read
+        metadata_by_key = self.firebase.get_metadata_many([
+            (r.source, r.source_id) for r in pending if not r.force_refresh
+        ])
+
+        with ThreadPoolExecutor(max_workers=BATCH_LOAD_WORKERS) as executor:
+            load_futures = {}
+            fetch_futures = {}
+            misses = []
+
+            for request in pending:
+                metadata = metadata_by_key.get((request.source, request.source_id)) or {}
+                covered = self._covers(metadata, request)
+                if metadata and covered and self._is_data_fresh(metadata, request.frequency):
+                    # 3. Concurrent loads of fresh cached data
+                    load_futures[request.result_key] = (
+                        request,
+                        "hit",
+                        executor.submit(self._load_fresh, request, metadata)
+                    )
+                elif (
+                    covered
+                    and request.stale_while_revalidate
+                    and self._is_within_stale_grace(metadata, request.frequency)
+                ):
+                    # 3b. Stale but within grace: load now, refresh in background
+                    load_futures[request.result_key] = (
+                        request,
+                        "stale",
+                        executor.submit(self._load_stale_and_revalidate, request, metadata)
+                    )
+                else:
+                    self.metrics.increment(request.source, "miss")
+                    misses.append((request, metadata))
+
+            # 4. Concurrent fetches of stale/missing/too narrow data (batched
+            # upstream requests run here, while cached loads proceed)
+            for request, metadata in self._prefetch_batches(misses):
+                fetch_futures[request.result_key] = (
+                    request,
+                    executor.submit(self._fetch_limited, request, metadata)
+                )
+
+            for result_key, (request, outcome, future) in load_futures.items():
+                data = future.result()
+                if data is not None:
+                    self.metrics.increment(request.source, outcome)
+                    results[result_key] = data
+                else:
+                    print(f"[WARN] Cached data missing for {request.source}:{request.source_id}, fetching fresh data")
+                    self.metrics.increment(request.source, "miss")
+                    fetch_futures[result_key] = (
+                        request,
+                        executor.submit(
+                            self._fetch_limited,
+                            request,
+                            metadata_by_key.get((request.source, request.source_id)) or {}
+                        )
+                    )
+
+            for result_key, (request, future) in fetch_futures.items():
+                try:
+                    results[result_key] = future.result()
+                except Exception as e:
+                    self.metrics.increment(request.source, "error")
+                    if errors is None:
+                        raise
+                    errors[result_key] = e
+                    print(f"[WARN] Skipping {request.source}:{request.source_id} in batch: {str(e)}")
+
+        return results
+
+    def _prefetch_batches(
+        self,
+        misses: List[Tuple[FetchRequest, Optional[dict]]]
+    ) -> List[Tuple[FetchRequest, Optional[dict]]]:
+        """
+        Run each batch_fetch_fn once for the requests that need fetching.
+
+        Args:
+            misses: (request, metadata) pairs about to be fetched
+
+        Returns:
+            The same pairs, with batched requests replaced by requests whose
+            fetch_fn returns the prefetched frame
+        """
+        groups: Dict[Callable, List[int]] = {}
+        for index, (request, _) in enumerate(misses):
+            if request.batch_fetch_fn is not None:
+                groups.setdefault(request.batch_fetch_fn, []).append(index)
+
+        if not groups:
+            return misses
+
+        misses = list(misses)
+        for batch_fetch_fn, indices in groups.items():
+            source = misses[indices[0]][0].source
+            source_ids = list(dict.fromkeys(misses[i][0].source_id for i in indices))
+
+            start_time = time.perf_counter()
+            try:
+                frames = batch_fetch_fn(source_ids)
+            except Exception as e:
+                print(f"[WARN] Batch fetch of {len(source_ids)} {source} datasets failed, "
+                      f"fetching individually: {str(e)}")
+                continue
+            self.metrics.observe("batch_fetch", source, time.perf_counter() - start_time)
+            print(f"[FETCH] Batch-fetched {len(frames)}/{len(source_ids)} {source} datasets")
+
+            for index in indices:
+                request, metadata = misses[index]
+                data = frames.get(request.source_id)
+                if data is None or data.is_empty():
+                    continue
+                # The batch already fetched full history: no delta/range fetch
+                misses[index] = (
+                    replace(
+                        request,
+                        fetch_fn=lambda data=data: data,
+                        delta_fetch_fn=None,
+                        range_fetch_fn=None,
+                        batch_fetch_fn=None
+                    ),
+                    metadata
+                )
+
+        return misses
+
+    def _is_due_for_warmup(
+        self,
+        metadata: Optional[dict],
+        frequency: str
+    ) -> bool:
+        """
+        Check if a dataset should be refreshed by the warm-up job.
+
+        Args:
+            metadata: Metadata of the cached data (None if not cached)
+            frequency: Data frequency for freshness check
+
+        Returns:
+            True if not cached, or older than WARMUP_REFRESH_AHEAD_FACTOR of
+            its freshness threshold
+        """
+        if not metadata or "last_updated" not in metadata or not metadata.get("storage_path"):
+            return True
+
+        source = metadata.get("source", "fred")
+        refresh_after_hours = (
+            get_freshness_threshold(source, frequency, self._release_checked(source))
+            * WARMUP_REFRESH_AHEAD_FACTOR
+        )
+
+        return self._age_hours(metadata) >= refresh_after_hours
+
+    def warm(
+        self,
+        requests: List[FetchRequest],
+        force: bool = False
+    ) -> List[dict]:
+        """
+        Refresh every dataset that is missing or close to expiry.
+
+        Meant for a scheduled job (see src/data/warmup.py), so user sessions
+        find fresh cache instead of paying for the fetch. Metadata is read in
+        one Firestore round trip, then due datasets are refreshed concurrently,
+        capped per source (SOURCE_FETCH_CONCURRENCY).
+
+        Args:
+            requests: Datasets to keep warm (see FetchRequest)
+            force: If True, refresh every dataset regardless of age
+
+        Returns:
+            One result per request, in order, with source, source_id, status
+            ("fresh", "refreshed" or "error"), seconds, rows and error
+        """
+        metadata_by_key = self.firebase.get_metadata_many([
+            (r.source, r.source_id) for r in requests
+        ])
+
+        def _warm_one(request: FetchRequest) -> dict:
+            key = (request.source, request.source_id)
+            metadata = metadata_by_key.get(key)
+            result = {
+                "source": request.source,
+                "source_id": request.source_id,
+                "status": "fresh",
+                "seconds": 0.0,
+                "rows": metadata.get("row_count", 0) if metadata else 0,
+                "error": None
+            }
+
+            if not force and not self._is_due_for_warmup(metadata, request.frequency):
+                return result
+
+            start_time = time.perf_counter()
+            try:
+                with self._source_semaphores[request.source]:
+                    data, _ = self._flights.do(
+                        key,
+                        lambda: self._refresh(request, metadata or {}, check_memory=False)
+                    )
+                result["status"] = "refreshed"
+                result["rows"] = len(data)
+            except Exception as e:
+                result["status"] = "error"
+                result["error"] = str(e)
+            result["seconds"] = round(time.perf_counter() - start_time, 3)
+            return result
+
+        with ThreadPoolExecutor(max_workers=WARMUP_WORKERS, thread_name_prefix="cache-warm") as executor:
+            return list(executor.map(_warm_one, requests))
+
+    def _load_fresh(
+        self,
+        request: FetchRequest,
+        metadata: dict
+    ) -> Optional[pl.DataFrame]:
+        """
+        Load a fresh cached dataset and share it through the memory tier.
+
+        Projected loads read only the requested columns/rows and are not put
+        in the memory tier, which holds complete frames only.
+        """
+        print(f"[OK] Using cached data for {request.source}:{request.source_id}")
+        data = self.firebase.load_data_complete(
+            request.source,
+            request.source_id,
+            metadata=metadata,
+            columns=request.columns,
+            date_range=request.date_range
+        )
+        if data is not None and not request.is_projected:
+            self.memory_cache.put(
+                (request.source, request.source_id),
+                data,
+                self._memory_expiry(request.source, request.frequency, metadata),
+                coverage_from_metadata(metadata)
+            )
+        return data
+
+    def _load_stale_and_revalidate(
+        self,
+        request: FetchRequest,
+        metadata: dict
+    ) -> Optional[pl.DataFrame]:
+        """Load stale cached data and schedule a background refresh for it."""
+        data = self.firebase.load_data_complete(
+            request.source,
+            request.source_id,
+            metadata=metadata,
+            columns=request.columns,
+            date_range=request.date_range
+        )
+        if data is not None:
+            print(f"[STALE] Serving stale data for {request.source}:{request.source_id}, refreshing in background")
+            self._schedule_refresh(request, metadata)
+        return data
+
+    def _schedule_refresh(
+        self,
+        request: FetchRequest,
+        metadata: Optional[dict]
+    ) -> None:
+        """
+        Queue a background refresh unless one is already queued or running.
+
+        Args:
+            request: Dataset to refresh
+            metadata: Metadata of the cached data
+        """
+        key = (request.source, request.source_id)
+
+        with self._background_lock:
+            if key in self._background_keys or self._flights.is_inflight(key):
+                return
+            self._background_keys.add(key)
+
+        def _run() -> None:
+            try:
+                self._flights.do(key, lambda: self._refresh(request, metadata))
+            except Exception as e:
+                print(f"[ERROR] Background refresh failed for {request.source}:{request.source_id}: {str(e)}")
+            finally:
+                with self._background_lock:
+                    self._background_keys.discard(key)
+
+        self._background_executor.submit(_run)
+
+    def _fetch_limited(
+        self,
+        request: FetchRequest,
+        metadata: Optional[dict]
+    ) -> pl.DataFrame:
+        """Refresh a dataset through single-flight, under its source's concurrency cap."""
+        with self._source_semaphores[request.source]:
+            data = self._refresh_covering(request, metadata)
+        return request.project(data)
+
+    def _record_memory_hit(self, source: DataSource) -> None:
+        """Count a request served from the memory tier."""
+        self.metrics.increment(source, "hit")
+        self.metrics.record_tier(source, "memory")
+
+    def _raise_if_known_missing(self, request: FetchRequest) -> None:
+        """
+        Fail fast for a dataset recently found not to exist upstream.
+
+        Args:
+            request: Dataset being requested
+
+        Raises:
+            DataNotFoundError: If the dataset is in the negative cache
+        """
+        message = self.negative_cache.get((request.source, request.source_id))
+        if message is not None:
+            self.metrics.increment(request.source, "not_found")
+            print(f"[MISSING] {request.source}:{request.source_id} recently not found, skipping fetch")
+            raise DataNotFoundError(message)
+
+    @staticmethod
+    def _covers(metadata: Optional[dict], request: FetchRequest) -> bool:
+        """Whether the cached copy described by metadata covers a request's dates."""
+        return covers(coverage_from_metadata(metadata), request.needed_range)
+
+    def _refresh_covering(
+        self,
+        request: FetchRequest,
+        metadata: Optional[dict]
+    ) -> pl.DataFrame:
+        """
+        Refresh a dataset through single-flight, returning data that covers the request.
+
+        A caller that joined a flight started for a narrower window runs one
+        more flight, which extends the coverage the first one stored.
+
+        Args:
+            request: Dataset being refreshed
+            metadata: Metadata read by the caller (None if not read)
+
+        Returns:
+            Complete (unprojected) Polars DataFrame
+        """
+        key = (request.source, request.source_id)
+        data, coverage = self._flights.do(key, lambda: self._refresh(request, metadata))
+
+        if not covers(coverage, request.needed_range):
+            data, coverage = self._flights.do(key, lambda: self._refresh(request, None))
+
+        return data
+
+    def _refresh(
+        self,
+        request: FetchRequest,
+        metadata: Optional[dict],
+        check_memory: bool = True
+    ) -> Tuple[pl.DataFrame, DateRange]:
+        """
+        Refresh a dataset as the single-flight leader for its key.
+
+        When the refresh lease is enabled, only the replica holding the lease
+        fetches from upstream; the others serve their current cache or wait
+        for the holder's result.
+
+        Always returns the complete dataset, since the result is shared with
+        every caller in the flight; callers apply their own projection.
+
+        Args:
+            request: Dataset being refreshed
+            metadata: Metadata read by the caller (None if not read)
+            check_memory: If False, refetch even if the memory tier still
+                      holds the dataset (used by warm(), which refreshes
+                      ahead of expiry)
+
+        Returns:
+            Tuple of (Polars DataFrame with data, its date coverage)
+        """
+        source, source_id = request.source, request.source_id
+
+        # A flight that finished just before this one may already have the data
+        if check_memory and not request.force_refresh:
+            data = self.memory_cache.get((source, source_id), request.needed_range)
+            if data is not None:
+                return data, request.needed_range
+
+        lease_held = False
+        if self.use_refresh_lease:
+            lease_held = self.firebase.acquire_refresh_lease(
+                source, source_id, self._lease_owner, REFRESH_LEASE_TTL_SECONDS
+            )
+            if not lease_held:
+                result = self._wait_for_remote_refresh(request, metadata)
+                if result is not None:
+                    return result
+
+        try:
+            return self._fetch_and_store(request, metadata)
+        finally:
+            if lease_held:
+                self.firebase.release_refresh_lease(source, source_id, self._lease_owner)
+
+    def _wait_for_remote_refresh(
+        self,
+        request: FetchRequest,
+        metadata: Optional[dict]
+    ) -> Optional[Tuple[pl.DataFrame, DateRange]]:
+        """
+        Get data while another replica holds the refresh lease.
+
+        Serves the current (stale) cache immediately when allowed and it
+        covers the request; otherwise polls metadata until the lease holder
+        publishes a new version.
+
+        Args:
+            request: Dataset being refreshed
+            metadata: Metadata read by the caller (None if not read)
+
+        Returns:
+            Tuple of (Polars DataFrame, its date coverage), or None if the
+            caller should fetch itself
+        """
+        source, source_id = request.source, request.source_id
+
+        if (
+            not request.force_refresh
+            and metadata
+            and metadata.get("storage_path")
+            and self._covers(metadata, request)
+        ):
+            data = self.firebase.load_data_complete(source, source_id, metadata=metadata)
+            if data is not None:
+                print(f"[WAIT] Another replica is refreshing {source}:{source_id}, serving current cache")
+                return data, coverage_from_metadata(metadata)
+
+        previous_generation = (
+            self.firebase.get_storage_generation(metadata)
+            if metadata and metadata.get("storage_path") else None
+        )
+        print(f"[WAIT] Waiting for another replica to refresh {source}:{source_id}")
+
+        deadline = time.time() + REFRESH_LEASE_WAIT_SECONDS
+        while time.time() < deadline:
+            time.sleep(REFRESH_LEASE_POLL_SECONDS)
+
+            latest = self.firebase.get_metadata(source, source_id)
+            if not latest:
+                break
+
+            if (
+                latest.get("storage_path")
+                and self.firebase.get_storage_generation(latest) != previous_generation
+            ):
+                data = self.firebase.load_data_complete(source, source_id, metadata=latest)
+                if data is not None:
+                    coverage = coverage_from_metadata(latest)
+                    self.memory_cache.put(
+                        (source, source_id),
+                        data,
+                        self._memory_expiry(source, request.frequency, latest),
+                        coverage
+                    )
+                    return data, coverage
+
+            if not latest.get("refresh_lease"):
+                # Holder released without publishing (its fetch failed)
+                break
+
+        return None
+
+    def _fetch_delta(
+        self,
+        request: FetchRequest,
+        metadata: Optional[dict]
+    ) -> Optional[Tuple[pl.DataFrame, date]]:
+        """
+        Refresh a cached series by fetching only observations after its last date.
+
+        Re-fetches a small overlap window (INCREMENTAL_OVERLAP_DAYS) so recent
+        revisions replace the cached values, then merges and dedupes on date.
+
+        Args:
+            request: Dataset being refreshed (must have delta_fetch_fn)
+            metadata: Metadata of the cached data
+
+        Returns:
+            Tuple of (merged DataFrame, first date that may have changed), or
+            None if an incremental refresh is not possible (no usable cached
+            copy, schema change, or delta fetch error)
+        """
+        if not metadata or not metadata.get("storage_path"):
+            return None
+
+        cached = self.firebase.load_data_complete(request.source, request.source_id, metadata=metadata)
+        if cached is None or cached.is_empty() or "date" not in cached.columns:
+            return None
+
+        last_date = cached["date"].max()
+        if not isinstance(last_date, date):
+            return None
+
+        overlap_days = INCREMENTAL_OVERLAP_DAYS.get(request.frequency, INCREMENTAL_OVERLAP_DAYS["daily"])
+        since = last_date - timedelta(days=overlap_days)
+
+        try:
+            delta = request.delta_fetch_fn(since)
+        except Exception as e:
+            print(f"[WARN] Incremental fetch failed for {request.source}:{request.source_id}, "
+                  f"falling back to full fetch: {str(e)}")
+            return None
+
+        if delta is None or delta.is_empty():
+            return cached, since
+
+        if set(delta.columns) != set(cached.columns):
+            print(f"[WARN] Schema changed for {request.source}:{request.source_id}, falling back to full fetch")
+            return None
+
+        print(f"[DELTA] Merging {len(delta)} new rows since {since} for {request.source}:{request.source_id}")
+
+        delta = delta.select(cached.columns).with_columns(pl.col("date").cast(cached.schema["date"]))
+        merged = (
+            pl.concat([cached.filter(pl.col("date") < since), delta], how="vertical_relaxed")
+            .unique(subset="date", keep="last", maintain_order=True)
+            .sort("date")
+        )
+        return merged, since
+
+    def _fetch_missing(
+        self,
+        request: FetchRequest,
+        metadata: dict,
+        cached_coverage: DateRange
+    ) -> Optional[Tuple[pl.DataFrame, Optional[date], DateRange]]:
+        """
+        Extend a cached dataset to a wider date range by fetching only the missing dates.
+
+        Args:
+            request: Dataset being extended (must have range_fetch_fn)
+            metadata: Metadata of the cached data
+            cached_coverage: Coverage of the cached data
+
+        Returns:
+            Tuple of (merged DataFrame, first date that may have changed or
+            None if dates were added before the cached ones, new coverage),
+            or None if the cache cannot be extended (no usable cached copy,
+            schema change, or fetch error)
+        """
+        source, source_id = request.source, request.source_id
+
+        cached = self.firebase.load_data_complete(source, source_id, metadata=metadata)
+        if cached is None or "date" not in cached.columns:
+            return None
+
+        missing = missing_ranges(cached_coverage, request.needed_range)
+        pieces = []
+        for start, end in missing:
+            try:
+                piece = request.range_fetch_fn(start, end)
+            except Exception as e:
+                print(f"[WARN] Range fetch failed for {source}:{source_id}, "
+                      f"falling back to full fetch: {str(e)}")
+                return None
+
+            if piece is None or piece.is_empty():
+                continue
+            if set(piece.columns) != set(cached.columns):
+                print(f"[WARN] Schema changed for {source}:{source_id}, falling back to full fetch")
+                return None
+            pieces.append(piece.select(cached.columns).with_columns(pl.col("date").cast(cached.schema["date"])))
+
+        coverage = coverage_union(cached_coverage, request.needed_range)
+        print(f"[EXTEND] Merging {sum(len(p) for p in pieces)} rows to extend "
+              f"{source}:{source_id} to {format_coverage(coverage)}")
+
+        merged = (
+            pl.concat([cached] + pieces, how="vertical_relaxed")
+            .unique(subset="date", keep="last", maintain_order=True)
+            .sort("date")
+        )
+
+        # Dates added before the cached ones change every earlier partition
+        first_missing_end = missing[0][1]
+        if (
+            cached_coverage[0] is not None
+            and first_missing_end is not None
+            and first_missing_end < cached_coverage[0]
+        ):
+            changed_since = None
+        else:
+            changed_since = missing[0][0]
+
+        return merged, changed_since, coverage
+
+    def _fetch_and_store(
+        self,
+        request: FetchRequest,
+        metadata: Optional[dict]
+    ) -> Tuple[pl.DataFrame, DateRange]:
+        """
+        Fetch fresh data, save it to the cache, and fall back to stale data on error.
+
+        A fresh cache that is too narrow for the request is extended with
+        just the missing dates; a stale one is refreshed over its whole
+        coverage plus the requested dates.
+
+        Args:
+            request: Dataset being refreshed
+            metadata: Metadata read by the caller (None if not read)
+
+        Returns:
+            Tuple of (Polars DataFrame with data, its date coverage)
+        """
+        source, source_id, frequency = request.source, request.source_id, request.frequency
+        needed = request.needed_range
+
+        if metadata is None and not request.force_refresh:
+            metadata = self.firebase.get_metadata(source, source_id)
+
+        cached_coverage = None
+        if not request.force_refresh and metadata and metadata.get("storage_path"):
+            cached_coverage = coverage_from_metadata(metadata)
+        covered = cached_coverage is not None and covers(cached_coverage, needed)
+
+        # Nothing released since the data was cached: keep it, skip the fetch
+        if covered:
+            data = self._revalidate(request, metadata)
+            if data is not None:
+                return data, cached_coverage
+
+        try:
+            data = None
+            changed_since = None
+            refresh_mode = "full"
+            coverage = FULL_COVERAGE
+            fetch_start = time.perf_counter()
+
+            # Fresh but too narrow: only fetch the dates that are missing
+            if (
+                cached_coverage is not None
+                and not covered
+                and request.range_fetch_fn
+                and self._is_data_fresh(metadata, frequency)
+            ):
+                extend_result = self._fetch_missing(request, metadata, cached_coverage)
+                if extend_result is not None:
+                    data, changed_since, coverage = extend_result
+                    refresh_mode = "extend"
+
+            # Incremental refresh: only fetch what is newer than the cached copy
+            if data is None and covered and request.delta_fetch_fn:
+                delta_result = self._fetch_delta(request, metadata)
+                if delta_result is not None:
+                    data, changed_since = delta_result
+                    coverage = (cached_coverage[0], None)
+                    refresh_mode = "incremental"
+
+            if data is None and request.range_fetch_fn:
+                # Everything already cached plus what this request needs
+                coverage = needed
+                if cached_coverage is not None:
+                    coverage = coverage_union(cached_coverage, needed)
+                print(f"[FETCH] Fetching {format_coverage(coverage)} for {source}:{source_id}")
+                data = request.range_fetch_fn(*coverage)
+
+            elif data is None:
+                print(f"[FETCH] Fetching fresh data for {source}:{source_id}")
+
+                # Fetch fresh data
+                data = request.fetch_fn()
+
+            self.metrics.observe("fetch", source, time.perf_counter() - fetch_start)
 
             if data is None or len(data) == 0:
                 raise ValueError(f"Fetch function returned no data for {source}:{source_id}")
@@ -133,45 +1157,159 @@ class CacheManager:
             # Prepare metadata
             base_metadata = {
                 "frequency": frequency,
-                "data_fetched_at": datetime.now().isoformat()
+                "data_fetched_at": datetime.now().isoformat(),
+                "refresh_mode": refresh_mode
             }
 
             # Add source-specific metadata if provided
-            if metadata_fn:
-                additional_metadata = metadata_fn()
+            if request.metadata_fn:
+                additional_metadata = request.metadata_fn()
                 base_metadata.update(additional_metadata)
 
-            # Save to cache
-            result = self.firebase.save_data_complete(
-                source=source,
-                source_id=source_id,
-                data=data,
-                metadata=base_metadata
-            )
+            base_metadata.update(coverage_to_metadata(coverage))
 
-            if result["status"] == "success":
-                print(f"[OK] Cached fresh data for {source}:{source_id}")
+            self.negative_cache.discard((source, source_id))
+            self.memory_cache.put((source, source_id), data, self._memory_expiry(source, frequency), coverage)
+
+            if self.write_queue is not None:
+                # Return now; persist in the background. Metadata is re-read at
+                # write time since earlier queued writes for this key may change it.
+                def _write() -> None:
+                    self._persist(
+                        source, source_id, data, base_metadata,
+                        previous_metadata=None,
+                        changed_since=changed_since,
+                        raise_on_error=True
+                    )
+
+                self.write_queue.submit((source, source_id), _write, description=f"{source}:{source_id}")
+                print(f"[QUEUED] Persisting {source}:{source_id} in the background")
             else:
-                print(f"[WARN] Failed to cache data: {result.get('error')}")
+                self._persist(source, source_id, data, base_metadata, metadata, changed_since)
 
-            return data
+            return data, coverage
 
         except Exception as e:
             print(f"[ERROR] Error fetching data for {source}:{source_id}: {str(e)}")
+            self.metrics.increment(source, "fetch_error")
 
             # Try to return stale cache as fallback
-            if not force_refresh:
-                metadata = self.firebase.get_metadata(source, source_id)
-                if metadata:
-                    print(f"  Attempting to use stale cache as fallback")
-                    stale_data = self.firebase.load_data_complete(source, source_id)
-                    if stale_data is not None:
-                        print(f"  [WARN] Using stale data from cache")
-                        return stale_data
+            if not request.force_refresh and metadata:
+                print(f"  Attempting to use stale cache as fallback")
+                stale_data = self.firebase.load_data_complete(source, source_id, metadata=metadata)
+                if stale_data is not None:
+                    print(f"  [WARN] Using stale data from cache")
+                    self.metrics.increment(source, "stale_fallback")
+                    return stale_data, coverage_from_metadata(metadata)
+
+            # Nothing cached and nothing upstream: remember it briefly
+            if isinstance(e, DataNotFoundError):
+                self.negative_cache.put((source, source_id), str(e))
 
             # No cache available, re-raise exception
             raise
 
+    def _revalidate(
+        self,
+        request: FetchRequest,
+        metadata: Optional[dict]
+    ) -> Optional[pl.DataFrame]:
+        """
+        Keep stale cached data if the source has released nothing since.
+
+        On an unchanged answer only last_updated is bumped, which restarts the
+        freshness window without an upstream fetch or upload.
+
+        Args:
+            request: Dataset being refreshed
+            metadata: Metadata of the cached data
+
+        Returns:
+            The cached DataFrame, or None if it must be refetched (changed,
+            unknown, not release-checked, or no usable cached copy)
+        """
+        source, source_id = request.source, request.source_id
+
+        if not self._release_checked(source) or not metadata or not metadata.get("storage_path"):
+            return None
+
+        if self.release_calendar.has_changed(source, source_id, metadata) is not False:
+            return None
+
+        data = self.firebase.load_data_complete(source, source_id, metadata=metadata)
+        if data is None:
+            return None
+
+        try:
+            self.firebase.touch_metadata(source, source_id)
+        except Exception as e:
+            print(f"[WARN] Failed to mark {source}:{source_id} as revalidated: {str(e)}")
+
+        print(f"[OK] No new release for {source}:{source_id}, keeping cached data")
+        self.metrics.increment(source, "revalidated")
+        self.memory_cache.put(
+            (source, source_id),
+            data,
+            self._memory_expiry(source, request.frequency),
+            coverage_from_metadata(metadata)
+        )
+        return data
+
+    def _persist(
+        self,
+        source: DataSource,
+        source_id: str,
+        data: pl.DataFrame,
+        metadata: dict,
+        previous_metadata: Optional[dict],
+        changed_since: Optional[date],
+        raise_on_error: bool = False
+    ) -> None:
+        """
+        Save fetched data to the cache (storage, metadata, cleanup and log).
+
+        Args:
+            source: Data source
+            source_id: Source-specific identifier
+            data: Fetched DataFrame
+            metadata: Metadata to store with the data
+            previous_metadata: Metadata of the version being replaced (None = read it)
+            changed_since: Earliest date that may differ from the previous version
+            raise_on_error: Raise instead of warning on failure (lets the
+                      write-behind queue retry)
+        """
+        result = self.firebase.save_data_complete(
+            source=source,
+            source_id=source_id,
+            data=data,
+            metadata=dict(metadata),
+            previous_metadata=previous_metadata,
+            changed_since=changed_since
+        )
+
+        if result["status"] == "success" and result.get("unchanged"):
+            print(f"[OK] Data unchanged for {source}:{source_id}, refreshed timestamp only")
+        elif result["status"] == "success":
+            print(f"[OK] Cached fresh data for {source}:{source_id}")
+        elif raise_on_error:
+            raise RuntimeError(f"Failed to cache data: {result.get('error')}")
+        else:
+            print(f"[WARN] Failed to cache data: {result.get('error')}")
+
+    def flush_writes(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for background (write-behind) persistence to finish.
+
+        Args:
+            timeout: Max seconds to wait (None = no limit)
+
+        Returns:
+            True if no writes are pending
+        """
+        if self.write_queue is None:
+            return True
+        return self.write_queue.flush(timeout)
+
     def invalidate(
         self,
         source: DataSource,
@@ -187,14 +1325,21 @@ class CacheManager:
         Returns:
             True if deleted, False if not found
         """
+        # Let queued writes land first so they cannot recreate the data afterwards
+        self.flush_writes()
+        self.memory_cache.invalidate((source, source_id))
+        self.negative_cache.discard((source, source_id))
+
         if self.firebase.check_data_exists(source, source_id):
             metadata = self.firebase.get_metadata(source, source_id)
-            if metadata and "storage_path" in metadata:
-                # Delete data file
-                self.firebase.delete_data_from_storage(metadata["storage_path"])
+            if metadata:
+                # Delete data file(s), one per partition for partitioned data
+                for storage_path in self.firebase.get_storage_paths(metadata):
+                    self.firebase.delete_data_from_storage(storage_path)
 
-            # Delete metadata
-            self.firebase.delete_metadata(source, source_id)
+            # Delete metadata (updating the cache stats) and any local copies
+            self.firebase.delete_metadata(source, source_id, metadata)
+            self.firebase.local_cache.invalidate(source, source_id)
 
             print(f"[OK] Invalidated cache for {source}:{source_id}")
             return True
@@ -202,6 +1347,85 @@ class CacheManager:
             print(f"[WARN] No cache found for {source}:{source_id}")
             return False
 
+    def list_versions(
+        self,
+        source: DataSource,
+        source_id: str
+    ) -> List[dict]:
+        """
+        List the retained versions of a cached dataset, newest first.
+
+        Args:
+            source: Data source
+            source_id: Source-specific identifier
+
+        Returns:
+            Version dictionaries (see FirebaseService.list_versions)
+        """
+        return self.firebase.list_versions(source, source_id)
+
+    def load_version(
+        self,
+        source: DataSource,
+        source_id: str,
+        version: Union[str, datetime],
+        columns: Optional[List[str]] = None,
+        date_range: Optional[DateRange] = None
+    ) -> Optional[pl.DataFrame]:
+        """
+        Load a retained version of a dataset, without fetching from upstream.
+
+        Args:
+            source: Data source
+            source_id: Source-specific identifier
+            version: Generation from list_versions(), or a timestamp (datetime,
+                    date or ISO string) to read the data as it was cached then
+            columns: Optional columns to return
+            date_range: Optional inclusive (start, end) dates to return
+
+        Returns:
+            Polars DataFrame or None if no retained version matches
+
+        Example:
+            >>> gdp_then = cache.load_version("fred", "GDPC1", "2024-06-30")
+        """
+        return self.firebase.load_version(source, source_id, version, columns, date_range)
+
+    def diff_versions(
+        self,
+        source: DataSource,
+        source_id: str,
+        old_version: Union[str, datetime],
+        new_version: Union[str, datetime] = "latest",
+        key: str = "date"
+    ) -> pl.DataFrame:
+        """
+        Get the rows that changed between two retained versions of a dataset.
+
+        Args:
+            source: Data source
+            source_id: Source-specific identifier
+            old_version: Earlier version (generation or timestamp)
+            new_version: Later version (default: the newest retained version)
+            key: Column identifying a row
+
+        Returns:
+            Changed rows with a "status" column (see versions.diff_frames)
+
+        Raises:
+            ValueError: If either version is not retained
+
+        Example:
+            >>> revisions = cache.diff_versions("fred", "PAYEMS", "2024-09-01")
+        """
+        old = self.firebase.load_version(source, source_id, old_version)
+        new = self.firebase.load_version(source, source_id, new_version)
+        if old is None or new is None:
+            missing = old_version if old is None else new_version
+            raise ValueError(f"No retained version of {source}:{source_id} matches {missing}")
+
+        return diff_frames(old, new, key)
+
     def get_cache_info(
         self,
         source: DataSource,
@@ -218,19 +1442,21 @@ class CacheManager:
             Dictionary with cache info or None if not cached
         """
         metadata = self.firebase.get_metadata(source, source_id)
+        return self._cache_info(source, source_id, metadata)
 
-        if not metadata:
+    def _cache_info(
+        self,
+        source: DataSource,
+        source_id: str,
+        metadata: Optional[dict]
+    ) -> Optional[dict]:
+        """Build the cache info dictionary from a metadata doc (None if not cached)."""
+        # Documents holding only a refresh lease have no cached data yet
+        if not metadata or "last_updated" not in metadata:
             return None
 
         # Calculate age
-        last_updated = metadata.get("last_updated")
-        if hasattr(last_updated, 'timestamp'):
-            last_updated_dt = datetime.fromtimestamp(last_updated.timestamp())
-        elif isinstance(last_updated, date) and not isinstance(last_updated, datetime):
-            # Convert date to datetime at midnight
-            last_updated_dt = datetime(last_updated.year, last_updated.month, last_updated.day)
-        else:
-            last_updated_dt = last_updated
+        last_updated_dt = self._to_datetime(metadata.get("last_updated"))
 
         age = datetime.now() - last_updated_dt
         age_hours = age.total_seconds() / 3600
@@ -256,6 +1482,8 @@ class CacheManager:
         """
         Get cache information for all datasets.
 
+        Built from a single metadata stream per source (no per-dataset reads).
+
         Args:
             source: Optional filter by data source
 
@@ -270,7 +1498,7 @@ class CacheManager:
             src_id = metadata.get("source_id")
 
             if src and src_id:
-                info = self.get_cache_info(src, src_id)
+                info = self._cache_info(src, src_id, metadata)
                 if info:
                     cache_info_list.append(info)
 
@@ -291,6 +1519,40 @@ class CacheManager:
         """
         return self.firebase.get_cache_stats(source)
 
+    def get_tier_stats(self) -> dict:
+        """
+        Get usage statistics for the in-process and local disk tiers.
+
+        Returns:
+            Dictionary with "memory", "local", "negative" and "write_behind"
+            statistics ("write_behind" is None when write-behind mode is off)
+        """
+        return {
+            "memory": self.memory_cache.get_stats(),
+            "local": self.firebase.local_cache.get_stats(),
+            "negative": self.negative_cache.get_stats(),
+            "write_behind": self.write_queue.get_stats() if self.write_queue else None
+        }
+
+    def get_metrics(self) -> dict:
+        """
+        Get request outcomes, tier usage, latencies and bytes transferred.
+
+        Counters are per source: request outcomes ("hit", "stale", "miss",
+        "not_found", "error", plus "hit_rate") and upstream fetch events
+        ("fetch_error", "stale_fallback", "revalidated"). Latency histograms
+        cover "metadata_read", "local_read", "blob_download", "ranged_read",
+        "decode", "fetch" and "upload".
+
+        Returns:
+            Snapshot of the process-wide metrics (see CacheMetrics.snapshot)
+        """
+        return self.metrics.snapshot()
+
+    def reset_metrics(self) -> None:
+        """Clear all counters and histograms (e.g. before measuring a change)."""
+        self.metrics.reset()
+
     def cleanup_all_old_versions(
         self,
         source: Optional[DataSource] = None
@@ -0,0 +1,157 @@
+"""
+Date coverage of cached datasets.
+
+Callers fetch the same source_id with different windows (a 5-year chart, a
+backtest window, full history). The cache records which dates a stored copy
+covers, so any request inside that range is served from cache and a wider
+request only fetches the dates that are missing.
+
+Coverage is a DateRange (start, end) where either bound may be None:
+- start None: history from the first available observation
+- end None: open-ended, i.e. up to the time the data was fetched (the tail
+  is then kept current by the normal freshness/refresh cycle)
+
+Metadata docs written before coverage tracking have no coverage fields and
+are treated as full history, which is what fetch functions returned then.
+"""
+
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional
+
+from src.data.projection import DateRange, as_date
+
+FULL_COVERAGE: DateRange = (None, None)
+
+
+def normalize_coverage(coverage: Optional[DateRange]) -> DateRange:
+    """
+    Normalize a range to coverage form.
+
+    Bounds are reduced to dates, and an end bound of today or later becomes
+    open-ended, since data fetched up to today covers everything published.
+
+    Args:
+        coverage: (start, end) tuple, or None for full history
+
+    Returns:
+        Normalized (start, end) tuple
+    """
+    if not coverage:
+        return FULL_COVERAGE
+
+    start, end = coverage
+    start = as_date(start) if start is not None else None
+    end = as_date(end) if end is not None else None
+
+    if end is not None and end >= date.today():
+        end = None
+
+    return start, end
+
+
+def coverage_from_metadata(metadata: Optional[Dict[str, Any]]) -> DateRange:
+    """
+    Read the coverage recorded in a metadata doc.
+
+    Args:
+        metadata: Metadata dictionary
+
+    Returns:
+        (start, end) tuple; full history if no coverage is recorded
+    """
+    if not metadata:
+        return FULL_COVERAGE
+
+    start = metadata.get("coverage_start")
+    end = metadata.get("coverage_end")
+    return (
+        date.fromisoformat(start[:10]) if start else None,
+        date.fromisoformat(end[:10]) if end else None
+    )
+
+
+def coverage_to_metadata(coverage: DateRange) -> Dict[str, Optional[str]]:
+    """
+    Build the metadata fields recording a coverage.
+
+    Args:
+        coverage: Normalized (start, end) tuple
+
+    Returns:
+        Dictionary with coverage_start and coverage_end (ISO dates or None)
+    """
+    start, end = coverage
+    return {
+        "coverage_start": start.isoformat() if start is not None else None,
+        "coverage_end": end.isoformat() if end is not None else None
+    }
+
+
+def covers(coverage: DateRange, needed: DateRange) -> bool:
+    """
+    Check whether a coverage includes every date of a needed range.
+
+    Args:
+        coverage: Normalized coverage of the cached data
+        needed: Normalized range requested by the caller
+
+    Returns:
+        True if the cached data can serve the request
+    """
+    cov_start, cov_end = coverage
+    need_start, need_end = needed
+
+    start_ok = cov_start is None or (need_start is not None and need_start >= cov_start)
+    end_ok = cov_end is None or (need_end is not None and need_end <= cov_end)
+    return start_ok and end_ok
+
+
+def missing_ranges(coverage: DateRange, needed: DateRange) -> List[DateRange]:
+    """
+    Get the parts of a needed range that a coverage does not include.
+
+    Args:
+        coverage: Normalized coverage of the cached data
+        needed: Normalized range requested by the caller
+
+    Returns:
+        Up to two ranges: dates before the coverage and dates after it
+    """
+    cov_start, cov_end = coverage
+    need_start, need_end = needed
+    missing = []
+
+    if cov_start is not None and (need_start is None or need_start < cov_start):
+        missing.append((need_start, cov_start - timedelta(days=1)))
+
+    if cov_end is not None and (need_end is None or need_end > cov_end):
+        missing.append((cov_end + timedelta(days=1), need_end))
+
+    return missing
+
+
+def coverage_union(coverage: DateRange, other: DateRange) -> DateRange:
+    """
+    Get the smallest coverage including two ranges.
+
+    Only valid when the ranges overlap or touch, which holds after the
+    missing ranges of a request have been fetched.
+
+    Args:
+        coverage: Normalized coverage
+        other: Normalized range
+
+    Returns:
+        Normalized (start, end) tuple
+    """
+    starts = [coverage[0], other[0]]
+    ends = [coverage[1], other[1]]
+    start = None if None in starts else min(starts)
+    end = None if None in ends else max(ends)
+    return start, end
+
+
+def format_coverage(coverage: DateRange) -> str:
+    """Format a coverage for log messages, e.g. "2019-01-01..now"."""
+    start, end = coverage
+    return f"{start or 'start'}..{end or 'now'}"
@@ -0,0 +1,288 @@
+"""
+Local on-disk Parquet cache tier.
+
+Sits in front of Cloud Storage so repeated loads of the same dataset are
+served from the local filesystem instead of a full blob download.
+
+Entries are keyed by (source, source_id, storage_path, storage generation).
+A new upload produces a new generation, so a stale local copy can never be
+served: the key simply stops matching the Firestore metadata.
+
+Features:
+- Byte budget with least-recently-used eviction
+- Atomic writes (temp file + os.replace), safe across processes
+- Thread-safe index shared by all Streamlit sessions
+"""
+
+import hashlib
+import os
+import re
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+import polars as pl
+
+from src.config.constants import DATA_FILE_FORMAT
+
+
+class LocalParquetCache:
+    """
+    Size-bounded LRU cache of Parquet files on the local filesystem.
+
+    Attributes:
+        root_dir: Directory holding cached files ({root}/{source}/{source_id}/)
+        max_bytes: Total byte budget before least-recently-used files are evicted
+    """
+
+    def __init__(self, root_dir: str, max_bytes: int):
+        """
+        Initialize the cache and index any files left from previous runs.
+
+        Args:
+            root_dir: Directory for cached Parquet files (created if missing)
+            max_bytes: Maximum total size of cached files in bytes
+        """
+        self.root_dir = Path(root_dir)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # path -> size in bytes, ordered from least to most recently used
+        self._index: "OrderedDict[Path, int]" = OrderedDict()
+        self._total_bytes = 0
+
+        self.root_dir.mkdir(parents=True, exist_ok=True)
+        self._load_index()
+
+    # =========================================================================
+    # INDEX MANAGEMENT
+    # =========================================================================
+
+    def _load_index(self) -> None:
+        """Rebuild the LRU index from disk, oldest access time first."""
+        entries = []
+        for path in self.root_dir.rglob(f"*.{DATA_FILE_FORMAT}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, path, stat.st_size))
+
+        entries.sort(key=lambda e: e[0])
+        for _, path, size in entries:
+            self._index[path] = size
+            self._total_bytes += size
+
+        self._enforce_budget()
+
+    def _enforce_budget(self) -> None:
+        """Evict least-recently-used files until the byte budget is met. Caller holds the lock."""
+        while self._total_bytes > self.max_bytes and self._index:
+            path, size = self._index.popitem(last=False)
+            self._total_bytes -= size
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+    def _forget(self, path: Path) -> None:
+        """Drop a path from the index and disk. Caller holds the lock."""
+        size = self._index.pop(path, None)
+        if size is not None:
+            self._total_bytes -= size
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+    # =========================================================================
+    # KEYING
+    # =========================================================================
+
+    def _dataset_dir(self, source: str, source_id: str) -> Path:
+        """Directory for a dataset, with the identifier made filesystem-safe."""
+        safe_id = re.sub(r"[^A-Za-z0-9._-]", "_", source_id)
+        return self.root_dir / source / safe_id
+
+    def _entry_path(
+        self,
+        source: str,
+        source_id: str,
+        storage_path: str,
+        generation: str
+    ) -> Path:
+        """
+        Build the local file path for a cache entry.
+
+        The storage path is hashed so different files of the same dataset
+        (versions, partitions) do not collide, and the generation is kept
+        readable so stale siblings can be identified.
+        """
+        path_hash = hashlib.sha1(storage_path.encode("utf-8")).hexdigest()[:12]
+        safe_generation = re.sub(r"[^A-Za-z0-9._-]", "_", str(generation))
+        return self._dataset_dir(source, source_id) / f"{path_hash}-{safe_generation}.{DATA_FILE_FORMAT}"
+
+    # =========================================================================
+    # PUBLIC API
+    # =========================================================================
+
+    def get_path(
+        self,
+        source: str,
+        source_id: str,
+        storage_path: str,
+        generation: str
+    ) -> Optional[Path]:
+        """
+        Return the local file for an entry and mark it as recently used.
+
+        Args:
+            source: Data source
+            source_id: Source-specific identifier
+            storage_path: Cloud Storage path the entry mirrors
+            generation: Storage generation recorded in metadata
+
+        Returns:
+            Path to the cached Parquet file, or None on a miss
+        """
+        path = self._entry_path(source, source_id, storage_path, generation)
+
+        with self._lock:
+            if path not in self._index:
+                # Another process may have written it since our index was built
+                try:
+                    size = path.stat().st_size
+                except OSError:
+                    return None
+                self._index[path] = size
+                self._total_bytes += size
+            elif not path.exists():
+                # Removed behind our back (another process evicted it)
+                self._forget(path)
+                return None
+            self._index.move_to_end(path)
+
+        try:
+            os.utime(path)  # Persist recency across restarts
+        except OSError:
+            pass
+        return path
+
+    def get(
+        self,
+        source: str,
+        source_id: str,
+        storage_path: str,
+        generation: str
+    ) -> Optional[pl.DataFrame]:
+        """
+        Load a cached DataFrame from local disk.
+
+        Args:
+            source: Data source
+            source_id: Source-specific identifier
+            storage_path: Cloud Storage path the entry mirrors
+            generation: Storage generation recorded in metadata
+
+        Returns:
+            Polars DataFrame, or None on a miss or unreadable file
+        """
+        path = self.get_path(source, source_id, storage_path, generation)
+        if path is None:
+            return None
+
+        try:
+            return pl.read_parquet(path)
+        except Exception as e:
+            print(f"[WARN] Discarding unreadable local cache file {path}: {str(e)}")
+            with self._lock:
+                self._forget(path)
+            return None
+
+    def put_bytes(
+        self,
+        source: str,
+        source_id: str,
+        storage_path: str,
+        generation: str,
+        data_bytes: bytes
+    ) -> None:
+        """
+        Store raw Parquet bytes for an entry using an atomic write.
+
+        Older generations of the same storage path are removed, since they
+        can no longer match the metadata.
+
+        Args:
+            source: Data source
+            source_id: Source-specific identifier
+            storage_path: Cloud Storage path the entry mirrors
+            generation: Storage generation recorded in metadata
+            data_bytes: Parquet file contents
+        """
+        size = len(data_bytes)
+        if size > self.max_bytes:
+            return
+
+        path = self._entry_path(source, source_id, storage_path, generation)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        tmp_name = None
+        try:
+            # Write to a temp file in the same directory, then atomically swap in
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as tmp_file:
+                tmp_file.write(data_bytes)
+            os.replace(tmp_name, path)
+        except OSError as e:
+            print(f"[WARN] Failed to write local cache file {path}: {str(e)}")
+            if tmp_name and os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            return
+
+        path_prefix = path.name.split("-", 1)[0]
+
+        with self._lock:
+            # Remove superseded generations of the same storage path
+            for sibling in list(self._index):
+                if (
+                    sibling.parent == path.parent
+                    and sibling != path
+                    and sibling.name.split("-", 1)[0] == path_prefix
+                ):
+                    self._forget(sibling)
+
+            previous = self._index.pop(path, None)
+            if previous is not None:
+                self._total_bytes -= previous
+            self._index[path] = size
+            self._total_bytes += size
+            self._enforce_budget()
+
+    def invalidate(self, source: str, source_id: str) -> None:
+        """
+        Remove every local entry for a dataset.
+
+        Args:
+            source: Data source
+            source_id: Source-specific identifier
+        """
+        dataset_dir = self._dataset_dir(source, source_id)
+        with self._lock:
+            for path in [p for p in self._index if p.parent == dataset_dir]:
+                self._forget(path)
+
+    def get_stats(self) -> dict:
+        """
+        Get local cache usage statistics.
+
+        Returns:
+            Dictionary with file count, bytes used and byte budget
+        """
+        with self._lock:
+            return {
+                "files": len(self._index),
+                "size_bytes": self._total_bytes,
+                "max_bytes": self.max_bytes
+            }
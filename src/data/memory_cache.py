@@ -0,0 +1,191 @@
+"""
+In-process memory tier for decoded Polars DataFrames.
+
+One tier is shared by the whole process (get_memory_cache), so frames held
+here are shared by every Streamlit session and every page's CacheManager:
+concurrent users viewing the same chart reuse one decoded copy instead of
+each downloading and decoding it, and invalidating a dataset drops it for all.
+
+Features:
+- Total-bytes budget measured with DataFrame.estimated_size()
+- Least-recently-used eviction once the budget is exceeded
+- Per-entry expiry tied to the source freshness threshold
+- Per-entry date coverage, so a frame is only served to requests inside it
+- Hit/miss/eviction counters
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Hashable, NamedTuple, Optional
+
+import polars as pl
+
+from src.config.settings import get_cache_config
+from src.data.coverage import FULL_COVERAGE, covers
+from src.data.projection import DateRange
+
+
+class _MemoryEntry(NamedTuple):
+    """Cached frame with its size, absolute expiry (epoch seconds) and coverage."""
+
+    data: pl.DataFrame
+    size_bytes: int
+    expires_at: float
+    coverage: DateRange
+
+
+class MemoryFrameCache:
+    """
+    Thread-safe, size-bounded LRU cache of decoded DataFrames with expiry.
+
+    Polars DataFrames are immutable from the caller's point of view (every
+    operation returns a new frame), so cached frames are returned directly
+    without copying.
+
+    Attributes:
+        max_bytes: Total estimated size budget for cached frames
+    """
+
+    def __init__(self, max_bytes: int):
+        """
+        Initialize an empty memory tier.
+
+        Args:
+            max_bytes: Maximum total estimated size of cached frames in bytes
+        """
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, _MemoryEntry]" = OrderedDict()
+        self._total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _remove(self, key: Hashable) -> None:
+        """Drop an entry. Caller holds the lock."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._total_bytes -= entry.size_bytes
+
+    def get(
+        self,
+        key: Hashable,
+        needed: DateRange = FULL_COVERAGE
+    ) -> Optional[pl.DataFrame]:
+        """
+        Get a cached frame if present, not expired and covering the needed dates.
+
+        Args:
+            key: Cache key, typically (source, source_id)
+            needed: Normalized date range the caller needs (see coverage.py)
+
+        Returns:
+            Cached DataFrame or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            if entry.expires_at <= time.time():
+                self._remove(key)
+                self.misses += 1
+                return None
+
+            if not covers(entry.coverage, needed):
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.data
+
+    def put(
+        self,
+        key: Hashable,
+        data: pl.DataFrame,
+        expires_at: float,
+        coverage: DateRange = FULL_COVERAGE
+    ) -> None:
+        """
+        Store a frame until the given expiry time.
+
+        Frames larger than the whole budget are not cached.
+
+        Args:
+            key: Cache key, typically (source, source_id)
+            data: Decoded DataFrame to share
+            expires_at: Absolute expiry as epoch seconds
+            coverage: Normalized date range the frame covers
+        """
+        size_bytes = int(data.estimated_size())
+        if size_bytes > self.max_bytes or expires_at <= time.time():
+            return
+
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = _MemoryEntry(data, size_bytes, expires_at, coverage)
+            self._total_bytes += size_bytes
+
+            # Evict least recently used frames until within budget
+            while self._total_bytes > self.max_bytes and self._entries:
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        """
+        Remove a cached frame.
+
+        Args:
+            key: Cache key, typically (source, source_id)
+        """
+        with self._lock:
+            self._remove(key)
+
+    def clear(self) -> None:
+        """Remove all cached frames (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def get_stats(self) -> dict:
+        """
+        Get memory tier statistics.
+
+        Returns:
+            Dictionary with entry count, bytes used, budget and hit/miss counters
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "size_bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+            }
+
+
+_shared_cache: Optional[MemoryFrameCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_memory_cache() -> MemoryFrameCache:
+    """
+    Get the process-wide memory tier, creating it on first use.
+
+    Returns:
+        MemoryFrameCache with the memory_max_bytes budget from settings
+    """
+    global _shared_cache
+    if _shared_cache is None:
+        with _shared_cache_lock:
+            if _shared_cache is None:
+                _shared_cache = MemoryFrameCache(max_bytes=get_cache_config()["memory_max_bytes"])
+    return _shared_cache
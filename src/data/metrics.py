@@ -0,0 +1,255 @@
+"""
+Process-wide cache instrumentation.
+
+CacheManager and FirebaseService record what every cache lookup did and how
+long each step took, so the admin dashboard can show hit rates and where
+load time goes (Firestore reads, Cloud Storage downloads, Parquet decode,
+upstream fetches, uploads):
+
+- Counters per source: request outcomes (hit, miss, stale, not_found,
+  error) and fetch events (fetch_error, stale_fallback, revalidated)
+- Tier counters per source: which tier served a load (memory, local, remote)
+- Latency histograms per operation and source, with fixed bucket bounds
+- Bytes downloaded from / uploaded to Cloud Storage per source
+
+Metrics live in memory and cover this process since start (or the last
+reset); they are not persisted or shared between replicas.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+from src.config.constants import METRICS_LATENCY_BUCKETS_MS
+
+# Request outcomes that count towards the hit rate
+HIT_EVENTS = ("hit", "stale")
+LOOKUP_EVENTS = ("hit", "stale", "miss")
+
+
+class LatencyHistogram:
+    """
+    Fixed-bucket latency histogram (not thread-safe; CacheMetrics locks it).
+
+    Attributes:
+        bounds_ms: Upper bounds of the buckets in milliseconds; a final
+                   overflow bucket holds anything slower
+    """
+
+    def __init__(self, bounds_ms: Sequence[float]):
+        """
+        Initialize an empty histogram.
+
+        Args:
+            bounds_ms: Ascending bucket upper bounds in milliseconds
+        """
+        self.bounds_ms = list(bounds_ms)
+        self.counts = [0] * (len(self.bounds_ms) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, ms: float) -> None:
+        """Record one observation in milliseconds."""
+        self.counts[bisect_left(self.bounds_ms, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def percentile(self, fraction: float) -> float:
+        """
+        Estimate a percentile as the upper bound of the bucket containing it.
+
+        Args:
+            fraction: Percentile as a fraction (e.g. 0.95)
+
+        Returns:
+            Estimated latency in milliseconds (max observed if in the overflow bucket)
+        """
+        if not self.count:
+            return 0.0
+
+        rank = fraction * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                return self.bounds_ms[index] if index < len(self.bounds_ms) else self.max_ms
+        return self.max_ms
+
+    def summary(self) -> dict:
+        """
+        Get the histogram as a plain dictionary.
+
+        Returns:
+            Dictionary with count, mean/p50/p95/max in ms and the bucket counts
+            keyed by upper bound ("inf" for the overflow bucket)
+        """
+        labels = [str(bound) for bound in self.bounds_ms] + ["inf"]
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total_ms / self.count, 2) if self.count else 0.0,
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "max_ms": round(self.max_ms, 2),
+            "buckets": dict(zip(labels, self.counts))
+        }
+
+
+class CacheMetrics:
+    """
+    Thread-safe counters, latency histograms and byte totals.
+
+    Example:
+        >>> metrics = get_cache_metrics()
+        >>> metrics.increment("fred", "hit")
+        >>> with metrics.timer("blob_download", "fred"):
+        >>>     data = backend.get_blob(path)
+        >>> metrics.snapshot()["counters"]["fred"]["hit"]
+        1
+    """
+
+    def __init__(self, bounds_ms: Sequence[float] = METRICS_LATENCY_BUCKETS_MS):
+        """
+        Initialize empty metrics.
+
+        Args:
+            bounds_ms: Latency histogram bucket upper bounds in milliseconds
+        """
+        self._bounds_ms = list(bounds_ms)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear every counter, histogram and byte total."""
+        with self._lock:
+            self._counters: Dict[str, Dict[str, int]] = {}
+            self._tiers: Dict[str, Dict[str, int]] = {}
+            self._latency: Dict[Tuple[str, str], LatencyHistogram] = {}
+            self._bytes: Dict[str, Dict[str, int]] = {}
+            self._since = datetime.now()
+
+    def increment(self, source: str, event: str, amount: int = 1) -> None:
+        """
+        Count an event for a source.
+
+        Args:
+            source: Data source
+            event: Event name (e.g. "hit", "miss", "stale", "error")
+            amount: Amount to add
+        """
+        with self._lock:
+            counters = self._counters.setdefault(source, {})
+            counters[event] = counters.get(event, 0) + amount
+
+    def record_tier(self, source: str, tier: str) -> None:
+        """
+        Count a load served by a tier.
+
+        Args:
+            source: Data source
+            tier: "memory", "local" or "remote"
+        """
+        with self._lock:
+            tiers = self._tiers.setdefault(source, {})
+            tiers[tier] = tiers.get(tier, 0) + 1
+
+    def observe(self, operation: str, source: str, seconds: float) -> None:
+        """
+        Record the duration of an operation.
+
+        Args:
+            operation: Operation name (e.g. "metadata_read", "blob_download")
+            source: Data source
+            seconds: Duration in seconds
+        """
+        with self._lock:
+            histogram = self._latency.get((operation, source))
+            if histogram is None:
+                histogram = self._latency[(operation, source)] = LatencyHistogram(self._bounds_ms)
+            histogram.observe(seconds * 1000)
+
+    @contextmanager
+    def timer(self, operation: str, source: str) -> Iterator[None]:
+        """
+        Time a block and record it with observe(), even if it raises.
+
+        Args:
+            operation: Operation name
+            source: Data source
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(operation, source, time.perf_counter() - start)
+
+    def add_bytes(self, source: str, direction: str, count: int) -> None:
+        """
+        Add to the bytes transferred for a source.
+
+        Args:
+            source: Data source
+            direction: "downloaded" or "uploaded"
+            count: Number of bytes
+        """
+        with self._lock:
+            totals = self._bytes.setdefault(source, {"downloaded": 0, "uploaded": 0})
+            totals[direction] = totals.get(direction, 0) + count
+
+    def snapshot(self) -> dict:
+        """
+        Get a consistent copy of all metrics.
+
+        Returns:
+            Dictionary with:
+                - since: ISO timestamp of process start or last reset
+                - counters: {source: {event: count, "hit_rate": fraction}}
+                - tiers: {source: {tier: count}}
+                - latency: {operation: {source: histogram summary}}
+                - bytes: {source: {"downloaded": n, "uploaded": n}}
+        """
+        with self._lock:
+            counters = {}
+            for source, events in self._counters.items():
+                counters[source] = dict(events)
+                lookups = sum(events.get(event, 0) for event in LOOKUP_EVENTS)
+                hits = sum(events.get(event, 0) for event in HIT_EVENTS)
+                counters[source]["hit_rate"] = round(hits / lookups, 4) if lookups else 0.0
+
+            latency: Dict[str, Dict[str, dict]] = {}
+            for (operation, source), histogram in sorted(self._latency.items()):
+                latency.setdefault(operation, {})[source] = histogram.summary()
+
+            return {
+                "since": self._since.isoformat(),
+                "counters": counters,
+                "tiers": {source: dict(tiers) for source, tiers in self._tiers.items()},
+                "latency": latency,
+                "bytes": {source: dict(totals) for source, totals in self._bytes.items()}
+            }
+
+
+_metrics = CacheMetrics()
+
+
+def get_cache_metrics() -> CacheMetrics:
+    """Get the process-wide metrics shared by CacheManager and FirebaseService."""
+    return _metrics
+
+
+def metrics_source(keys: List[Tuple[str, str]]) -> str:
+    """
+    Get the source label for an operation covering several datasets.
+
+    Args:
+        keys: (source, source_id) pairs
+
+    Returns:
+        The common source, or "mixed" if the datasets span sources
+    """
+    sources = {source for source, _ in keys}
+    return sources.pop() if len(sources) == 1 else "mixed"
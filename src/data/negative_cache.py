@@ -0,0 +1,99 @@
+"""
+Short-lived record of datasets that do not exist upstream.
+
+A mistyped custom ticker is looked up again on every Streamlit rerun while
+the user types. Remembering the DataNotFoundError for a few minutes makes
+those repeats fail immediately, without metadata reads or upstream calls
+that count against rate limits.
+"""
+
+import threading
+import time
+from typing import Dict, Hashable, Optional, Tuple
+
+
+class NegativeCache:
+    """
+    Thread-safe map of keys to not-found messages with a fixed TTL.
+
+    Example:
+        >>> misses = NegativeCache(ttl_seconds=300)
+        >>> misses.put(("yfinance", "APPL"), "Ticker 'APPL' not found")
+        >>> misses.get(("yfinance", "APPL"))
+        "Ticker 'APPL' not found"
+    """
+
+    def __init__(self, ttl_seconds: float):
+        """
+        Initialize an empty negative cache.
+
+        Args:
+            ttl_seconds: How long a not-found result is remembered
+        """
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: Dict[Hashable, Tuple[str, float]] = {}
+        self.hits = 0
+
+    def get(self, key: Hashable) -> Optional[str]:
+        """
+        Get the remembered not-found message for a key.
+
+        Args:
+            key: Cache key, typically (source, source_id)
+
+        Returns:
+            Error message, or None if the key is not (or no longer) known missing
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            message, expires_at = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+
+            self.hits += 1
+            return message
+
+    def put(self, key: Hashable, message: str) -> None:
+        """
+        Remember that a key was not found upstream.
+
+        Args:
+            key: Cache key, typically (source, source_id)
+            message: Error message to re-raise on repeated lookups
+        """
+        if self.ttl_seconds <= 0:
+            return
+
+        now = time.monotonic()
+        with self._lock:
+            self._entries[key] = (message, now + self.ttl_seconds)
+
+            # Typos are unbounded; drop expired entries as new ones arrive
+            expired = [k for k, (_, expires_at) in self._entries.items() if expires_at <= now]
+            for k in expired:
+                del self._entries[k]
+
+    def discard(self, key: Hashable) -> None:
+        """Forget a key (e.g. after it was invalidated or fetched successfully)."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def get_stats(self) -> dict:
+        """
+        Get negative cache statistics.
+
+        Returns:
+            Dictionary with remembered key count (including any not yet
+            pruned), TTL and hit counter
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits
+            }
@@ -0,0 +1,211 @@
+"""
+Column and date-range projection helpers for cached datasets.
+
+Most consumers immediately select a few columns and filter to a date window
+after loading a dataset. These helpers express that projection once so it can
+be pushed down into Parquet reads (column pruning + row-group statistics) and
+applied consistently to frames that are already in memory.
+"""
+
+from datetime import date, datetime
+from typing import Any, BinaryIO, List, Optional, Sequence, Tuple
+
+import polars as pl
+import pyarrow.parquet as pq
+
+DateRange = Tuple[Optional[date], Optional[date]]
+
+
+def as_date(value: date) -> date:
+    """Reduce a datetime bound to its calendar date (dates are returned unchanged)."""
+    return value.date() if isinstance(value, datetime) else value
+
+
+def date_range_filter(date_range: Optional[DateRange]) -> Optional[pl.Expr]:
+    """
+    Build a filter expression on the "date" column for an inclusive range.
+
+    Args:
+        date_range: (start, end) tuple; either bound may be None (open-ended)
+
+    Returns:
+        Polars expression, or None if the range is unbounded
+    """
+    if not date_range:
+        return None
+
+    start, end = date_range
+    conditions = []
+    if start is not None:
+        conditions.append(pl.col("date") >= start)
+    if end is not None:
+        conditions.append(pl.col("date") <= end)
+
+    if not conditions:
+        return None
+
+    expr = conditions[0]
+    for condition in conditions[1:]:
+        expr = expr & condition
+    return expr
+
+
+def projection_columns(
+    columns: Optional[Sequence[str]],
+    date_range: Optional[DateRange]
+) -> Optional[List[str]]:
+    """
+    Get the columns to read for a projection.
+
+    The "date" column is always read when filtering by date, even if the
+    caller did not ask for it, since the filter needs it.
+
+    Args:
+        columns: Requested columns (None = all)
+        date_range: Requested date range (None = all rows)
+
+    Returns:
+        Columns to read, or None for all columns
+    """
+    if columns is None:
+        return None
+
+    read_columns = list(columns)
+    if date_range and "date" not in read_columns:
+        read_columns.append("date")
+    return read_columns
+
+
+def apply_projection(
+    data: pl.DataFrame,
+    columns: Optional[Sequence[str]] = None,
+    date_range: Optional[DateRange] = None
+) -> pl.DataFrame:
+    """
+    Apply a column/date-range projection to an in-memory DataFrame.
+
+    Args:
+        data: Full DataFrame
+        columns: Columns to keep (None = all)
+        date_range: Inclusive (start, end) date range on "date" (None = all rows)
+
+    Returns:
+        Projected DataFrame (the input itself if no projection is requested)
+    """
+    expr = date_range_filter(date_range)
+    if expr is not None:
+        data = data.filter(expr)
+    if columns is not None:
+        data = data.select(list(columns))
+    return data
+
+
+def scan_projected(
+    source,
+    columns: Optional[Sequence[str]] = None,
+    date_range: Optional[DateRange] = None
+) -> pl.DataFrame:
+    """
+    Read a local Parquet file lazily with projection and predicate pushdown.
+
+    Polars prunes unread columns and skips row groups whose statistics fall
+    outside the date range.
+
+    Args:
+        source: Path to a Parquet file
+        columns: Columns to keep (None = all)
+        date_range: Inclusive (start, end) date range on "date" (None = all rows)
+
+    Returns:
+        Projected DataFrame
+    """
+    lazy = pl.scan_parquet(source)
+
+    expr = date_range_filter(date_range)
+    if expr is not None:
+        lazy = lazy.filter(expr)
+    if columns is not None:
+        lazy = lazy.select(list(columns))
+
+    return lazy.collect()
+
+
+def _row_group_overlaps(statistics: Any, date_range: DateRange) -> bool:
+    """
+    Check whether a row group's "date" statistics overlap a date range.
+
+    Row groups are kept whenever statistics are missing or not comparable,
+    so pruning can only ever skip data that is certainly out of range.
+    """
+    if statistics is None or not statistics.has_min_max:
+        return True
+
+    start, end = date_range
+    group_min, group_max = statistics.min, statistics.max
+
+    # Timestamp columns report datetime statistics; compare like with like
+    if isinstance(group_min, datetime):
+        if start is not None and not isinstance(start, datetime):
+            start = datetime.combine(start, datetime.min.time())
+        if end is not None and not isinstance(end, datetime):
+            end = datetime.combine(end, datetime.max.time())
+        if group_min.tzinfo is not None:
+            group_min = group_min.replace(tzinfo=None)
+            group_max = group_max.replace(tzinfo=None)
+    elif isinstance(group_min, date):
+        start = as_date(start) if start is not None else None
+        end = as_date(end) if end is not None else None
+
+    try:
+        if start is not None and group_max < start:
+            return False
+        if end is not None and group_min > end:
+            return False
+    except TypeError:
+        return True
+    return True
+
+
+def read_parquet_projected(
+    file_obj: BinaryIO,
+    columns: Optional[Sequence[str]] = None,
+    date_range: Optional[DateRange] = None
+) -> pl.DataFrame:
+    """
+    Read a projection from a seekable Parquet file object.
+
+    Only the footer, the row groups whose "date" statistics overlap the range
+    and the requested column chunks are read, so on a ranged-read file object
+    (e.g. a Cloud Storage blob reader) the bytes transferred scale with the
+    projection rather than the file size.
+
+    Args:
+        file_obj: Seekable binary file object positioned anywhere
+        columns: Columns to keep (None = all)
+        date_range: Inclusive (start, end) date range on "date" (None = all rows)
+
+    Returns:
+        Projected DataFrame
+    """
+    parquet_file = pq.ParquetFile(file_obj)
+    file_metadata = parquet_file.metadata
+    row_groups = list(range(file_metadata.num_row_groups))
+
+    date_index = parquet_file.schema_arrow.get_field_index("date")
+    if date_range and date_index >= 0:
+        row_groups = [
+            i for i in row_groups
+            if _row_group_overlaps(
+                file_metadata.row_group(i).column(date_index).statistics,
+                date_range
+            )
+        ]
+
+    table = parquet_file.read_row_groups(
+        row_groups,
+        columns=projection_columns(columns, date_range)
+    )
+    data = pl.from_arrow(table)
+
+    # Row groups are coarse; apply the exact filter and final column order
+    return apply_projection(data, columns, date_range)
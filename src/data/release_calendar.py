@@ -0,0 +1,259 @@
+"""
+Release checks for release-aware cache freshness.
+
+When cached FRED or Stats Canada data passes its revalidation interval,
+CacheManager first asks whether the source has published anything since the
+data was cached, and only refetches if it has:
+
+- FRED: the series' last_updated from series info (one small request)
+- Stats Canada: the changed-cube list for each day since the data was
+  cached; one list per day is shared by every table
+
+Checks answer True (changed), False (unchanged) or None (unknown, e.g. the
+check failed or looks back too far); anything but False means a full fetch.
+"""
+
+import re
+import threading
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+from src.config.constants import (
+    STATSCAN_TIMEZONE,
+    STATSCAN_RELEASE_TIME,
+    STATSCAN_CHANGE_LOOKBACK_DAYS
+)
+from src.data.single_flight import SingleFlight
+
+
+def _cached_at(metadata: dict) -> Optional[datetime]:
+    """
+    Get when cached data was last saved or revalidated, as an aware datetime.
+
+    Args:
+        metadata: Metadata doc with a last_updated timestamp
+
+    Returns:
+        Aware datetime, or None if there is no timestamp
+    """
+    last_updated = metadata.get("last_updated")
+    if not hasattr(last_updated, "timestamp"):
+        return None
+    return datetime.fromtimestamp(last_updated.timestamp(), timezone.utc)
+
+
+def parse_fred_timestamp(value: str) -> Optional[datetime]:
+    """
+    Parse FRED's last_updated format ("2024-01-26 07:52:02-06").
+
+    Args:
+        value: Timestamp string from FRED series info
+
+    Returns:
+        Aware datetime, or None if the value cannot be parsed
+    """
+    if not value:
+        return None
+
+    value = str(value).strip()
+    # FRED gives the UTC offset in hours only; strptime needs +HHMM
+    if re.search(r"[+-]\d{2}$", value):
+        value += "00"
+
+    try:
+        return datetime.strptime(value, "%Y-%m-%d %H:%M:%S%z")
+    except ValueError:
+        return None
+
+
+class ReleaseCalendar:
+    """
+    Answers "has this dataset been released since it was cached?".
+
+    Services are created on first use, so a calendar can be built without
+    FRED credentials and only fails (returning None) when asked about FRED.
+
+    Example:
+        >>> calendar = ReleaseCalendar()
+        >>> calendar.has_changed("statscan", "36100434", metadata)
+        False
+    """
+
+    def __init__(self, fred_service=None, statscan_service=None):
+        """
+        Initialize the calendar.
+
+        Args:
+            fred_service: FredService to use (created on first FRED check if None)
+            statscan_service: StatsCanService to use (created on first check if None)
+        """
+        self._fred = fred_service
+        self._statscan = statscan_service
+        self._service_lock = threading.Lock()
+
+        # Changed-cube lists by day: {day: ({product id: release time}, fetched at)}
+        self._changed_cubes: Dict[date, Tuple[Dict[str, Optional[datetime]], datetime]] = {}
+        self._cubes_lock = threading.Lock()
+        # One request per day in flight; the lock above is never held across it
+        self._cube_flights = SingleFlight()
+
+    def has_changed(
+        self,
+        source: str,
+        source_id: str,
+        metadata: dict
+    ) -> Optional[bool]:
+        """
+        Check whether the source published new data since it was cached.
+
+        Args:
+            source: Data source ("fred", "statscan"; others are never checked)
+            source_id: Source-specific identifier
+            metadata: Metadata of the cached data
+
+        Returns:
+            True if changed, False if unchanged, None if unknown
+        """
+        cached_at = _cached_at(metadata)
+        if cached_at is None:
+            return None
+
+        try:
+            if source == "fred":
+                return self._fred_changed(source_id, cached_at)
+            if source == "statscan":
+                return self._statscan_changed(source_id, cached_at)
+        except Exception as e:
+            print(f"[WARN] Release check failed for {source}:{source_id}: {str(e)}")
+
+        return None
+
+    # =========================================================================
+    # FRED
+    # =========================================================================
+
+    def _fred_service(self):
+        """Get the FredService, creating it on first use."""
+        with self._service_lock:
+            if self._fred is None:
+                from src.services.fred_api import FredService
+                self._fred = FredService()
+            return self._fred
+
+    def _fred_changed(self, series_id: str, cached_at: datetime) -> Optional[bool]:
+        """Compare the series' last_updated with when it was cached."""
+        info = self._fred_service().get_series_metadata(series_id)
+        released_at = parse_fred_timestamp(info.get("last_updated"))
+        if released_at is None:
+            return None
+        return released_at > cached_at
+
+    # =========================================================================
+    # STATS CANADA
+    # =========================================================================
+
+    def _statscan_service(self):
+        """Get the StatsCanService, creating it on first use."""
+        with self._service_lock:
+            if self._statscan is None:
+                from src.services.statscan_api import StatsCanService
+                self._statscan = StatsCanService()
+            return self._statscan
+
+    def _statscan_changed(self, product_id: str, cached_at: datetime) -> Optional[bool]:
+        """Look for the table in the changed-cube lists since it was cached."""
+        tz = ZoneInfo(STATSCAN_TIMEZONE)
+        cached_local = cached_at.astimezone(tz)
+        today = datetime.now(tz).date()
+
+        if (today - cached_local.date()).days > STATSCAN_CHANGE_LOOKBACK_DAYS:
+            return None
+
+        day = cached_local.date()
+        while day <= today:
+            releases = self._get_changed_cubes(day)
+            if releases is None:
+                return None
+
+            if str(product_id) in releases:
+                release_time = releases[str(product_id)]
+                # Same-day release that happened before the data was cached
+                if release_time is not None and release_time <= cached_local.replace(tzinfo=None):
+                    day += timedelta(days=1)
+                    continue
+                return True
+
+            day += timedelta(days=1)
+
+        return False
+
+    def _get_changed_cubes(self, day: date) -> Optional[Dict[str, Optional[datetime]]]:
+        """
+        Get the tables released on a day with their (local) release times.
+
+        Each day's list is requested once and shared by every table;
+        concurrent callers for the same day wait on one request. Today's
+        list is requested again only if it was read before the daily release
+        time, since until then it can still grow.
+
+        Args:
+            day: Release date (Stats Canada local time)
+
+        Returns:
+            Dictionary of product ID to release time, or None if the list
+            could not be read
+        """
+        tz = ZoneInfo(STATSCAN_TIMEZONE)
+        now = datetime.now(tz)
+
+        release_hour, release_minute = (int(part) for part in STATSCAN_RELEASE_TIME.split(":"))
+        release_at = datetime(day.year, day.month, day.day, release_hour, release_minute, tzinfo=tz)
+
+        with self._cubes_lock:
+            entry = self._changed_cubes.get(day)
+        if entry is not None:
+            releases, fetched_at = entry
+            # Complete once read after the day's release; before the
+            # release nothing new can have been added
+            if fetched_at >= release_at or now < release_at:
+                return releases
+
+        try:
+            return self._cube_flights.do(day, lambda: self._fetch_changed_cubes(day, now))
+        except Exception as e:
+            print(f"[WARN] Could not read Stats Canada changed-cube list for {day}: {str(e)}")
+            return None
+
+    def _fetch_changed_cubes(self, day: date, now: datetime) -> Dict[str, Optional[datetime]]:
+        """
+        Request a day's changed-cube list and store it.
+
+        Args:
+            day: Release date (Stats Canada local time)
+            now: Time the list is requested at (Stats Canada local time)
+
+        Returns:
+            Dictionary of product ID to release time
+        """
+        cubes = self._statscan_service().get_changed_cubes_list(day.isoformat())
+
+        releases = {}
+        for cube in cubes:
+            release_time = None
+            try:
+                release_time = datetime.fromisoformat(str(cube.get("releaseTime")))
+                release_time = release_time.replace(tzinfo=None)
+            except ValueError:
+                pass
+            releases[str(cube.get("productId"))] = release_time
+
+        with self._cubes_lock:
+            self._changed_cubes[day] = (releases, now)
+
+            # Only days within the lookback window are ever asked for again
+            oldest = now.date() - timedelta(days=STATSCAN_CHANGE_LOOKBACK_DAYS + 1)
+            for old_day in [d for d in self._changed_cubes if d < oldest]:
+                del self._changed_cubes[old_day]
+
+        return releases
@@ -0,0 +1,77 @@
+"""
+Per-key single-flight execution for concurrent cache misses.
+
+When several Streamlit sessions miss on the same (source, source_id) at the
+same time, only the first caller runs the fetch; the others wait on the same
+future and receive the same result (or the same exception).
+"""
+
+import threading
+from concurrent.futures import Future
+from typing import Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share a key into one execution.
+
+    Example:
+        >>> flights = SingleFlight()
+        >>> data = flights.do(("fred", "GDP"), lambda: fetch_gdp())
+    """
+
+    def __init__(self):
+        """Initialize with no calls in flight."""
+        self._lock = threading.Lock()
+        self._inflight: Dict[Hashable, Future] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """
+        Run fn once per key among concurrent callers.
+
+        Args:
+            key: Identity of the work (e.g. (source, source_id))
+            fn: Work to run if no call for this key is in flight
+
+        Returns:
+            Result of fn, shared by every caller that joined the flight
+
+        Raises:
+            Exception: Whatever fn raised, re-raised in every waiting caller
+        """
+        with self._lock:
+            future = self._inflight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._inflight[key] = future
+
+        if not is_leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def is_inflight(self, key: Hashable) -> bool:
+        """
+        Check whether a call for key is currently running.
+
+        Args:
+            key: Identity of the work
+
+        Returns:
+            True if a leader is executing work for this key
+        """
+        with self._lock:
+            return key in self._inflight
@@ -0,0 +1,80 @@
+"""
+Comparison of dataset versions.
+
+Revised series (GDP, payrolls) change between vintages. FirebaseService
+retains the last KEEP_VERSIONS files per dataset, so two vintages can be
+compared from stored Parquet (see CacheManager.diff_versions) without
+refetching from upstream.
+"""
+
+import polars as pl
+
+# Status values in diff output
+ADDED = "added"
+REMOVED = "removed"
+CHANGED = "changed"
+
+
+def diff_frames(
+    old: pl.DataFrame,
+    new: pl.DataFrame,
+    key: str = "date"
+) -> pl.DataFrame:
+    """
+    Get the rows that differ between two versions of a dataset.
+
+    Rows are matched on key. Columns present in only one version are
+    compared against nulls.
+
+    Args:
+        old: Earlier version
+        new: Later version
+        key: Column identifying a row (must be unique in each version)
+
+    Returns:
+        DataFrame sorted by key with the key, a "status" column ("added",
+        "removed" or "changed") and "{column}_old" / "{column}_new" for every
+        other column; unchanged rows are omitted
+
+    Example:
+        >>> changes = diff_frames(gdp_january, gdp_february)
+        >>> changes.filter(pl.col("status") == "changed")
+    """
+    value_columns = [c for c in new.columns if c != key]
+    value_columns += [c for c in old.columns if c != key and c not in value_columns]
+
+    def _aligned(frame: pl.DataFrame, suffix: str) -> pl.DataFrame:
+        return frame.select(
+            pl.col(key),
+            *[
+                (pl.col(c) if c in frame.columns else pl.lit(None)).alias(f"{c}_{suffix}")
+                for c in value_columns
+            ],
+            pl.lit(True).alias(f"_in_{suffix}")
+        )
+
+    joined = _aligned(old, "old").join(
+        _aligned(new, "new"), on=key, how="full", coalesce=True
+    )
+
+    changed = pl.any_horizontal(
+        [pl.col(f"{c}_old").ne_missing(pl.col(f"{c}_new")) for c in value_columns]
+    ) if value_columns else pl.lit(False)
+
+    status = (
+        pl.when(pl.col("_in_old").is_null()).then(pl.lit(ADDED))
+        .when(pl.col("_in_new").is_null()).then(pl.lit(REMOVED))
+        .when(changed).then(pl.lit(CHANGED))
+        .otherwise(None)
+    )
+
+    ordered = [key, "status"] + [
+        name for c in value_columns for name in (f"{c}_old", f"{c}_new")
+    ]
+
+    return (
+        joined.with_columns(status.alias("status"))
+        .filter(pl.col("status").is_not_null())
+        .select(ordered)
+        .sort(key)
+    )
@@ -0,0 +1,235 @@
+"""
+Cache warm-up job driven by the dataset registries.
+
+Walks the priority FRED series, Stats Canada tables and yfinance tickers
+and refreshes every cached dataset that is missing or close to expiry, so
+user sessions nearly always hit warm cache. Runs headless (no Streamlit
+server), e.g. from cron or a sidecar:
+
+    python -m src.data.warmup
+    python -m src.data.warmup --sources fred yfinance --priority 1 2
+    python -m src.data.warmup --force
+
+Credentials are read from .streamlit/secrets.toml in the working directory,
+the same as the app.
+"""
+
+import argparse
+import sys
+import time
+from typing import List, Optional, Sequence
+
+from src.data.cache_manager import CacheManager, FetchRequest
+from src.data.fred_datasets import get_priority_series
+from src.data.statscan_datasets import get_priority_tables, get_priority_tickers
+
+ALL_SOURCES = ["fred", "statscan", "yfinance"]
+
+# Rows fetched per Stats Canada table (matches the app's table loads)
+STATSCAN_WARMUP_PERIODS = 12
+
+
+def build_fred_requests(priorities: Sequence[int]) -> List[FetchRequest]:
+    """
+    Build warm-up requests for the FRED priority series.
+
+    Args:
+        priorities: Priority levels to include (1=high, 2=normal)
+
+    Returns:
+        List of FetchRequest objects
+    """
+    from src.services.fred_api import FredService
+
+    fred = FredService()
+    requests = []
+
+    for priority in priorities:
+        for config in get_priority_series(priority):
+            series_id = config.series_id
+            requests.append(FetchRequest(
+                source="fred",
+                source_id=series_id,
+                fetch_fn=lambda sid=series_id: fred.get_series(sid),
+                frequency=config.frequency,
+                metadata_fn=lambda sid=series_id: fred.get_series_metadata(sid),
+                # Daily series in the registry are Treasury yields, which are
+                # not revised, so only the latest observations are refetched
+                delta_fetch_fn=(
+                    (lambda since, sid=series_id: fred.get_series(sid, observation_start=since.isoformat()))
+                    if config.frequency == "daily" else None
+                )
+            ))
+
+    return requests
+
+
+def build_statscan_requests(priorities: Sequence[int]) -> List[FetchRequest]:
+    """
+    Build warm-up requests for the Stats Canada priority tables.
+
+    Tables without default_vectors cannot be fetched and are skipped.
+
+    Args:
+        priorities: Priority levels to include (1=high, 2=normal)
+
+    Returns:
+        List of FetchRequest objects
+    """
+    from src.services.statscan_api import StatsCanService
+
+    sc_service = StatsCanService()
+    requests = []
+
+    for priority in priorities:
+        for config in get_priority_tables(priority):
+            if not config.default_vectors:
+                print(f"[SKIP] statscan:{config.product_id} has no default vectors")
+                continue
+
+            requests.append(FetchRequest(
+                source="statscan",
+                source_id=config.product_id,
+                fetch_fn=lambda c=config: sc_service.get_table_data(
+                    c.product_id,
+                    latest_n_periods=STATSCAN_WARMUP_PERIODS,
+                    vectors=c.default_vectors
+                ),
+                frequency=config.frequency,
+                metadata_fn=lambda c=config: {
+                    "product_id": c.product_id,
+                    "title": c.name,
+                    "vectors": c.default_vectors
+                }
+            ))
+
+    return requests
+
+
+def build_yfinance_requests(priorities: Sequence[int]) -> List[FetchRequest]:
+    """
+    Build warm-up requests for the yfinance priority tickers.
+
+    Args:
+        priorities: Priority levels to include (1=high, 2=normal)
+
+    Returns:
+        List of FetchRequest objects
+    """
+    from src.services.yfinance_service import YFinanceService
+
+    yf_service = YFinanceService()
+    requests = []
+
+    for priority in priorities:
+        for config in get_priority_tickers(priority):
+            ticker = config.ticker
+            requests.append(FetchRequest(
+                source="yfinance",
+                source_id=ticker,
+                fetch_fn=lambda t=ticker, i=config.interval: yf_service.get_ticker_history(
+                    t, period="max", interval=i
+                ),
+                frequency=config.interval,
+                metadata_fn=lambda t=ticker, n=config.name: {"ticker": t, "name": n},
+                # Index levels are not dividend-adjusted, so past bars never
+                # change and only recent bars need to be refetched
+                delta_fetch_fn=(
+                    (lambda since, t=ticker, i=config.interval: yf_service.get_ticker_history_since(t, since, interval=i))
+                    if config.category in ("index", "volatility") else None
+                )
+            ))
+
+    return requests
+
+
+def build_warmup_requests(
+    sources: Sequence[str] = ALL_SOURCES,
+    priorities: Sequence[int] = (1,)
+) -> List[FetchRequest]:
+    """
+    Build warm-up requests from the dataset registries.
+
+    Args:
+        sources: Data sources to include ("fred", "statscan", "yfinance")
+        priorities: Priority levels to include (1=high, 2=normal)
+
+    Returns:
+        List of FetchRequest objects
+    """
+    builders = {
+        "fred": build_fred_requests,
+        "statscan": build_statscan_requests,
+        "yfinance": build_yfinance_requests
+    }
+
+    requests = []
+    for source in sources:
+        requests.extend(builders[source](priorities))
+    return requests
+
+
+def print_report(results: List[dict], elapsed: float) -> None:
+    """Print per-dataset timings and a summary line."""
+    print()
+    print(f"{'DATASET':<28} {'STATUS':<10} {'ROWS':>8} {'SECONDS':>8}")
+    for result in results:
+        name = f"{result['source']}:{result['source_id']}"
+        print(f"{name:<28} {result['status']:<10} {result['rows']:>8} {result['seconds']:>8.2f}")
+        if result["error"]:
+            print(f"    {result['error']}")
+
+    counts = {status: 0 for status in ("refreshed", "fresh", "error")}
+    for result in results:
+        counts[result["status"]] += 1
+
+    print()
+    print(
+        f"Warm-up finished in {elapsed:.2f}s: {counts['refreshed']} refreshed, "
+        f"{counts['fresh']} already fresh, {counts['error']} failed"
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the warm-up job.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv)
+
+    Returns:
+        Exit code: 0 if every dataset is warm, 1 if any refresh failed
+    """
+    parser = argparse.ArgumentParser(description="Refresh cached datasets before they expire.")
+    parser.add_argument(
+        "--sources", nargs="+", choices=ALL_SOURCES, default=ALL_SOURCES,
+        help="Data sources to warm (default: all)"
+    )
+    parser.add_argument(
+        "--priority", nargs="+", type=int, default=[1],
+        help="Registry priority levels to warm (default: 1)"
+    )
+    parser.add_argument(
+        "--force", action="store_true",
+        help="Refresh every dataset regardless of age"
+    )
+    args = parser.parse_args(argv)
+
+    start_time = time.perf_counter()
+
+    cache = CacheManager()
+    requests = build_warmup_requests(args.sources, args.priority)
+    print(f"Warming {len(requests)} datasets ({', '.join(args.sources)}; priority {args.priority})")
+
+    results = cache.warm(requests, force=args.force)
+
+    # Write-behind saves must land before the process exits
+    cache.flush_writes()
+    cache.firebase.log_writer.flush()
+
+    print_report(results, time.perf_counter() - start_time)
+    return 1 if any(result["status"] == "error" for result in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
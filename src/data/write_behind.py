@@ -0,0 +1,211 @@
+"""
+Write-behind queue for cache persistence.
+
+After a fetch, CacheManager can hand the Cloud Storage upload, metadata write,
+version cleanup and audit log to this queue and return the fetched frame
+immediately. Writes then run on a small pool of background workers.
+
+Guarantees:
+- Per-key ordering: every write for a key goes to the same worker, in order
+- Backpressure: each worker's queue is bounded; submit() blocks when full
+- Retry: failed writes are retried with exponential backoff
+- Flush: flush() waits for queued writes; close() runs at interpreter exit
+"""
+
+import atexit
+import queue
+import threading
+import time
+import zlib
+from typing import Callable, Hashable, List, Optional
+
+
+class _WriteTask:
+    """A queued write with its key and a description for log messages."""
+
+    __slots__ = ("key", "fn", "description")
+
+    def __init__(self, key: Hashable, fn: Callable[[], None], description: str):
+        self.key = key
+        self.fn = fn
+        self.description = description
+
+
+_STOP = object()
+
+
+class WriteBehindQueue:
+    """
+    Bounded, per-key ordered background write queue.
+
+    Example:
+        >>> writes = WriteBehindQueue(workers=2, max_pending=64)
+        >>> writes.submit(("fred", "GDP"), lambda: save(...), "fred:GDP")
+        >>> writes.flush()
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        max_pending: int,
+        max_retries: int = 3,
+        retry_delay_seconds: float = 1.0
+    ):
+        """
+        Start the worker threads.
+
+        Args:
+            workers: Number of worker threads (keys are spread across them)
+            max_pending: Max queued writes per worker before submit() blocks
+            max_retries: Retries after the first failed attempt
+            retry_delay_seconds: Delay before the first retry (doubles each time)
+        """
+        self.max_retries = max_retries
+        self.retry_delay_seconds = retry_delay_seconds
+
+        self._queues: List[queue.Queue] = [queue.Queue(maxsize=max_pending) for _ in range(workers)]
+        self._lock = threading.Lock()
+        self._closed = False
+        self.completed = 0
+        self.failed = 0
+        self.retries = 0
+
+        self._threads = []
+        for index, task_queue in enumerate(self._queues):
+            thread = threading.Thread(
+                target=self._run,
+                args=(task_queue,),
+                name=f"cache-write-{index}",
+                daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+        atexit.register(self.close)
+
+    def _queue_for(self, key: Hashable) -> queue.Queue:
+        """Route a key to its worker; stable across calls so writes stay ordered."""
+        index = zlib.crc32(repr(key).encode("utf-8")) % len(self._queues)
+        return self._queues[index]
+
+    def submit(
+        self,
+        key: Hashable,
+        fn: Callable[[], None],
+        description: Optional[str] = None
+    ) -> None:
+        """
+        Queue a write, blocking while the key's worker queue is full.
+
+        If the queue has been closed, the write runs synchronously instead.
+
+        Args:
+            key: Ordering key (e.g. (source, source_id))
+            fn: Write to perform; raising an exception triggers a retry
+            description: Label for log messages (defaults to the key)
+        """
+        task = _WriteTask(key, fn, description or str(key))
+
+        with self._lock:
+            closed = self._closed
+        if closed:
+            self._execute(task)
+            return
+
+        self._queue_for(key).put(task)
+
+    def _run(self, task_queue: queue.Queue) -> None:
+        """Worker loop: execute tasks in order until the stop marker."""
+        while True:
+            task = task_queue.get()
+            try:
+                if task is _STOP:
+                    return
+                self._execute(task)
+            finally:
+                task_queue.task_done()
+
+    def _execute(self, task: _WriteTask) -> None:
+        """Run a task with exponential-backoff retries."""
+        delay = self.retry_delay_seconds
+        for attempt in range(self.max_retries + 1):
+            try:
+                task.fn()
+            except Exception as e:
+                if attempt == self.max_retries:
+                    with self._lock:
+                        self.failed += 1
+                    print(f"[ERROR] Background write failed for {task.description} "
+                          f"after {attempt + 1} attempts: {str(e)}")
+                    return
+
+                with self._lock:
+                    self.retries += 1
+                print(f"[WARN] Background write failed for {task.description}, "
+                      f"retrying in {delay:.1f}s: {str(e)}")
+                time.sleep(delay)
+                delay *= 2
+            else:
+                with self._lock:
+                    self.completed += 1
+                return
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued write has finished.
+
+        Args:
+            timeout: Max seconds to wait (None = no limit)
+
+        Returns:
+            True if the queue drained, False on timeout
+        """
+        deadline = None if timeout is None else time.time() + timeout
+        for task_queue in self._queues:
+            while task_queue.unfinished_tasks:
+                if deadline is not None and time.time() >= deadline:
+                    return False
+                time.sleep(0.05)
+        return True
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Flush pending writes and stop the workers (called at interpreter exit).
+
+        Args:
+            timeout: Max seconds to wait for pending writes (None = no limit)
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+
+        pending = self.pending()
+        if pending:
+            print(f"[WAIT] Flushing {pending} pending cache writes")
+
+        self.flush(timeout)
+        for task_queue in self._queues:
+            try:
+                task_queue.put_nowait(_STOP)
+            except queue.Full:
+                pass  # Timed out with writes pending; daemon workers die with the process
+
+    def pending(self) -> int:
+        """Number of writes queued or in progress."""
+        return sum(task_queue.unfinished_tasks for task_queue in self._queues)
+
+    def get_stats(self) -> dict:
+        """
+        Get write queue statistics.
+
+        Returns:
+            Dictionary with pending, completed, failed and retried write counts
+        """
+        with self._lock:
+            return {
+                "pending": self.pending(),
+                "completed": self.completed,
+                "failed": self.failed,
+                "retries": self.retries
+            }
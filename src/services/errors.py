@@ -0,0 +1,17 @@
+"""
+Exceptions shared by the data source services.
+"""
+
+
+class DataNotFoundError(ValueError):
+    """
+    The requested dataset does not exist upstream or has no data.
+
+    Raised for unknown tickers, invalid FRED series IDs and Stats Canada
+    vectors that return nothing. Unlike transient failures (timeouts, rate
+    limits), retrying soon gives the same answer, so CacheManager remembers
+    it for a short time (see NEGATIVE_CACHE_TTL_SECONDS).
+
+    Subclasses ValueError, so existing ``except ValueError`` handlers still
+    catch it.
+    """
@@ -8,24 +8,50 @@ Architecture:
 This respects Firestore's 1MB document size limit by storing only metadata
 in Firestore and large data files in Cloud Storage.
 
+Firestore and Cloud Storage are accessed through a StorageBackend, so the
+same service can run against local SQLite + files (see storage_backends.py).
+
 Supports multiple data sources: FRED, yfinance, Stats Canada
 """
 
-import streamlit as st
-from google.cloud import firestore, storage
-from google.oauth2 import service_account
 import polars as pl
-from datetime import datetime
-from typing import Optional, Dict, List, Any, Literal
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional, Dict, List, Any, Literal, Sequence, Tuple, Union
+import hashlib
 import io
-
-from src.config.settings import get_firebase_config
+import threading
+import time
+
+from src.config.settings import get_cache_config
+from src.data.local_cache import LocalParquetCache
+from src.data.metrics import get_cache_metrics, metrics_source
+from src.data.projection import (
+    DateRange,
+    apply_projection,
+    as_date,
+    read_parquet_projected,
+    scan_projected
+)
 from src.config.constants import (
     get_collection_names,
     get_storage_prefix,
     KEEP_VERSIONS,
-    DATA_FILE_FORMAT
+    DATA_FILE_FORMAT,
+    PARQUET_ROW_GROUP_SIZE,
+    REMOTE_PUSHDOWN_MIN_BYTES,
+    PARTITIONED_FREQUENCIES,
+    PARTITION_DIR,
+    BATCH_LOAD_WORKERS,
+    UPDATE_LOGS_COLLECTION,
+    UPDATE_LOGS_MIGRATIONS_COLLECTION,
+    DATA_SOURCES,
+    CACHE_STATS_COLLECTION,
+    CACHE_STATS_DOC_ID,
+    CACHE_STATS_INITIALIZED_FIELD
 )
+from src.services.log_writer import BufferedLogWriter
+from src.services.storage_backends import StorageBackend, create_storage_backend
 
 DataSource = Literal["fred", "yfinance", "statscan"]
 
@@ -38,35 +64,41 @@ class FirebaseService:
     Supports: FRED, yfinance, Stats Canada
     """
 
-    def __init__(self):
-        """Initialize Firestore and Cloud Storage clients using credentials from st.secrets."""
+    def __init__(self, backend: Optional[StorageBackend] = None):
+        """
+        Initialize the storage backend selected in settings.
+
+        Args:
+            backend: Storage backend to use instead of the configured one
+                    (e.g. a LocalStorageBackend for benchmarks)
+        """
         try:
-            # Load Firebase configuration from secrets
-            config = get_firebase_config()
+            self.backend = backend or create_storage_backend()
+        except Exception as e:
+            raise Exception(f"Failed to initialize Firebase service: {str(e)}")
 
-            # Create credentials
-            credentials = service_account.Credentials.from_service_account_info(
-                config["credentials"]
-            )
+        # Local on-disk tier checked before Cloud Storage downloads
+        cache_config = get_cache_config()
+        self.local_cache = LocalParquetCache(
+            root_dir=cache_config["local_dir"],
+            max_bytes=cache_config["local_max_bytes"]
+        )
 
-            # Initialize Firestore client
-            self.db = firestore.Client(
-                credentials=credentials,
-                project=config["project_id"]
-            )
+        # Update logs are buffered and written in batches
+        self.log_writer = BufferedLogWriter(self.backend, UPDATE_LOGS_COLLECTION)
 
-            # Initialize Cloud Storage client
-            self.storage_client = storage.Client(
-                credentials=credentials,
-                project=config["project_id"]
-            )
+        # Latency, tier and byte instrumentation shared with CacheManager
+        self.metrics = get_cache_metrics()
 
-            # Get bucket
-            self.bucket_name = config["storage_bucket"]
-            self.bucket = self.storage_client.bucket(self.bucket_name)
+    @property
+    def db(self):
+        """Raw Firestore client for code outside the cache layer (None on the local backend)."""
+        return getattr(self.backend, "db", None)
 
-        except Exception as e:
-            raise Exception(f"Failed to initialize Firebase service: {str(e)}")
+    @property
+    def bucket(self):
+        """Raw Cloud Storage bucket (None on the local backend)."""
+        return getattr(self.backend, "bucket", None)
 
     # =========================================================================
     # METADATA OPERATIONS (Firestore)
@@ -88,14 +120,30 @@ class FirebaseService:
                       Must include: storage_path, row_count, columns
         """
         collections = get_collection_names(source)
-        doc_ref = self.db.collection(collections["metadata"]).document(source_id)
 
         # Add source and timestamp
         metadata["source"] = source
         metadata["source_id"] = source_id
-        metadata["last_updated"] = firestore.SERVER_TIMESTAMP
+        metadata["last_updated"] = self.backend.SERVER_TIMESTAMP
 
-        doc_ref.set(metadata, merge=True)
+        self.backend.set_document(collections["metadata"], source_id, metadata)
+
+    def touch_metadata(
+        self,
+        source: DataSource,
+        source_id: str
+    ) -> None:
+        """
+        Set a dataset's last_updated to now without changing anything else.
+
+        Used when the source has released nothing new, to restart the
+        freshness window of the cached data.
+
+        Args:
+            source: Data source
+            source_id: Source-specific identifier
+        """
+        self.save_metadata(source, source_id, {})
 
     def get_metadata(
         self,
@@ -113,12 +161,30 @@ class FirebaseService:
             Metadata dictionary or None if not found
         """
         collections = get_collection_names(source)
-        doc_ref = self.db.collection(collections["metadata"]).document(source_id)
-        doc = doc_ref.get()
+        with self.metrics.timer("metadata_read", source):
+            return self.backend.get_document(collections["metadata"], source_id)
 
-        if doc.exists:
-            return doc.to_dict()
-        return None
+    def get_metadata_many(
+        self,
+        keys: List[Tuple[DataSource, str]]
+    ) -> Dict[Tuple[DataSource, str], Optional[Dict[str, Any]]]:
+        """
+        Retrieve metadata for several datasets in one Firestore round trip.
+
+        Args:
+            keys: List of (source, source_id) pairs
+
+        Returns:
+            Dictionary mapping each (source, source_id) to its metadata,
+            or None if the document does not exist
+        """
+        doc_keys = {
+            key: (get_collection_names(key[0])["metadata"], key[1])
+            for key in dict.fromkeys(keys)
+        }
+        with self.metrics.timer("metadata_read", metrics_source(list(doc_keys))):
+            documents = self.backend.get_documents(list(doc_keys.values()))
+        return {key: documents.get(doc_key) for key, doc_key in doc_keys.items()}
 
     def get_all_metadata(
         self,
@@ -135,26 +201,118 @@ class FirebaseService:
         """
         if source:
             collections = get_collection_names(source)
-            docs = self.db.collection(collections["metadata"]).stream()
-        else:
-            # Get all sources
-            all_docs = []
-            for src in ["fred", "yfinance", "statscan"]:
-                collections = get_collection_names(src)
-                docs = self.db.collection(collections["metadata"]).stream()
-                all_docs.extend([{**doc.to_dict(), "source": src} for doc in docs])
-            return all_docs
+            return self.backend.list_documents(collections["metadata"])
 
-        return [{**doc.to_dict()} for doc in docs]
+        # Get all sources
+        all_docs = []
+        for src in ["fred", "yfinance", "statscan"]:
+            collections = get_collection_names(src)
+            docs = self.backend.list_documents(collections["metadata"])
+            all_docs.extend([{**doc, "source": src} for doc in docs])
+        return all_docs
 
     def delete_metadata(
         self,
         source: DataSource,
-        source_id: str
+        source_id: str,
+        metadata: Optional[Dict[str, Any]] = None
     ) -> None:
-        """Delete metadata from Firestore."""
+        """
+        Delete metadata from Firestore and remove the dataset from the cache stats.
+
+        Args:
+            source: Data source
+            source_id: Source-specific identifier
+            metadata: The metadata being deleted, if the caller already has it
+                      (skips a Firestore read)
+        """
         collections = get_collection_names(source)
-        self.db.collection(collections["metadata"]).document(source_id).delete()
+
+        if metadata is None:
+            metadata = self.get_metadata(source, source_id)
+
+        self.backend.delete_document(collections["metadata"], source_id)
+        self._update_cache_stats(source, metadata, None)
+
+    # =========================================================================
+    # REFRESH LEASES (Firestore)
+    # =========================================================================
+
+    def acquire_refresh_lease(
+        self,
+        source: DataSource,
+        source_id: str,
+        owner: str,
+        ttl_seconds: int
+    ) -> bool:
+        """
+        Try to take the refresh lease recorded in a dataset's metadata doc.
+
+        The lease lets one app replica refetch a stale dataset while the
+        others wait for its result. A lease whose expiry has passed is treated
+        as free, so a crashed holder cannot block refreshes.
+
+        Args:
+            source: Data source
+            source_id: Source-specific identifier
+            owner: Unique identifier of the caller (process/replica)
+            ttl_seconds: Lease lifetime in seconds
+
+        Returns:
+            True if the caller now holds the lease, False if another owner does
+        """
+        collections = get_collection_names(source)
+
+        def _acquire(current: Optional[Dict[str, Any]]):
+            lease = (current or {}).get("refresh_lease")
+            now = datetime.now(timezone.utc)
+
+            if lease and lease.get("owner") != owner:
+                expires_at = lease.get("expires_at")
+                if expires_at and expires_at > now:
+                    return None, False
+
+            return {
+                "refresh_lease": {
+                    "owner": owner,
+                    "expires_at": now + timedelta(seconds=ttl_seconds)
+                }
+            }, True
+
+        try:
+            return self.backend.run_transaction(collections["metadata"], source_id, _acquire)
+        except Exception as e:
+            # The lease is only an optimization; never block a refresh on it
+            print(f"[WARN] Could not acquire refresh lease for {source}:{source_id}: {str(e)}")
+            return True
+
+    def release_refresh_lease(
+        self,
+        source: DataSource,
+        source_id: str,
+        owner: str
+    ) -> None:
+        """
+        Release a refresh lease if it is still held by owner.
+
+        Args:
+            source: Data source
+            source_id: Source-specific identifier
+            owner: Identifier passed to acquire_refresh_lease
+        """
+        collections = get_collection_names(source)
+
+        def _release(current: Optional[Dict[str, Any]]):
+            lease = (current or {}).get("refresh_lease")
+            if lease and lease.get("owner") == owner:
+                return {"refresh_lease": self.backend.DELETE_FIELD}, None
+            return None, None
+
+        try:
+            self.backend.run_transaction(collections["metadata"], source_id, _release)
+        except Exception as e:
+            # Expiry frees the lease anyway
+            print(f"[WARN] Could not release refresh lease for {source}:{source_id}: {str(e)}")
 
     # =========================================================================
     # DATA OPERATIONS (Cloud Storage)
@@ -190,6 +348,202 @@ class FirebaseService:
 
         return f"{prefix}/{source_id}/{timestamp}.{DATA_FILE_FORMAT}"
 
+    def _generate_partition_path(
+        self,
+        source: DataSource,
+        source_id: str,
+        partition: str,
+        timestamp: Optional[str] = None
+    ) -> str:
+        """
+        Generate storage path for one partition of a partitioned dataset.
+
+        Args:
+            source: Data source
+            source_id: Source-specific identifier
+            partition: Partition key (calendar year, e.g. "2024")
+            timestamp: Optional timestamp (YYYYMMDD format). If None, uses current date.
+
+        Returns:
+            Storage path string
+        """
+        if timestamp is None:
+            timestamp = datetime.now().strftime("%Y%m%d")
+
+        return (
+            f"{get_storage_prefix(source)}/{source_id}/{PARTITION_DIR}/"
+            f"{partition}/{timestamp}.{DATA_FILE_FORMAT}"
+        )
+
+    @staticmethod
+    def get_storage_paths(metadata: Dict[str, Any]) -> List[str]:
+        """
+        Get every data file backing the current version of a dataset.
+
+        Args:
+            metadata: Metadata dictionary from Firestore
+
+        Returns:
+            One path for single-file datasets, one per partition (oldest
+            first) for partitioned datasets, or an empty list if none
+        """
+        if metadata.get("layout") == "partitioned":
+            partitions = metadata.get("partitions") or {}
+            return [partitions[key]["storage_path"] for key in sorted(partitions)]
+
+        storage_path = metadata.get("storage_path")
+        return [storage_path] if storage_path else []
+
+    def _upload_data(
+        self,
+        source: DataSource,
+        storage_path: str,
+        data: pl.DataFrame
+    ) -> Tuple[str, bytes]:
+        """
+        Serialize a DataFrame to Parquet and upload it to Cloud Storage.
+
+        Args:
+            source: Data source (for metrics)
+            storage_path: Destination path in Cloud Storage
+            data: Polars DataFrame to store
+
+        Returns:
+            Tuple of (storage generation, uploaded Parquet bytes)
+        """
+        # Convert DataFrame to Parquet bytes; small row groups with statistics
+        # let projected reads skip row groups outside a date range
+        buffer = io.BytesIO()
+        data.write_parquet(
+            buffer,
+            row_group_size=PARQUET_ROW_GROUP_SIZE,
+            statistics=True
+        )
+        data_bytes = buffer.getvalue()
+
+        # Upload to Cloud Storage
+        with self.metrics.timer("upload", source):
+            generation = self.backend.put_blob(
+                storage_path, data_bytes, content_type=f"application/{DATA_FILE_FORMAT}"
+            )
+        self.metrics.add_bytes(source, "uploaded", len(data_bytes))
+
+        return generation, data_bytes
+
+    def _download_data_bytes(
+        self,
+        storage_path: str,
+        source: str = "unknown"
+    ) -> Optional[bytes]:
+        """
+        Download raw file bytes from Cloud Storage in a single request.
+
+        Args:
+            storage_path: Path to file in Cloud Storage
+            source: Data source (for metrics)
+
+        Returns:
+            File contents or None if the blob does not exist
+        """
+        with self.metrics.timer("blob_download", source):
+            data_bytes = self.backend.get_blob(storage_path)
+        if data_bytes is not None:
+            self.metrics.add_bytes(source, "downloaded", len(data_bytes))
+        return data_bytes
+
+    @staticmethod
+    def _source_from_path(storage_path: str) -> str:
+        """
+        Get the data source a storage path belongs to, from its prefix.
+
+        Args:
+            storage_path: Path to file in Cloud Storage
+
+        Returns:
+            Data source, or "unknown" if the prefix matches none
+        """
+        prefix = storage_path.split("/", 1)[0]
+        for src in DATA_SOURCES:
+            if get_storage_prefix(src) == prefix:
+                return src
+        return "unknown"
+
+    def _read_projected_from_storage(
+        self,
+        storage_path: str,
+        columns: Optional[Sequence[str]] = None,
+        date_range: Optional[DateRange] = None
+    ) -> Optional[pl.DataFrame]:
+        """
+        Read a projection of a Parquet blob using ranged Cloud Storage reads.
+
+        Only the footer and the column chunks of row groups overlapping the
+        date range are fetched, instead of the whole file.
+
+        Args:
+            storage_path: Path to file in Cloud Storage
+            columns: Columns to keep (None = all)
+            date_range: Inclusive (start, end) date range on "date"
+
+        Returns:
+            Projected DataFrame or None if the blob does not exist
+        """
+        blob_reader = self.backend.open_blob(storage_path)
+        if blob_reader is None:
+            return None
+
+        with blob_reader:
+            return read_parquet_projected(blob_reader, columns, date_range)
+
+    @staticmethod
+    def get_storage_generation(metadata: Dict[str, Any]) -> str:
+        """
+        Get the storage generation that identifies the current data file.
+
+        Older metadata documents predate the storage_generation field, so the
+        last_updated timestamp is used instead; it changes on every save too.
+
+        Args:
+            metadata: Metadata dictionary from Firestore
+
+        Returns:
+            Generation string used to key the local cache tier
+        """
+        generation = metadata.get("storage_generation")
+        if generation:
+            return str(generation)
+
+        last_updated = metadata.get("last_updated")
+        if hasattr(last_updated, 'timestamp'):
+            return f"t{int(last_updated.timestamp() * 1000)}"
+        return "unknown"
+
+    @staticmethod
+    def compute_content_hash(data: pl.DataFrame, row_hashes: Optional[pl.Series] = None) -> str:
+        """
+        Compute a stable hash of a DataFrame's schema and values.
+
+        Parquet bytes are not used since they embed writer metadata. Rows are
+        hashed natively by Polars and the digest covers them in order, so no
+        text serialization is needed. Row hashes are only stable within one
+        Polars version; after an upgrade each dataset is re-uploaded once.
+
+        Args:
+            data: Polars DataFrame
+            row_hashes: data.hash_rows() if the caller already computed it
+                      (e.g. a slice of the full dataset's row hashes)
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        if row_hashes is None:
+            row_hashes = data.hash_rows()
+
+        digest = hashlib.sha256()
+        digest.update(repr(list(data.schema.items())).encode("utf-8"))
+        digest.update(row_hashes.to_numpy().tobytes())
+        return digest.hexdigest()
+
     def save_data_to_storage(
         self,
         source: DataSource,
@@ -212,42 +566,32 @@ class FirebaseService:
         # Generate storage path
         storage_path = self._generate_storage_path(source, source_id, timestamp)
 
-        # Convert DataFrame to Parquet bytes
-        buffer = io.BytesIO()
-        data.write_parquet(buffer)
-        buffer.seek(0)
-
-        # Upload to Cloud Storage
-        blob = self.bucket.blob(storage_path)
-        blob.upload_from_file(buffer, content_type=f"application/{DATA_FILE_FORMAT}")
+        self._upload_data(source, storage_path, data)
 
         return storage_path
 
     def load_data_from_storage(
         self,
-        storage_path: str
+        storage_path: str,
+        source: Optional[DataSource] = None
     ) -> Optional[pl.DataFrame]:
         """
         Load DataFrame from Cloud Storage.
 
         Args:
             storage_path: Path to file in Cloud Storage
+            source: Data source (for metrics; derived from the path if None)
 
         Returns:
             Polars DataFrame or None if not found
         """
         try:
-            blob = self.bucket.blob(storage_path)
-
-            if not blob.exists():
+            data_bytes = self._download_data_bytes(storage_path, source or self._source_from_path(storage_path))
+            if data_bytes is None:
                 return None
 
-            # Download to bytes
-            data_bytes = blob.download_as_bytes()
-            buffer = io.BytesIO(data_bytes)
-
             # Read Parquet file
-            return pl.read_parquet(buffer)
+            return pl.read_parquet(io.BytesIO(data_bytes))
 
         except Exception as e:
             print(f"Error loading data from storage: {str(e)}")
@@ -258,9 +602,7 @@ class FirebaseService:
         storage_path: str
     ) -> None:
         """Delete data file from Cloud Storage."""
-        blob = self.bucket.blob(storage_path)
-        if blob.exists():
-            blob.delete()
+        self.backend.delete_blob(storage_path)
 
     def list_data_files(
         self,
@@ -283,8 +625,7 @@ class FirebaseService:
         else:
             prefix = f"{prefix}/"
 
-        blobs = self.bucket.list_blobs(prefix=prefix)
-        return [blob.name for blob in blobs]
+        return [blob.name for blob in self.backend.list_blobs(prefix=prefix)]
 
     # =========================================================================
     # COMBINED OPERATIONS
@@ -295,34 +636,109 @@ class FirebaseService:
         source: DataSource,
         source_id: str,
         data: pl.DataFrame,
-        metadata: Dict[str, Any]
+        metadata: Dict[str, Any],
+        previous_metadata: Optional[Dict[str, Any]] = None,
+        changed_since: Optional[date] = None
     ) -> Dict[str, Any]:
         """
         Complete save operation: store data in Cloud Storage and metadata in Firestore.
 
+        Daily series (metadata "frequency" in PARTITIONED_FREQUENCIES) are
+        stored as one file per calendar year with a partition manifest in the
+        metadata doc; everything else is stored as a single file.
+
+        If the data is identical to the stored version (same content hash),
+        nothing is uploaded, cleaned up or logged: the metadata doc is only
+        updated so last_updated restarts the freshness window.
+
         Args:
             source: Data source
             source_id: Source-specific identifier
             data: Polars DataFrame
             metadata: Source-specific metadata (will be augmented with storage info)
+            previous_metadata: Metadata of the version being replaced, if the
+                      caller already has it (skips a Firestore read)
+            changed_since: For partitioned data, the earliest date that may
+                      differ from the previous version (e.g. the start of an
+                      incremental fetch). Earlier partitions are kept as-is
+                      instead of being re-uploaded. None rewrites every partition.
 
         Returns:
-            Dictionary with status and details
+            Dictionary with status and details ("unchanged" is True when the
+            upload was skipped because the content hash matched)
         """
         try:
-            # Save data to Cloud Storage
-            storage_path = self.save_data_to_storage(source, source_id, data)
+            partitioned = self._should_partition(data, metadata)
+            # Hashed once; partition hashes reuse the same row hashes
+            row_hashes = data.hash_rows()
+            content_hash = self.compute_content_hash(data, row_hashes)
+
+            if previous_metadata is None:
+                previous_metadata = self.get_metadata(source, source_id)
+
+            if (
+                previous_metadata
+                and previous_metadata.get("content_hash") == content_hash
+                and previous_metadata.get("layout", "single") == ("partitioned" if partitioned else "single")
+                and previous_metadata.get("storage_path")
+            ):
+                # Same data as the stored version: only bump last_updated
+                self.save_metadata(source, source_id, metadata)
+                return {
+                    "status": "success",
+                    "storage_path": previous_metadata["storage_path"],
+                    "row_count": len(data),
+                    "unchanged": True
+                }
 
-            # Augment metadata with storage information
-            metadata["storage_path"] = storage_path
-            metadata["row_count"] = len(data)
-            metadata["columns"] = data.columns
+            metadata["content_hash"] = content_hash
 
-            # Save metadata to Firestore
-            self.save_metadata(source, source_id, metadata)
+            if partitioned:
+                storage_path, rewritten, removed = self._save_partitions(
+                    source, source_id, data, metadata, previous_metadata, changed_since, row_hashes
+                )
 
-            # Clean up old versions
-            self.cleanup_old_versions(source, source_id, keep_latest=KEEP_VERSIONS)
+                # Save metadata to Firestore. Writes merge into the stored doc,
+                # so removed partitions must be deleted from the manifest
+                # explicitly or they would outlive their deleted files.
+                self.save_metadata(source, source_id, {
+                    **metadata,
+                    "partitions": {
+                        **metadata["partitions"],
+                        **{key: self.backend.DELETE_FIELD for key in removed}
+                    }
+                })
+                self._update_cache_stats(source, previous_metadata, metadata)
+
+                # Clean up old versions of the partitions that were rewritten
+                self.cleanup_old_versions(
+                    source, source_id, keep_latest=KEEP_VERSIONS, partitions=rewritten
+                )
+                self._delete_previous_layout(source, source_id, previous_metadata, "partitioned")
+            else:
+                # Save data to Cloud Storage
+                storage_path = self._generate_storage_path(source, source_id)
+                generation, data_bytes = self._upload_data(source, storage_path, data)
+
+                # Augment metadata with storage information
+                metadata["layout"] = "single"
+                metadata["partitions"] = self.backend.DELETE_FIELD
+                metadata["storage_path"] = storage_path
+                metadata["storage_generation"] = generation
+                metadata["row_count"] = len(data)
+                metadata["columns"] = data.columns
+                metadata["size_bytes"] = len(data_bytes)
+
+                # Save metadata to Firestore
+                self.save_metadata(source, source_id, metadata)
+                self._update_cache_stats(source, previous_metadata, metadata)
+
+                # Keep a local copy so the next load skips the download
+                self.local_cache.put_bytes(source, source_id, storage_path, generation, data_bytes)
+
+                # Clean up old versions
+                self.cleanup_old_versions(source, source_id, keep_latest=KEEP_VERSIONS)
+                self._delete_previous_layout(source, source_id, previous_metadata, "single")
 
             # Log the action
             self.log_update(source, source_id, "saved", {
@@ -333,7 +749,8 @@ class FirebaseService:
             return {
                 "status": "success",
                 "storage_path": storage_path,
-                "row_count": len(data)
+                "row_count": len(data),
+                "unchanged": False
             }
 
         except Exception as e:
@@ -346,30 +763,477 @@ class FirebaseService:
         self,
         source: DataSource,
         source_id: str,
-        version: str = "latest"
+        version: Union[str, datetime] = "latest",
+        metadata: Optional[Dict[str, Any]] = None,
+        columns: Optional[Sequence[str]] = None,
+        date_range: Optional[DateRange] = None
     ) -> Optional[pl.DataFrame]:
         """
         Complete load operation: retrieve data using metadata.
 
+        The local on-disk tier is checked first; Cloud Storage is only hit on
+        a local miss, and the downloaded file is then kept locally.
+
+        When columns or date_range are given, only that projection is read:
+        local files are scanned with column and row-group pushdown, and large
+        remote blobs are read with ranged requests (without filling the local
+        tier, since only part of the file was fetched).
+
         Args:
             source: Data source
             source_id: Source-specific identifier
-            version: "latest" or specific version timestamp
+            version: "latest", a retained version's generation, or a timestamp
+                    (datetime or ISO string) to read the data as of then
+                    (see load_version)
+            metadata: Metadata already read by the caller (skips a Firestore read)
+            columns: Columns to return (None = all)
+            date_range: Inclusive (start, end) dates to return; either bound may be None
 
         Returns:
             Polars DataFrame or None if not found
         """
+        if version != "latest":
+            return self.load_version(source, source_id, version, columns, date_range)
+
         # Get metadata
-        metadata = self.get_metadata(source, source_id)
+        if metadata is None:
+            metadata = self.get_metadata(source, source_id)
         if not metadata:
             return None
 
+        if metadata.get("layout") == "partitioned":
+            return self._load_partitions(source, source_id, metadata, columns, date_range)
+
         # Load data from storage path
         storage_path = metadata.get("storage_path")
         if not storage_path:
             return None
 
-        return self.load_data_from_storage(storage_path)
+        return self._load_file(
+            source,
+            source_id,
+            storage_path,
+            self.get_storage_generation(metadata),
+            metadata.get("size_bytes", 0),
+            columns,
+            date_range
+        )
+
+    def _load_file(
+        self,
+        source: DataSource,
+        source_id: str,
+        storage_path: str,
+        generation: str,
+        size_bytes: int,
+        columns: Optional[Sequence[str]] = None,
+        date_range: Optional[DateRange] = None
+    ) -> Optional[pl.DataFrame]:
+        """
+        Load one data file, local tier first, with optional projection pushdown.
+
+        Args:
+            source: Data source
+            source_id: Source-specific identifier
+            storage_path: Path to file in Cloud Storage
+            generation: Storage generation of the file
+            size_bytes: File size recorded in metadata (0 if unknown)
+            columns: Columns to return (None = all)
+            date_range: Inclusive (start, end) dates to return
+
+        Returns:
+            Polars DataFrame or None if not found
+        """
+        projected = columns is not None or bool(date_range)
+
+        if projected:
+            local_path = self.local_cache.get_path(source, source_id, storage_path, generation)
+            if local_path is not None:
+                try:
+                    with self.metrics.timer("local_read", source):
+                        data = scan_projected(local_path, columns, date_range)
+                    self.metrics.record_tier(source, "local")
+                    return data
+                except Exception as e:
+                    print(f"[WARN] Projected local read failed for {source}/{source_id}: {str(e)}")
+
+            if size_bytes >= REMOTE_PUSHDOWN_MIN_BYTES:
+                try:
+                    with self.metrics.timer("ranged_read", source):
+                        data = self._read_projected_from_storage(storage_path, columns, date_range)
+                    self.metrics.record_tier(source, "remote")
+                    return data
+                except Exception as e:
+                    print(f"[WARN] Ranged read failed for {source}/{source_id}, downloading: {str(e)}")
+        else:
+            start = time.perf_counter()
+            data = self.local_cache.get(source, source_id, storage_path, generation)
+            if data is not None:
+                self.metrics.observe("local_read", source, time.perf_counter() - start)
+                self.metrics.record_tier(source, "local")
+                return data
+
+        try:
+            data_bytes = self._download_data_bytes(storage_path, source)
+            if data_bytes is None:
+                return None
+
+            with self.metrics.timer("decode", source):
+                data = pl.read_parquet(io.BytesIO(data_bytes))
+            self.metrics.record_tier(source, "remote")
+
+        except Exception as e:
+            print(f"Error loading data from storage: {str(e)}")
+            return None
+
+        self.local_cache.put_bytes(source, source_id, storage_path, generation, data_bytes)
+        return apply_projection(data, columns, date_range)
+
+    # =========================================================================
+    # VERSIONED READS
+    # =========================================================================
+
+    def list_versions(
+        self,
+        source: DataSource,
+        source_id: str
+    ) -> List[Dict[str, Any]]:
+        """
+        List the retained versions of a dataset, newest first.
+
+        Every save writes new data files and cleanup_old_versions keeps the
+        latest KEEP_VERSIONS per file (per partition for partitioned data).
+        Files are named by save date (year for yfinance single files), so a
+        later save in the same period replaces the earlier one and only the
+        last save of each period is retained.
+
+        A partitioned version is the newest file of every partition as of
+        the save that wrote it, since unchanged partitions are not rewritten.
+
+        Args:
+            source: Data source
+            source_id: Source-specific identifier
+
+        Returns:
+            List of dictionaries with:
+                - version: Generation identifying the version
+                - created_at: When the version was saved (aware datetime)
+                - layout: "single" or "partitioned"
+                - files: [{"storage_path", "generation", "size_bytes"}]
+                - size_bytes: Total size of the version's files
+                - is_latest: True for the newest version
+        """
+        dataset_prefix = f"{get_storage_prefix(source)}/{source_id}/"
+        partition_prefix = f"{dataset_prefix}{PARTITION_DIR}/"
+
+        versions = []
+        partition_blobs: Dict[str, List[Any]] = {}
+        saves: Dict[str, List[Any]] = {}
+
+        for blob in self.backend.list_blobs(prefix=dataset_prefix):
+            if blob.name.startswith(partition_prefix):
+                partition, file_name = blob.name[len(partition_prefix):].split("/", 1)
+                partition_blobs.setdefault(partition, []).append(blob)
+                saves.setdefault(file_name, []).append(blob)
+            else:
+                versions.append({
+                    "version": blob.generation,
+                    "created_at": blob.time_created,
+                    "layout": "single",
+                    "files": [self._version_file(blob)]
+                })
+
+        for blobs in saves.values():
+            newest = max(blobs, key=lambda b: b.time_created)
+            files = []
+            for partition in sorted(partition_blobs):
+                candidates = [b for b in partition_blobs[partition] if b.time_created <= newest.time_created]
+                if candidates:
+                    files.append(self._version_file(max(candidates, key=lambda b: b.time_created)))
+            versions.append({
+                "version": newest.generation,
+                "created_at": newest.time_created,
+                "layout": "partitioned",
+                "files": files
+            })
+
+        versions.sort(key=lambda v: v["created_at"], reverse=True)
+        for index, entry in enumerate(versions):
+            entry["size_bytes"] = sum(f["size_bytes"] for f in entry["files"])
+            entry["is_latest"] = index == 0
+
+        return versions
+
+    @staticmethod
+    def _version_file(blob: Any) -> Dict[str, Any]:
+        """Describe one data file of a version."""
+        return {"storage_path": blob.name, "generation": blob.generation, "size_bytes": blob.size}
+
+    def resolve_version(
+        self,
+        source: DataSource,
+        source_id: str,
+        version: Union[str, datetime]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Find a retained version by generation or as of a point in time.
+
+        Args:
+            source: Data source
+            source_id: Source-specific identifier
+            version: "latest", a generation from list_versions(), or a
+                    timestamp (datetime, date or ISO string; naive values are
+                    taken as UTC) selecting the newest version saved at or
+                    before it
+
+        Returns:
+            Version dictionary (see list_versions) or None if no retained
+            version matches
+        """
+        versions = self.list_versions(source, source_id)
+        if not versions:
+            return None
+
+        if version == "latest":
+            return versions[0]
+
+        if isinstance(version, str):
+            for entry in versions:
+                if entry["version"] == version:
+                    return entry
+            try:
+                version = datetime.fromisoformat(version)
+            except ValueError:
+                return None
+
+        if not isinstance(version, datetime):
+            # A date means "as of the end of that day"
+            version = datetime.combine(version, datetime.max.time())
+        as_of = version if version.tzinfo else version.replace(tzinfo=timezone.utc)
+
+        for entry in versions:
+            if entry["created_at"] <= as_of:
+                return entry
+        return None
+
+    def load_version(
+        self,
+        source: DataSource,
+        source_id: str,
+        version: Union[str, datetime],
+        columns: Optional[Sequence[str]] = None,
+        date_range: Optional[DateRange] = None
+    ) -> Optional[pl.DataFrame]:
+        """
+        Load a retained version of a dataset from stored Parquet.
+
+        Nothing is fetched from upstream; files go through the local tier
+        like current data (they are keyed by generation).
+
+        Args:
+            source: Data source
+            source_id: Source-specific identifier
+            version: Generation or timestamp (see resolve_version)
+            columns: Columns to return (None = all)
+            date_range: Inclusive (start, end) dates to return
+
+        Returns:
+            Polars DataFrame or None if no retained version matches
+        """
+        entry = self.resolve_version(source, source_id, version)
+        if entry is None:
+            print(f"[WARN] No retained version of {source}/{source_id} matches {version}")
+            return None
+
+        frames = []
+        for file in entry["files"]:
+            frame = self._load_file(
+                source, source_id, file["storage_path"], file["generation"],
+                file["size_bytes"], columns, date_range
+            )
+            if frame is None:
+                return None
+            frames.append(frame)
+
+        return pl.concat(frames, how="vertical_relaxed") if frames else None
+
+    # =========================================================================
+    # PARTITIONED LAYOUT
+    # =========================================================================
+
+    @staticmethod
+    def _should_partition(
+        data: pl.DataFrame,
+        metadata: Dict[str, Any]
+    ) -> bool:
+        """Whether a dataset is stored as yearly partitions."""
+        return (
+            metadata.get("frequency") in PARTITIONED_FREQUENCIES
+            and "date" in data.columns
+            and data.schema["date"].is_temporal()
+        )
+
+    def _save_partitions(
+        self,
+        source: DataSource,
+        source_id: str,
+        data: pl.DataFrame,
+        metadata: Dict[str, Any],
+        previous_metadata: Optional[Dict[str, Any]],
+        changed_since: Optional[date],
+        row_hashes: Optional[pl.Series] = None
+    ) -> Tuple[str, List[str], List[str]]:
+        """
+        Upload a dataset as yearly partitions and record the manifest in metadata.
+
+        Partitions are carried over from the previous manifest when their
+        content hash is unchanged, or when they end before changed_since and
+        their row count is unchanged; the rest are uploaded as new versions.
+
+        Args:
+            source: Data source
+            source_id: Source-specific identifier
+            data: Complete dataset (must have a temporal "date" column)
+            metadata: Metadata to augment with the manifest and storage info
+            previous_metadata: Metadata of the version being replaced (or None)
+            changed_since: Earliest date that may differ from the previous version
+            row_hashes: data.hash_rows() if already computed
+
+        Returns:
+            Tuple of (partition root path, partition keys that were uploaded,
+            partition keys that were removed)
+        """
+        previous_manifest = {}
+        if previous_metadata and previous_metadata.get("layout") == "partitioned":
+            previous_manifest = previous_metadata.get("partitions") or {}
+
+        if row_hashes is None:
+            row_hashes = data.hash_rows()
+
+        # Row hashes travel with their rows through the sort and split
+        parts = (
+            data.with_columns(row_hashes.alias("_row_hash"))
+            .sort("date")
+            .with_columns(pl.col("date").dt.year().cast(pl.Utf8).alias("_partition"))
+            .partition_by("_partition", as_dict=True, include_key=False, maintain_order=True)
+        )
+
+        manifest: Dict[str, Any] = {}
+        rewritten: List[str] = []
+        total_bytes = 0
+
+        for (partition,), part in parts.items():
+            part_row_hashes = part["_row_hash"]
+            part = part.drop("_row_hash")
+            part_hash = self.compute_content_hash(part, part_row_hashes)
+
+            previous = previous_manifest.get(partition)
+            if previous and changed_since is not None and int(partition) < changed_since.year:
+                unchanged = previous.get("row_count") == len(part)
+            else:
+                unchanged = bool(previous) and previous.get("content_hash") == part_hash
+
+            if unchanged:
+                manifest[partition] = previous
+                total_bytes += previous.get("size_bytes", 0)
+                continue
+
+            storage_path = self._generate_partition_path(source, source_id, partition)
+            generation, data_bytes = self._upload_data(source, storage_path, part)
+            self.local_cache.put_bytes(source, source_id, storage_path, generation, data_bytes)
+
+            manifest[partition] = {
+                "storage_path": storage_path,
+                "storage_generation": generation,
+                "row_count": len(part),
+                "size_bytes": len(data_bytes),
+                "min_date": str(part["date"].min()),
+                "max_date": str(part["date"].max()),
+                "content_hash": part_hash
+            }
+            rewritten.append(partition)
+            total_bytes += len(data_bytes)
+
+        # Partitions no longer present in the data (history was shortened)
+        removed = sorted(set(previous_manifest) - set(manifest))
+        for partition in removed:
+            self.delete_data_from_storage(previous_manifest[partition]["storage_path"])
+
+        partition_root = f"{get_storage_prefix(source)}/{source_id}/{PARTITION_DIR}/"
+        generations = ",".join(manifest[key]["storage_generation"] for key in sorted(manifest))
+
+        metadata["layout"] = "partitioned"
+        metadata["partitions"] = manifest
+        metadata["storage_path"] = partition_root
+        metadata["storage_generation"] = hashlib.sha1(generations.encode("utf-8")).hexdigest()[:16]
+        metadata["row_count"] = len(data)
+        metadata["columns"] = data.columns
+        metadata["size_bytes"] = total_bytes
+
+        return partition_root, rewritten, removed
+
+    def _load_partitions(
+        self,
+        source: DataSource,
+        source_id: str,
+        metadata: Dict[str, Any],
+        columns: Optional[Sequence[str]] = None,
+        date_range: Optional[DateRange] = None
+    ) -> Optional[pl.DataFrame]:
+        """
+        Load a partitioned dataset, fetching only partitions overlapping date_range.
+
+        Args:
+            source: Data source
+            source_id: Source-specific identifier
+            metadata: Metadata with the partition manifest
+            columns: Columns to return (None = all)
+            date_range: Inclusive (start, end) dates to return
+
+        Returns:
+            Polars DataFrame (possibly empty if no partition overlaps the
+            range) or None if a partition file is missing
+        """
+        partitions = metadata.get("partitions") or {}
+        start, end = date_range if date_range else (None, None)
+
+        selected = []
+        for key in sorted(partitions):
+            entry = partitions[key]
+            # Manifest bounds are ISO strings; compare at day resolution
+            min_date = date.fromisoformat(entry["min_date"][:10])
+            max_date = date.fromisoformat(entry["max_date"][:10])
+            if start is not None and max_date < as_date(start):
+                continue
+            if end is not None and min_date > as_date(end):
+                continue
+            selected.append(entry)
+
+        if not selected:
+            # Read the newest partition for its schema, then return no rows
+            latest = partitions[max(partitions)] if partitions else None
+            if latest is None:
+                return None
+            data = self._load_file(
+                source, source_id, latest["storage_path"], latest["storage_generation"],
+                latest.get("size_bytes", 0), columns
+            )
+            return data.clear() if data is not None else None
+
+        def _load(entry: Dict[str, Any]) -> Optional[pl.DataFrame]:
+            return self._load_file(
+                source, source_id, entry["storage_path"], entry["storage_generation"],
+                entry.get("size_bytes", 0), columns, date_range
+            )
+
+        with ThreadPoolExecutor(max_workers=min(len(selected), BATCH_LOAD_WORKERS)) as executor:
+            frames = list(executor.map(_load, selected))
+
+        if any(frame is None for frame in frames):
+            print(f"Error loading data from storage: missing partition for {source}/{source_id}")
+            return None
+
+        return pl.concat(frames, how="vertical_relaxed")
 
     def check_data_exists(
         self,
@@ -390,12 +1254,12 @@ class FirebaseService:
         if not metadata:
             return False
 
-        storage_path = metadata.get("storage_path")
-        if not storage_path:
+        storage_paths = self.get_storage_paths(metadata)
+        if not storage_paths:
             return False
 
-        blob = self.bucket.blob(storage_path)
-        return blob.exists()
+        # For partitioned data, checking the newest partition is enough
+        return self.backend.blob_exists(storage_paths[-1])
 
     # =========================================================================
     # UPDATE LOGGING
@@ -411,24 +1275,24 @@ class FirebaseService:
         """
         Log an update action for auditing.
 
+        Entries are buffered and written in batches, so the timestamp is
+        taken client-side when the action happens.
+
         Args:
             source: Data source
             source_id: Source-specific identifier
             action: "saved", "loaded", "deleted", "error", etc.
             details: Additional details about the action
         """
-        collections = get_collection_names(source)
-        log_ref = self.db.collection(collections["logs"]).document()
-
         log_entry = {
             "source": source,
             "source_id": source_id,
             "action": action,
-            "timestamp": firestore.SERVER_TIMESTAMP,
+            "timestamp": datetime.now(timezone.utc),
             "details": details or {}
         }
 
-        log_ref.set(log_entry)
+        self.log_writer.append(log_entry)
 
     def get_recent_logs(
         self,
@@ -436,7 +1300,11 @@ class FirebaseService:
         limit: int = 50
     ) -> List[Dict[str, Any]]:
         """
-        Get recent update logs.
+        Get recent update logs, newest first.
+
+        Also reads the legacy per-source log collections that have not been
+        copied into UPDATE_LOGS_COLLECTION yet (see migrate_legacy_logs), so
+        history written before the move stays visible.
 
         Args:
             source: Optional filter by data source
@@ -445,31 +1313,82 @@ class FirebaseService:
         Returns:
             List of log entries
         """
-        if source:
-            collections = get_collection_names(source)
-            logs = (
-                self.db.collection(collections["logs"])
-                .order_by("timestamp", direction=firestore.Query.DESCENDING)
-                .limit(limit)
-                .stream()
-            )
-            return [log.to_dict() for log in logs]
-        else:
-            # Get logs from all sources
-            all_logs = []
-            for src in ["fred", "yfinance", "statscan"]:
-                collections = get_collection_names(src)
-                logs = (
-                    self.db.collection(collections["logs"])
-                    .order_by("timestamp", direction=firestore.Query.DESCENDING)
-                    .limit(limit // 3)  # Distribute limit across sources
-                    .stream()
-                )
-                all_logs.extend([log.to_dict() for log in logs])
+        # Make entries still sitting in the buffer visible
+        self.log_writer.flush()
+        logs = self.backend.get_recent_logs(UPDATE_LOGS_COLLECTION, limit, source)
 
-            # Sort combined logs by timestamp
-            all_logs.sort(key=lambda x: x.get("timestamp", datetime.min), reverse=True)
-            return all_logs[:limit]
+        legacy_collections = self._unmigrated_legacy_log_collections(source)
+        if not legacy_collections:
+            return logs
+
+        # Each legacy collection holds one source, so no source filter (or index) is needed
+        for collection in legacy_collections.values():
+            logs.extend(self.backend.get_recent_logs(collection, limit))
+        logs.sort(key=self._log_sort_key, reverse=True)
+        return logs[:limit]
+
+    def migrate_legacy_logs(self, source: Optional[DataSource] = None) -> Dict[str, int]:
+        """
+        Copy the legacy per-source log collections into UPDATE_LOGS_COLLECTION.
+
+        Each collection is copied once and then marked as migrated, after
+        which get_recent_logs() stops reading it. The legacy collections are
+        left in place.
+
+        Args:
+            source: Optional data source to migrate (default: all)
+
+        Returns:
+            {legacy collection: number of entries copied}
+        """
+        migrated = {}
+        for src, collection in self._unmigrated_legacy_log_collections(source).items():
+            entries = [
+                {**entry, "source": entry.get("source") or src}
+                for entry in self.backend.list_logs(collection)
+            ]
+            if entries:
+                self.backend.append_logs(UPDATE_LOGS_COLLECTION, entries)
+
+            self.backend.set_document(UPDATE_LOGS_MIGRATIONS_COLLECTION, collection, {
+                "source": src,
+                "migrated_entries": len(entries),
+                "migrated_at": self.backend.SERVER_TIMESTAMP
+            })
+            migrated[collection] = len(entries)
+            print(f"[OK] Migrated {len(entries)} log entries from {collection}")
+
+        return migrated
+
+    def _unmigrated_legacy_log_collections(self, source: Optional[DataSource] = None) -> Dict[str, str]:
+        """
+        Get the legacy log collections not yet copied by migrate_legacy_logs().
+
+        Args:
+            source: Optional data source (default: all)
+
+        Returns:
+            {source: legacy log collection}
+        """
+        collections = {
+            src: get_collection_names(src)["logs"]
+            for src in ([source] if source else DATA_SOURCES)
+        }
+        markers = self.backend.get_documents([
+            (UPDATE_LOGS_MIGRATIONS_COLLECTION, collection) for collection in collections.values()
+        ])
+        return {
+            src: collection for src, collection in collections.items()
+            if markers[(UPDATE_LOGS_MIGRATIONS_COLLECTION, collection)] is None
+        }
+
+    @staticmethod
+    def _log_sort_key(entry: Dict[str, Any]) -> datetime:
+        """Sort key for log entries; naive timestamps are treated as UTC."""
+        timestamp = entry.get("timestamp")
+        if not isinstance(timestamp, datetime):
+            return datetime.min.replace(tzinfo=timezone.utc)
+        return timestamp if timestamp.tzinfo else timestamp.replace(tzinfo=timezone.utc)
 
     # =========================================================================
     # CACHE MANAGEMENT
@@ -479,26 +1398,173 @@ class FirebaseService:
         self,
         source: DataSource,
         source_id: str,
-        keep_latest: int = KEEP_VERSIONS
+        keep_latest: int = KEEP_VERSIONS,
+        partitions: Optional[List[str]] = None
     ) -> None:
         """
         Clean up old versions of data files, keeping only the latest N versions.
 
+        Versions are counted per partition: single-file versions under
+        {prefix}/{source_id}/ form one group and each yearly partition
+        directory forms its own group.
+
         Args:
             source: Data source
             source_id: Source-specific identifier
             keep_latest: Number of latest versions to keep
+            partitions: Only clean up these partitions (listing just their
+                      directories). None cleans every group of the dataset.
+        """
+        dataset_prefix = f"{get_storage_prefix(source)}/{source_id}/"
+
+        if partitions is not None:
+            prefixes = [f"{dataset_prefix}{PARTITION_DIR}/{key}/" for key in partitions]
+        else:
+            prefixes = [dataset_prefix]
+
+        groups: Dict[str, List[Any]] = {}
+        for prefix in prefixes:
+            for blob in self.backend.list_blobs(prefix=prefix):
+                groups.setdefault(blob.name.rsplit("/", 1)[0], []).append(blob)
+
+        for blobs in groups.values():
+            # Sort by creation time (newest first)
+            blobs.sort(key=lambda b: b.time_created, reverse=True)
+
+            # Delete older versions
+            for blob in blobs[keep_latest:]:
+                self.backend.delete_blob(blob.name)
+                print(f"Deleted old version: {blob.name}")
+
+    def _delete_previous_layout(
+        self,
+        source: DataSource,
+        source_id: str,
+        previous_metadata: Optional[Dict[str, Any]],
+        layout: str
+    ) -> None:
+        """
+        Delete the files of a dataset's previous storage layout after a switch.
+
+        Files of the old layout are no longer referenced by the metadata, so
+        they would otherwise be kept forever and listed as old versions.
+
+        Args:
+            source: Data source
+            source_id: Source-specific identifier
+            previous_metadata: Metadata of the version that was replaced
+            layout: Layout just written ("single" or "partitioned")
+        """
+        if not previous_metadata or not previous_metadata.get("storage_path"):
+            return
+        if previous_metadata.get("layout", "single") == layout:
+            return
+
+        dataset_prefix = f"{get_storage_prefix(source)}/{source_id}/"
+        partition_prefix = f"{dataset_prefix}{PARTITION_DIR}/"
+
+        for blob in self.backend.list_blobs(prefix=dataset_prefix):
+            # Single files sit directly under the dataset prefix
+            in_partitions = blob.name.startswith(partition_prefix)
+            if in_partitions == (layout == "single"):
+                self.backend.delete_blob(blob.name)
+                print(f"Deleted file of previous layout: {blob.name}")
+
+    # =========================================================================
+    # CACHE STATISTICS
+    # =========================================================================
+
+    @staticmethod
+    def _dataset_footprint(metadata: Optional[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Get what a metadata doc contributes to the cache stats.
+
+        Args:
+            metadata: Metadata dictionary (None or a lease-only doc counts as nothing)
+
+        Returns:
+            Dictionary with datasets, rows, files and bytes
+        """
+        if not metadata or not metadata.get("storage_path"):
+            return {"datasets": 0, "rows": 0, "files": 0, "bytes": 0}
+
+        if metadata.get("layout") == "partitioned":
+            files = len(metadata.get("partitions") or {})
+        else:
+            files = 1
+
+        return {
+            "datasets": 1,
+            "rows": int(metadata.get("row_count", 0)),
+            "files": files,
+            "bytes": int(metadata.get("size_bytes", 0))
+        }
+
+    def _update_cache_stats(
+        self,
+        source: DataSource,
+        before: Optional[Dict[str, Any]],
+        after: Optional[Dict[str, Any]]
+    ) -> None:
+        """
+        Apply the difference between two versions of a dataset to the stats doc.
+
+        Args:
+            source: Data source
+            before: Metadata of the replaced version (None if new)
+            after: Metadata of the new version (None if deleted)
         """
-        prefix = f"{get_storage_prefix(source)}/{source_id}/"
-        blobs = list(self.bucket.list_blobs(prefix=prefix))
+        old = self._dataset_footprint(before)
+        new = self._dataset_footprint(after)
+        deltas = {key: new[key] - old[key] for key in new if new[key] != old[key]}
 
-        # Sort by creation time (newest first)
-        blobs.sort(key=lambda b: b.time_created, reverse=True)
+        if not deltas:
+            return
+
+        try:
+            self.backend.increment_fields(CACHE_STATS_COLLECTION, CACHE_STATS_DOC_ID, {source: deltas})
+        except Exception as e:
+            # Stats are advisory; never fail a save over them
+            print(f"[WARN] Failed to update cache stats for {source}: {str(e)}")
+
+    def rebuild_cache_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Recompute the stats doc from scratch (one metadata stream and one blob
+        listing per source).
 
-        # Delete older versions
-        for blob in blobs[keep_latest:]:
-            blob.delete()
-            print(f"Deleted old version: {blob.name}")
+        Used to create the stats doc the first time and to repair drift.
+        Marks the doc as initialized, so increments from later saves are
+        applied on top of complete totals.
+
+        Returns:
+            Per-source totals that were written
+        """
+        totals = {}
+        for src in ["fred", "yfinance", "statscan"]:
+            blob_sizes = {
+                blob.name: blob.size
+                for blob in self.backend.list_blobs(prefix=f"{get_storage_prefix(src)}/")
+            }
+
+            source_totals = {"datasets": 0, "rows": 0, "files": 0, "bytes": 0}
+            for metadata in self.get_all_metadata(src):
+                footprint = self._dataset_footprint(metadata)
+                if footprint["datasets"]:
+                    # Older docs have no size_bytes; take sizes from the listing
+                    footprint["bytes"] = sum(
+                        blob_sizes.get(path, 0) for path in self.get_storage_paths(metadata)
+                    )
+                for key, value in footprint.items():
+                    source_totals[key] += value
+
+            totals[src] = source_totals
+
+        self.backend.set_document(CACHE_STATS_COLLECTION, CACHE_STATS_DOC_ID, {
+            **totals,
+            CACHE_STATS_INITIALIZED_FIELD: self.backend.SERVER_TIMESTAMP
+        })
+        print("[OK] Rebuilt cache stats")
+        return totals
 
     def get_cache_stats(
         self,
@@ -507,47 +1573,71 @@ class FirebaseService:
         """
         Get statistics about cached data.
 
+        Reads the maintained stats doc (a single read regardless of cache
+        size); the doc is built from a full scan the first time, including
+        when saves have already created it with increments only.
+
         Args:
             source: Optional filter by data source
 
         Returns:
             Dictionary with cache statistics
         """
-        metadata_docs = self.get_all_metadata(source)
-
-        total_datasets = len(metadata_docs)
-        total_rows = sum(doc.get("row_count", 0) for doc in metadata_docs)
-
-        # Get storage size
-        if source:
-            prefix = f"{get_storage_prefix(source)}/"
-        else:
-            prefix = ""  # All sources
-
-        blobs = list(self.bucket.list_blobs(prefix=prefix) if prefix else self.bucket.list_blobs())
-        total_size_bytes = sum(blob.size for blob in blobs if blob.name.endswith(f".{DATA_FILE_FORMAT}"))
-        total_size_mb = total_size_bytes / (1024 * 1024)
+        totals = self.backend.get_document(CACHE_STATS_COLLECTION, CACHE_STATS_DOC_ID)
+        if totals is None or CACHE_STATS_INITIALIZED_FIELD not in totals:
+            print("[WARN] Cache stats not initialized, rebuilding from metadata")
+            totals = self.rebuild_cache_stats()
+
+        sources = [source] if source else ["fred", "yfinance", "statscan"]
+        by_source = {
+            src: {key: totals.get(src, {}).get(key, 0) for key in ("datasets", "rows", "files", "bytes")}
+            for src in sources
+        }
+        total_size_bytes = sum(entry["bytes"] for entry in by_source.values())
 
         stats = {
-            "total_datasets": total_datasets,
-            "total_rows": total_rows,
-            "total_files": len(blobs),
-            "total_size_mb": round(total_size_mb, 2)
+            "total_datasets": sum(entry["datasets"] for entry in by_source.values()),
+            "total_rows": sum(entry["rows"] for entry in by_source.values()),
+            "total_files": sum(entry["files"] for entry in by_source.values()),
+            "total_size_mb": round(total_size_bytes / (1024 * 1024), 2)
         }
 
         # Add per-source breakdown if looking at all sources
         if not source:
-            stats["by_source"] = {}
-            for src in ["fred", "yfinance", "statscan"]:
-                source_docs = [d for d in metadata_docs if d.get("source") == src]
-                stats["by_source"][src] = {
-                    "datasets": len(source_docs),
-                    "rows": sum(d.get("row_count", 0) for d in source_docs)
-                }
+            stats["by_source"] = {
+                src: {"datasets": entry["datasets"], "rows": entry["rows"]}
+                for src, entry in by_source.items()
+            }
 
         return stats
 
 
+# =============================================================================
+# SHARED INSTANCE
+# =============================================================================
+
+_shared_service: Optional[FirebaseService] = None
+_shared_service_lock = threading.Lock()
+
+
+def get_firebase_service() -> FirebaseService:
+    """
+    Get the process-wide FirebaseService, creating it on first use.
+
+    Sharing one instance shares its local tier, update-log buffer and (via
+    the backend) its Firestore and Cloud Storage clients.
+
+    Returns:
+        FirebaseService for the storage backend selected in settings
+    """
+    global _shared_service
+    if _shared_service is None:
+        with _shared_service_lock:
+            if _shared_service is None:
+                _shared_service = FirebaseService()
+    return _shared_service
+
+
 # =============================================================================
 # CONNECTION TESTING
 # =============================================================================
@@ -566,14 +1656,19 @@ def test_firebase_connection() -> Dict[str, bool]:
     }
 
     try:
-        service = FirebaseService()
+        service = get_firebase_service()
+
+        # Clients are created on first use, so parse credentials explicitly
+        # (raises if they are missing or invalid)
+        clients = getattr(service.backend, "clients", None)
+        if clients is not None:
+            _ = clients.credentials
         results["credentials"] = True
 
         # Test Firestore
         try:
-            test_doc = service.db.collection("_test").document("connection_test")
-            test_doc.set({"test": True, "timestamp": datetime.now()})
-            test_doc.delete()
+            service.backend.set_document("_test", "connection_test", {"test": True, "timestamp": datetime.now()})
+            service.backend.delete_document("_test", "connection_test")
             results["firestore"] = True
         except Exception as e:
             print(f"Firestore test failed: {str(e)}")
@@ -581,7 +1676,7 @@ def test_firebase_connection() -> Dict[str, bool]:
         # Test Cloud Storage
         try:
             # List blobs (doesn't create anything)
-            list(service.bucket.list_blobs(max_results=1))
+            service.backend.list_blobs(max_results=1)
             results["storage"] = True
         except Exception as e:
             print(f"Storage test failed: {str(e)}")
@@ -1,19 +1,27 @@
 """
 FRED (Federal Reserve Economic Data) API Service.
 
-Provides methods to fetch economic data from FRED using the fredapi library.
-Returns data as Polars DataFrames for consistency with project standards.
+Provides methods to fetch economic data from FRED using the fredapi library,
+or for observations optionally straight from the FRED HTTP API (see
+FredService.get_series backend="http"). Returns data as Polars DataFrames
+for consistency with project standards.
 
 CRITICAL: Must load API key from st.secrets["fred"]["api_key"].
 """
 
-import time
+import io
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List, Dict, Any
 from fredapi import Fred
 import polars as pl
 import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
 
+from src.config.constants import SOURCE_FETCH_CONCURRENCY
 from src.config.settings import get_fred_config
+from src.services.errors import DataNotFoundError
+from src.services.rate_limiter import get_rate_limiter
 
 
 class FredService:
@@ -25,10 +33,22 @@ class FredService:
 
     Attributes:
         fred: fredapi.Fred client instance
-        RATE_LIMIT_DELAY: Delay between requests (seconds)
+        session: Pooled HTTP session for the "http" backend
+        backend: Default observations backend ("fredapi" or "http")
+        rate_limiter: Token bucket shared by all FRED requests in the process
+        OBSERVATIONS_URL: FRED series observations endpoint
+        OBSERVATIONS_PAGE_SIZE: Max observations per request (API maximum)
     """
 
-    RATE_LIMIT_DELAY = 0.1  # 10 requests per second max
+    BACKENDS = ("fredapi", "http")
+    OBSERVATIONS_URL = "https://api.stlouisfed.org/fred/series/observations"
+    OBSERVATIONS_PAGE_SIZE = 100000
+
+    # Only the fields that are decoded; the rest of the response is skipped
+    OBSERVATIONS_SCHEMA = {
+        "count": pl.Int64,
+        "observations": pl.List(pl.Struct({"date": pl.String, "value": pl.String}))
+    }
 
     def __init__(self):
         """
@@ -40,17 +60,29 @@ class FredService:
         try:
             config = get_fred_config()
             self.fred = Fred(api_key=config["api_key"])
+            self.api_key = config["api_key"]
+            self.backend = config.get("backend", "fredapi")
+            self.rate_limiter = get_rate_limiter("fred")
         except KeyError as e:
             raise KeyError(
                 f"FRED API key not configured: {e}. "
                 "Add [fred] api_key to .streamlit/secrets.toml"
             )
 
+        # Concurrent panel fetches (get_multiple_series) share this pool
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=SOURCE_FETCH_CONCURRENCY["fred"],
+            pool_maxsize=SOURCE_FETCH_CONCURRENCY["fred"]
+        )
+        self.session.mount("https://", adapter)
+
     def get_series(
         self,
         series_id: str,
         observation_start: Optional[str] = None,
-        observation_end: Optional[str] = None
+        observation_end: Optional[str] = None,
+        backend: Optional[str] = None
     ) -> pl.DataFrame:
         """
         Fetch a single FRED series and return as Polars DataFrame.
@@ -59,19 +91,34 @@ class FredService:
             series_id: FRED series identifier (e.g., "DGS10")
             observation_start: Start date (YYYY-MM-DD format)
             observation_end: End date (YYYY-MM-DD format)
+            backend: "fredapi" (pandas via the fredapi library) or "http"
+                    (JSON decoded directly into Polars, much less conversion
+                    overhead for long daily series); defaults to self.backend
 
         Returns:
             Polars DataFrame with columns: ["date", "value"]
 
         Raises:
-            ValueError: If series not found or data fetch fails
+            DataNotFoundError: If series not found
+            ValueError: If data fetch fails
 
         Example:
             >>> fred = FredService()
             >>> data = fred.get_series("DGS10")
             >>> print(data.head())
+            >>> data = fred.get_series("DGS10", backend="http")
         """
+        backend = backend or self.backend
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown FRED backend '{backend}'. Valid backends: {self.BACKENDS}")
+
+        if backend == "http":
+            return self._get_series_http(series_id, observation_start, observation_end)
+
         try:
+            # Apply rate limiting
+            self._rate_limit()
+
             # Fetch series from FRED API
             series_data = self.fred.get_series(
                 series_id,
@@ -82,9 +129,6 @@ class FredService:
             # Convert pandas Series to Polars DataFrame
             df = self._convert_series_to_dataframe(series_data, series_id)
 
-            # Apply rate limiting
-            self._rate_limit()
-
             return df
 
         except Exception as e:
@@ -92,7 +136,7 @@ class FredService:
             if "api key" in error_msg or "unauthorized" in error_msg:
                 raise ValueError(f"FRED API authentication failed: {e}")
             elif "not found" in error_msg or "400" in error_msg:
-                raise ValueError(f"Series '{series_id}' not found in FRED database")
+                raise DataNotFoundError(f"Series '{series_id}' not found in FRED database")
             else:
                 raise ValueError(f"Failed to fetch series '{series_id}': {e}")
 
@@ -100,21 +144,30 @@ class FredService:
         self,
         series_ids: List[str],
         observation_start: Optional[str] = None,
-        observation_end: Optional[str] = None
+        observation_end: Optional[str] = None,
+        backend: Optional[str] = None
     ) -> pl.DataFrame:
         """
         Fetch multiple FRED series and return as wide-format DataFrame.
 
+        Series are fetched concurrently under the shared FRED rate limit, so
+        a panel of N series takes about as long as the rate limit allows
+        rather than N sequential round trips.
+
         Args:
             series_ids: List of FRED series identifiers
             observation_start: Start date (YYYY-MM-DD format)
             observation_end: End date (YYYY-MM-DD format)
+            backend: Observations backend (see get_series)
 
         Returns:
             Polars DataFrame with columns: ["date", series_id_1, series_id_2, ...]
             Each series becomes a column with the series_id as column name
+            (null on dates the series has no value; dates without a value in
+            any series are omitted)
 
         Raises:
+            DataNotFoundError: If a series is not found
             ValueError: If any series fails to fetch
 
         Example:
@@ -125,54 +178,38 @@ class FredService:
         if not series_ids:
             raise ValueError("series_ids list cannot be empty")
 
-        # Fetch each series
-        series_dfs = {}
-        for series_id in series_ids:
-            try:
-                series_data = self.fred.get_series(
-                    series_id,
-                    observation_start=observation_start,
-                    observation_end=observation_end
-                )
-
-                # Convert to DataFrame with series_id as column name
-                df_pandas = series_data.reset_index()
-                df_pandas.columns = ["date", series_id]
-
-                series_dfs[series_id] = df_pandas
-
-                # Apply rate limiting
-                self._rate_limit()
-
-            except Exception as e:
-                raise ValueError(f"Failed to fetch series '{series_id}': {e}")
-
-        # Merge all series on date
-        if not series_dfs:
-            raise ValueError("No series data fetched")
-
-        # Start with first series
-        first_id = list(series_dfs.keys())[0]
-        merged_df = series_dfs[first_id]
-
-        # Merge remaining series
-        for series_id in list(series_dfs.keys())[1:]:
-            merged_df = merged_df.merge(
-                series_dfs[series_id],
-                on="date",
-                how="outer"
-            )
-
-        # Convert to Polars
-        df_polars = pl.from_pandas(merged_df)
+        series_ids = list(dict.fromkeys(series_ids))
 
-        # Ensure date column is Date type
-        df_polars = df_polars.with_columns([
-            pl.col("date").cast(pl.Date).alias("date")
-        ])
+        # Fetch series concurrently; the shared rate limiter paces the requests
+        workers = min(len(series_ids), SOURCE_FETCH_CONCURRENCY["fred"])
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                series_id: executor.submit(
+                    self.get_series, series_id, observation_start, observation_end, backend
+                )
+                for series_id in series_ids
+            }
+            series_dfs = {series_id: future.result() for series_id, future in futures.items()}
+
+        # Align all series on date in one pass: stack them long, then pivot
+        # to one column per series (dates missing from a series become null)
+        long_df = pl.concat(
+            [
+                df.select(
+                    pl.col("date"),
+                    pl.lit(series_id).alias("series_id"),
+                    pl.col("value").cast(pl.Float64)
+                )
+                for series_id, df in series_dfs.items()
+            ],
+            how="vertical"
+        )
 
-        # Sort by date
-        df_polars = df_polars.sort("date")
+        df_polars = (
+            long_df.pivot(on="series_id", index="date", values="value")
+            .select(["date", *series_ids])
+            .sort("date")
+        )
 
         return df_polars
 
@@ -193,7 +230,8 @@ class FredService:
                 - notes: Additional notes about the series
 
         Raises:
-            ValueError: If series not found
+            DataNotFoundError: If series not found
+            ValueError: If metadata fetch fails
 
         Example:
             >>> fred = FredService()
@@ -202,6 +240,9 @@ class FredService:
             "Unemployment Rate"
         """
         try:
+            # Apply rate limiting
+            self._rate_limit()
+
             info = self.fred.get_series_info(series_id)
 
             # Extract relevant fields
@@ -215,14 +256,11 @@ class FredService:
                 "notes": info.get("notes", "")
             }
 
-            # Apply rate limiting
-            self._rate_limit()
-
             return metadata
 
         except Exception as e:
             if "not found" in str(e).lower() or "400" in str(e):
-                raise ValueError(f"Series '{series_id}' not found in FRED database")
+                raise DataNotFoundError(f"Series '{series_id}' not found in FRED database")
             else:
                 raise ValueError(f"Failed to fetch metadata for '{series_id}': {e}")
 
@@ -253,6 +291,131 @@ Last Updated: {meta['last_updated']}
         except Exception as e:
             return f"Error fetching info for {series_id}: {e}"
 
+    def _get_series_http(
+        self,
+        series_id: str,
+        observation_start: Optional[str],
+        observation_end: Optional[str]
+    ) -> pl.DataFrame:
+        """
+        Fetch a series from the FRED observations endpoint over self.session.
+
+        Args:
+            series_id: FRED series identifier
+            observation_start: Start date (YYYY-MM-DD format)
+            observation_end: End date (YYYY-MM-DD format)
+
+        Returns:
+            Polars DataFrame with columns: ["date", "value"] (see get_series)
+
+        Raises:
+            DataNotFoundError: If series not found
+            ValueError: If the request or decoding fails
+        """
+        params = {
+            "series_id": series_id,
+            "api_key": self.api_key,
+            "file_type": "json",
+            "limit": self.OBSERVATIONS_PAGE_SIZE
+        }
+        if observation_start:
+            params["observation_start"] = observation_start
+        if observation_end:
+            params["observation_end"] = observation_end
+
+        pages = []
+        offset = 0
+        while True:
+            # Apply rate limiting
+            self._rate_limit()
+
+            try:
+                response = self.session.get(
+                    self.OBSERVATIONS_URL,
+                    params={**params, "offset": offset},
+                    timeout=30
+                )
+            except requests.exceptions.RequestException as e:
+                raise ValueError(f"Failed to fetch series '{series_id}': {e}")
+
+            if response.status_code != 200:
+                self._raise_http_error(response, series_id)
+
+            page = self._parse_observations(response.content, series_id)
+            pages.append(page["observations"])
+            offset += page["returned"]
+
+            if not page["returned"] or offset >= page["count"]:
+                break
+
+        return pl.concat(pages) if len(pages) > 1 else pages[0]
+
+    def _parse_observations(self, content: bytes, series_id: str) -> Dict[str, Any]:
+        """
+        Decode an observations response straight into typed Polars columns.
+
+        The JSON is read by Polars (no Python objects per observation), and
+        FRED's "." placeholder for missing values becomes null and is dropped.
+
+        Args:
+            content: Raw JSON response body
+            series_id: Series identifier (for error messages)
+
+        Returns:
+            Dictionary with "count" (total observations matching the request),
+            "returned" (observations in this response, including missing
+            values) and "observations" (DataFrame with columns ["date", "value"])
+
+        Raises:
+            ValueError: If decoding fails
+        """
+        try:
+            raw = pl.read_json(io.BytesIO(content), schema=self.OBSERVATIONS_SCHEMA)
+
+            observations = (
+                raw.select(pl.col("observations").explode().struct.unnest())
+                .filter(pl.col("date").is_not_null())
+                .select(
+                    pl.col("date").str.to_date("%Y-%m-%d"),
+                    pl.when(pl.col("value") != ".").then(pl.col("value")).cast(pl.Float64).alias("value")
+                )
+                .filter(pl.col("value").is_not_null())
+            )
+
+            return {
+                "count": raw["count"][0] or 0,
+                "returned": raw["observations"].list.len()[0] or 0,
+                "observations": observations
+            }
+
+        except Exception as e:
+            raise ValueError(f"Failed to decode observations for series '{series_id}': {e}")
+
+    def _raise_http_error(self, response: requests.Response, series_id: str) -> None:
+        """
+        Raise the error matching a failed FRED API response.
+
+        Args:
+            response: Non-200 response
+            series_id: Series identifier (for error messages)
+
+        Raises:
+            DataNotFoundError: If the series does not exist
+            ValueError: For authentication and other request errors
+        """
+        try:
+            message = response.json().get("error_message", response.text)
+        except ValueError:
+            message = response.text
+
+        if response.status_code in (401, 403) or "api_key" in message.lower():
+            raise ValueError(f"FRED API authentication failed: {message}")
+        if response.status_code == 400 and "does not exist" in message.lower():
+            raise DataNotFoundError(f"Series '{series_id}' not found in FRED database")
+        raise ValueError(
+            f"Failed to fetch series '{series_id}': HTTP {response.status_code}: {message}"
+        )
+
     def _convert_series_to_dataframe(
         self,
         series: pd.Series,
@@ -295,5 +458,5 @@ Last Updated: {meta['last_updated']}
             )
 
     def _rate_limit(self):
-        """Apply rate limiting between requests."""
-        time.sleep(self.RATE_LIMIT_DELAY)
+        """Wait for the shared FRED rate limiter before sending a request."""
+        self.rate_limiter.acquire()
@@ -0,0 +1,131 @@
+"""
+Benchmark of the FRED observations backends.
+
+Fetches each series through both FredService backends ("fredapi" and
+"http"), checks that they return identical frames, and reports the best and
+median time per backend. Time spent waiting for the shared FRED rate limiter
+is excluded, so the numbers compare request + decode cost only:
+
+    python -m src.services.fred_benchmark
+    python -m src.services.fred_benchmark --series DGS10 DGS1 UNRATE --repeat 5
+
+The API key is read from .streamlit/secrets.toml in the working directory,
+the same as the app. Every run sends real requests (2 x repeat per series).
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from typing import Dict, List, Optional
+
+import polars as pl
+
+from src.services.fred_api import FredService
+
+# Long daily series, where conversion overhead dominates
+DEFAULT_SERIES = ["DGS10", "DGS1", "DGS2"]
+
+
+def time_fetch(fred: FredService, series_id: str, backend: str) -> tuple:
+    """
+    Fetch a series once and time it, excluding rate-limiter waits.
+
+    Args:
+        fred: FredService instance
+        series_id: FRED series identifier
+        backend: "fredapi" or "http"
+
+    Returns:
+        Tuple of (DataFrame, seconds)
+    """
+    waited_before = fred.rate_limiter.get_stats()["wait_seconds"]
+    start = time.perf_counter()
+    data = fred.get_series(series_id, backend=backend)
+    elapsed = time.perf_counter() - start
+    waited = fred.rate_limiter.get_stats()["wait_seconds"] - waited_before
+    return data, max(elapsed - waited, 0.0)
+
+
+def benchmark_series(fred: FredService, series_id: str, repeat: int) -> dict:
+    """
+    Benchmark both backends on one series.
+
+    Backends alternate on every round so network variation hits both.
+
+    Args:
+        fred: FredService instance
+        series_id: FRED series identifier
+        repeat: Fetches per backend
+
+    Returns:
+        Dictionary with series_id, rows, whether the frames match, and
+        {backend: [seconds, ...]} timings
+    """
+    timings: Dict[str, List[float]] = {backend: [] for backend in FredService.BACKENDS}
+    frames: Dict[str, pl.DataFrame] = {}
+
+    for _ in range(repeat):
+        for backend in FredService.BACKENDS:
+            data, seconds = time_fetch(fred, series_id, backend)
+            timings[backend].append(seconds)
+            frames[backend] = data
+
+    fredapi_data, http_data = frames["fredapi"], frames["http"]
+    return {
+        "series_id": series_id,
+        "rows": len(http_data),
+        "match": fredapi_data.equals(http_data),
+        "timings": timings
+    }
+
+
+def print_report(results: List[dict]) -> None:
+    """Print per-series timings and the speedup of the http backend."""
+    print()
+    print(f"{'SERIES':<12} {'ROWS':>8} {'MATCH':<6} {'FREDAPI ms':>16} {'HTTP ms':>16} {'SPEEDUP':>8}")
+    print(f"{'':<12} {'':>8} {'':<6} {'best / median':>16} {'best / median':>16}")
+    for result in results:
+        fredapi_times = result["timings"]["fredapi"]
+        http_times = result["timings"]["http"]
+        fredapi_ms = f"{min(fredapi_times) * 1000:.0f} / {statistics.median(fredapi_times) * 1000:.0f}"
+        http_ms = f"{min(http_times) * 1000:.0f} / {statistics.median(http_times) * 1000:.0f}"
+        speedup = statistics.median(fredapi_times) / max(statistics.median(http_times), 1e-9)
+        print(
+            f"{result['series_id']:<12} {result['rows']:>8} {str(result['match']):<6} "
+            f"{fredapi_ms:>16} {http_ms:>16} {speedup:>7.1f}x"
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the benchmark.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv)
+
+    Returns:
+        Exit code: 0 if both backends returned identical data, 1 otherwise
+    """
+    parser = argparse.ArgumentParser(description="Compare the fredapi and direct HTTP FRED backends.")
+    parser.add_argument(
+        "--series", nargs="+", default=DEFAULT_SERIES,
+        help=f"FRED series to fetch (default: {' '.join(DEFAULT_SERIES)})"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3,
+        help="Fetches per backend and series (default: 3)"
+    )
+    args = parser.parse_args(argv)
+
+    fred = FredService()
+    print(f"Benchmarking {len(args.series)} series x {args.repeat} fetches per backend")
+
+    results = [benchmark_series(fred, series_id, args.repeat) for series_id in args.series]
+
+    print_report(results)
+    return 0 if all(result["match"] for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,169 @@
+"""
+Process-wide Google Cloud clients.
+
+Service-account credentials are parsed once per process, and the Firestore
+client and Cloud Storage bucket are each created on first use and then shared
+by every FirebaseService, auth helper and Streamlit session. Code paths that
+only touch Firestore (login tracking, user lists, metadata reads) never build
+a Cloud Storage client.
+
+Both clients are thread-safe and pool their connections: Firestore
+multiplexes requests over one gRPC channel, and Cloud Storage uses one HTTP
+session whose connection pool is sized for concurrent downloads
+(GCS_HTTP_POOL_SIZE).
+"""
+
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from google.auth.credentials import with_scopes_if_required
+from google.auth.transport.requests import AuthorizedSession
+from google.cloud import firestore, storage
+from google.oauth2 import service_account
+from requests.adapters import HTTPAdapter
+
+from src.config.constants import GCS_HTTP_POOL_SIZE
+from src.config.settings import get_firebase_config
+
+
+class GCPClients:
+    """
+    Lazily created, shared Firestore and Cloud Storage clients.
+
+    Example:
+        >>> clients = get_gcp_clients()
+        >>> users = clients.firestore_client().collection("users")
+        >>> blob = clients.bucket().blob("fred/GDP/20240101.parquet")
+    """
+
+    def __init__(self, config_loader: Callable[[], Dict[str, Any]] = get_firebase_config):
+        """
+        Initialize without creating any client.
+
+        Args:
+            config_loader: Returns the Firebase configuration (see
+                          settings.get_firebase_config); called on first use
+        """
+        self._config_loader = config_loader
+        self._lock = threading.RLock()
+        self._config: Optional[Dict[str, Any]] = None
+        self._credentials = None
+        self._firestore: Optional[firestore.Client] = None
+        self._storage: Optional[storage.Client] = None
+        self._bucket: Optional[storage.Bucket] = None
+
+    def _get_config(self) -> Dict[str, Any]:
+        """Load configuration and parse credentials once. Caller holds the lock."""
+        if self._config is None:
+            config = self._config_loader()
+            self._credentials = service_account.Credentials.from_service_account_info(
+                config["credentials"]
+            )
+            self._config = config
+        return self._config
+
+    @property
+    def credentials(self) -> service_account.Credentials:
+        """Service-account credentials (parsed on first use)."""
+        with self._lock:
+            self._get_config()
+            return self._credentials
+
+    def firestore_client(self) -> firestore.Client:
+        """
+        Get the shared Firestore client, creating it on first use.
+
+        Returns:
+            Firestore client
+        """
+        if self._firestore is None:
+            with self._lock:
+                if self._firestore is None:
+                    config = self._get_config()
+                    self._firestore = firestore.Client(
+                        credentials=self._credentials,
+                        project=config["project_id"]
+                    )
+        return self._firestore
+
+    def storage_client(self) -> storage.Client:
+        """
+        Get the shared Cloud Storage client, creating it on first use.
+
+        Returns:
+            Cloud Storage client with a pooled HTTP session
+        """
+        if self._storage is None:
+            with self._lock:
+                if self._storage is None:
+                    config = self._get_config()
+
+                    # The default pool keeps 10 connections; concurrent
+                    # downloads beyond that would reconnect every time
+                    session = AuthorizedSession(
+                        with_scopes_if_required(self._credentials, storage.Client.SCOPE)
+                    )
+                    adapter = HTTPAdapter(
+                        pool_connections=GCS_HTTP_POOL_SIZE,
+                        pool_maxsize=GCS_HTTP_POOL_SIZE
+                    )
+                    session.mount("https://", adapter)
+
+                    self._storage = storage.Client(
+                        credentials=self._credentials,
+                        project=config["project_id"],
+                        _http=session
+                    )
+        return self._storage
+
+    def bucket(self) -> storage.Bucket:
+        """
+        Get the configured Cloud Storage bucket, creating the client on first use.
+
+        Returns:
+            Cloud Storage bucket
+        """
+        if self._bucket is None:
+            with self._lock:
+                if self._bucket is None:
+                    config = self._get_config()
+                    self._bucket = self.storage_client().bucket(config["storage_bucket"])
+        return self._bucket
+
+    @property
+    def bucket_name(self) -> str:
+        """Name of the configured Cloud Storage bucket."""
+        with self._lock:
+            return self._get_config()["storage_bucket"]
+
+    def get_stats(self) -> Dict[str, bool]:
+        """
+        Report which clients have been created so far.
+
+        Returns:
+            Dictionary with "credentials", "firestore" and "storage" flags
+        """
+        return {
+            "credentials": self._config is not None,
+            "firestore": self._firestore is not None,
+            "storage": self._storage is not None
+        }
+
+
+_clients: Optional[GCPClients] = None
+_clients_lock = threading.Lock()
+
+
+def get_gcp_clients() -> GCPClients:
+    """Get the process-wide client provider."""
+    global _clients
+    if _clients is None:
+        with _clients_lock:
+            if _clients is None:
+                _clients = GCPClients()
+    return _clients
+
+
+def get_firestore_client() -> firestore.Client:
+    """Get the process-wide Firestore client (created on first use)."""
+    return get_gcp_clients().firestore_client()
@@ -0,0 +1,104 @@
+"""
+Buffered writer for update log entries.
+
+FirebaseService.log_update() used to make one Firestore write per save. The
+writer below collects entries in memory and writes them with batch commits,
+when LOG_BATCH_SIZE entries are pending or every LOG_FLUSH_INTERVAL_SECONDS,
+so a refresh storm costs a handful of round trips instead of one per dataset.
+"""
+
+import atexit
+import threading
+from typing import Any, Dict, List
+
+from src.config.constants import (
+    LOG_BATCH_SIZE,
+    LOG_FLUSH_INTERVAL_SECONDS,
+    LOG_BUFFER_MAX_ENTRIES
+)
+
+
+class BufferedLogWriter:
+    """
+    Thread-safe log buffer flushed in batches by a background thread.
+
+    Attributes:
+        backend: StorageBackend the entries are written to
+        collection: Log collection name
+    """
+
+    def __init__(
+        self,
+        backend,
+        collection: str,
+        batch_size: int = LOG_BATCH_SIZE,
+        flush_interval_seconds: float = LOG_FLUSH_INTERVAL_SECONDS,
+        max_buffered: int = LOG_BUFFER_MAX_ENTRIES
+    ):
+        """
+        Start the background flush thread.
+
+        Args:
+            backend: StorageBackend with append_logs()
+            collection: Log collection name
+            batch_size: Pending entries that trigger an immediate flush
+            flush_interval_seconds: Max time an entry waits before being written
+            max_buffered: Max entries kept while writes are failing
+        """
+        self.backend = backend
+        self.collection = collection
+        self.batch_size = batch_size
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_buffered = max_buffered
+
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._buffer: List[Dict[str, Any]] = []
+        self._wakeup = threading.Event()
+
+        thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        thread.start()
+        atexit.register(self.flush)
+
+    def append(self, entry: Dict[str, Any]) -> None:
+        """
+        Buffer a log entry.
+
+        Args:
+            entry: Log document to write
+        """
+        with self._lock:
+            self._buffer.append(entry)
+            full = len(self._buffer) >= self.batch_size
+
+        if full:
+            self._wakeup.set()
+
+    def _run(self) -> None:
+        """Flush on every interval, or sooner when a batch fills up."""
+        while True:
+            self._wakeup.wait(self.flush_interval_seconds)
+            self._wakeup.clear()
+            self.flush()
+
+    def flush(self) -> None:
+        """Write all buffered entries now (entries are kept if the write fails)."""
+        with self._flush_lock:
+            with self._lock:
+                entries, self._buffer = self._buffer, []
+
+            if not entries:
+                return
+
+            try:
+                self.backend.append_logs(self.collection, entries)
+            except Exception as e:
+                print(f"[WARN] Failed to write {len(entries)} update log entries: {str(e)}")
+                with self._lock:
+                    # Put them back in front of anything logged meanwhile
+                    self._buffer = (entries + self._buffer)[-self.max_buffered:]
+
+    def pending(self) -> int:
+        """Number of entries waiting to be written."""
+        with self._lock:
+            return len(self._buffer)
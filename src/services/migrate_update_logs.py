@@ -0,0 +1,56 @@
+"""
+One-off migration of the legacy per-source update log collections.
+
+Update logs used to be written to fred_update_logs, yfinance_update_logs and
+statscan_update_logs; they now go to a single update_logs collection.
+FirebaseService.get_recent_logs() keeps reading the legacy collections until
+this has copied them over:
+
+    python -m src.services.migrate_update_logs
+    python -m src.services.migrate_update_logs --source fred
+
+Source-filtered log queries on update_logs need the composite index declared
+in firestore.indexes.json at the repo root:
+
+    firebase deploy --only firestore:indexes
+
+or, without the Firebase CLI:
+
+    gcloud firestore indexes composite create --collection-group=update_logs \\
+        --field-config=field-path=source,order=ascending \\
+        --field-config=field-path=timestamp,order=descending
+"""
+
+import argparse
+import sys
+from typing import List, Optional
+
+from src.config.constants import DATA_SOURCES
+from src.services.firebase_service import FirebaseService
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the migration.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv)
+
+    Returns:
+        Exit code (always 0; collections already migrated are skipped)
+    """
+    parser = argparse.ArgumentParser(description="Copy legacy update logs into the update_logs collection.")
+    parser.add_argument(
+        "--source", choices=list(DATA_SOURCES),
+        help="Only migrate one data source (default: all)"
+    )
+    args = parser.parse_args(argv)
+
+    migrated = FirebaseService().migrate_legacy_logs(args.source)
+    if not migrated:
+        print("[OK] Nothing to migrate")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
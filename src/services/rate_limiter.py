@@ -0,0 +1,179 @@
+"""
+Process-wide token-bucket rate limiting per upstream API.
+
+Every FredService, YFinanceService and StatsCanService instance (one per
+Streamlit session, plus warmup and batch workers) draws from the same bucket
+for its upstream, so concurrent callers share one request budget instead of
+each sleeping after every request:
+
+- An idle caller finds a full bucket and does not wait at all
+- Up to `burst` requests go out back to back
+- Sustained load is paced at `rate` requests per second, in arrival order
+
+Buckets are configured by UPSTREAM_RATE_LIMITS, overridable through the
+optional [rate_limits] secrets section (see settings.get_rate_limit_config).
+"""
+
+import asyncio
+import threading
+import time
+from typing import Dict, Optional
+
+from src.config.settings import get_rate_limit_config
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket usable from threads and asyncio tasks.
+
+    Callers reserve tokens under a short lock and then wait outside it, so
+    a waiting caller never blocks others from reserving the next slot and
+    concurrent callers are paced at exactly the configured rate.
+
+    Attributes:
+        name: Upstream name (for stats and log messages)
+        rate: Tokens added per second
+        burst: Bucket capacity (max requests sent back to back)
+
+    Example:
+        >>> limiter = get_rate_limiter("fred")
+        >>> limiter.acquire()                # in a thread
+        >>> await limiter.acquire_async()    # in a coroutine
+    """
+
+    def __init__(self, name: str, rate: float, burst: float):
+        """
+        Initialize a full bucket.
+
+        Args:
+            name: Upstream name
+            rate: Tokens added per second (must be positive)
+            burst: Bucket capacity (at least 1)
+
+        Raises:
+            ValueError: If rate or burst is out of range
+        """
+        if rate <= 0:
+            raise ValueError(f"Rate limit for '{name}' must be positive, got {rate}")
+        if burst < 1:
+            raise ValueError(f"Burst for '{name}' must be at least 1, got {burst}")
+
+        self.name = name
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self._acquired = 0
+        self._waited = 0
+        self._wait_seconds = 0.0
+
+    def _reserve(self, tokens: float) -> float:
+        """
+        Take tokens from the bucket, going into debt if needed.
+
+        Args:
+            tokens: Tokens to take
+
+        Returns:
+            Seconds the caller must wait before sending its request
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+            self._acquired += 1
+            if wait > 0:
+                self._waited += 1
+                self._wait_seconds += wait
+            return wait
+
+    def acquire(self, tokens: float = 1) -> float:
+        """
+        Wait (blocking the thread) until a request may be sent.
+
+        Args:
+            tokens: Requests about to be sent (e.g. one per ticker in a batch)
+
+        Returns:
+            Seconds waited
+        """
+        wait = self._reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, tokens: float = 1) -> float:
+        """
+        Wait (without blocking the event loop) until a request may be sent.
+
+        Args:
+            tokens: Requests about to be sent
+
+        Returns:
+            Seconds waited
+        """
+        wait = self._reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def get_stats(self) -> dict:
+        """
+        Get limiter configuration and usage.
+
+        Returns:
+            Dictionary with rate, burst, available tokens, acquisitions,
+            how many of them had to wait and the total wait in seconds
+        """
+        with self._lock:
+            now = time.monotonic()
+            available = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            return {
+                "rate": self.rate,
+                "burst": self.burst,
+                "available": round(available, 2),
+                "acquired": self._acquired,
+                "waited": self._waited,
+                "wait_seconds": round(self._wait_seconds, 3)
+            }
+
+
+_limiters: Dict[str, TokenBucket] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(upstream: str, config: Optional[Dict[str, Dict[str, float]]] = None) -> TokenBucket:
+    """
+    Get the process-wide limiter for an upstream, creating it on first use.
+
+    Args:
+        upstream: Upstream name ("fred", "yfinance", "statscan")
+        config: Optional {upstream: {"rate", "burst"}} overrides; defaults
+                to settings.get_rate_limit_config()
+
+    Returns:
+        Shared TokenBucket
+
+    Raises:
+        KeyError: If no limit is configured for the upstream
+    """
+    limiter = _limiters.get(upstream)
+    if limiter is None:
+        with _limiters_lock:
+            limiter = _limiters.get(upstream)
+            if limiter is None:
+                limits = (config or get_rate_limit_config())[upstream]
+                limiter = _limiters[upstream] = TokenBucket(upstream, limits["rate"], limits["burst"])
+    return limiter
+
+
+def get_rate_limiter_stats() -> Dict[str, dict]:
+    """Get stats for every limiter created so far, keyed by upstream."""
+    with _limiters_lock:
+        limiters = dict(_limiters)
+    return {name: limiter.get_stats() for name, limiter in limiters.items()}
@@ -7,10 +7,12 @@ to follow the project's service pattern with Polars DataFrame outputs.
 
 import requests
 import polars as pl
-import time
 from typing import Dict, List, Optional, Any
 from datetime import datetime, date
 
+from src.services.errors import DataNotFoundError
+from src.services.rate_limiter import get_rate_limiter
+
 
 class StatsCanService:
     """
@@ -29,7 +31,7 @@ class StatsCanService:
 
     Attributes:
         BASE_URL: Stats Canada API base URL
-        RATE_LIMIT_DELAY: Delay between requests (seconds)
+        rate_limiter: Token bucket shared by all Stats Canada requests in the process
 
     Example:
         >>> sc_service = StatsCanService()
@@ -38,7 +40,6 @@ class StatsCanService:
     """
 
     BASE_URL = "https://www150.statcan.gc.ca/t1/wds/rest"
-    RATE_LIMIT_DELAY = 0.05  # 20 requests/sec max
 
     def __init__(self):
         """
@@ -51,6 +52,7 @@ class StatsCanService:
             'User-Agent': 'Portfolio-Webapp/2.0',
             'Accept': 'application/json'
         })
+        self.rate_limiter = get_rate_limiter("statscan")
 
     # =========================================================================
     # MAIN DATA FETCH METHOD (Returns Polars DataFrame)
@@ -82,7 +84,8 @@ class StatsCanService:
             - Date column is pl.Date type
 
         Raises:
-            ValueError: If vectors not provided, table not found, or data fetch fails
+            DataNotFoundError: If the vectors return no data
+            ValueError: If vectors not provided or data fetch fails
 
         Example:
             >>> sc_service = StatsCanService()
@@ -114,7 +117,7 @@ class StatsCanService:
             )
 
             if not vector_data_list:
-                raise ValueError(
+                raise DataNotFoundError(
                     f"No data returned for product ID '{product_id}'. "
                     f"Table may not have data for the requested period."
                 )
@@ -204,7 +207,7 @@ class StatsCanService:
                             data_by_date[parsed_date][f"v{vector_id}"] = None
 
             if not data_by_date:
-                raise ValueError(
+                raise DataNotFoundError(
                     f"No valid data points found for product ID '{product_id}'. "
                     f"Check if the table has recent data."
                 )
@@ -229,6 +232,8 @@ class StatsCanService:
 
             return df_polars
 
+        except DataNotFoundError:
+            raise
         except Exception as e:
             raise ValueError(
                 f"Failed to convert vector data to DataFrame for product ID '{product_id}': {e}"
@@ -308,6 +313,9 @@ class StatsCanService:
         url = f"{self.BASE_URL}/{endpoint}"
 
         try:
+            # Rate limiting (shared with other sessions and threads)
+            self.rate_limiter.acquire()
+
             if method == "GET":
                 response = self.session.get(url, timeout=30)
             else:  # POST
@@ -315,9 +323,6 @@ class StatsCanService:
 
             response.raise_for_status()
 
-            # Rate limiting
-            time.sleep(self.RATE_LIMIT_DELAY)
-
             return response.json()
 
         except requests.exceptions.Timeout:
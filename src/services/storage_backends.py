@@ -0,0 +1,630 @@
+"""
+Storage backends for FirebaseService.
+
+FirebaseService talks to two kinds of storage: a document store for metadata
+and update logs, and a blob store for Parquet data files. This module defines
+that interface and two implementations:
+
+- GCPStorageBackend: Firestore (documents) + Cloud Storage (blobs), used in
+  production
+- LocalStorageBackend: SQLite (documents) + local files (blobs), so the cache
+  layer can be run, benchmarked and load-tested on one machine without GCP
+
+The backend is selected with the optional [storage] section in secrets.toml
+(see settings.get_storage_config).
+"""
+
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from google.api_core.exceptions import NotFound
+from google.cloud import firestore, storage
+
+from src.config.constants import REMOTE_READ_CHUNK_BYTES, FIRESTORE_BATCH_LIMIT
+from src.config.settings import get_storage_config
+from src.services.gcp_clients import GCPClients, get_gcp_clients
+
+# (collection, document id)
+DocKey = Tuple[str, str]
+
+# Transaction body: receives the current document (None if missing) and
+# returns (fields to merge into it or None for no write, result to return)
+TransactionFn = Callable[[Optional[Dict[str, Any]]], Tuple[Optional[Dict[str, Any]], Any]]
+
+
+class BlobInfo(NamedTuple):
+    """Listing entry for a stored blob."""
+
+    name: str
+    size: int
+    time_created: datetime
+    generation: str = ""  # Same value put_blob returned for this write
+
+
+class StorageBackend(ABC):
+    """
+    Document + blob storage used by FirebaseService.
+
+    Document writes merge into existing documents (nested maps included), as
+    Firestore's set(..., merge=True) does. Two sentinels can be used as field
+    values: SERVER_TIMESTAMP (replaced with the write time) and DELETE_FIELD
+    (removes the field).
+    """
+
+    SERVER_TIMESTAMP: Any = None
+    DELETE_FIELD: Any = None
+
+    # -------------------------------------------------------------------------
+    # Documents (metadata)
+    # -------------------------------------------------------------------------
+
+    @abstractmethod
+    def get_document(self, collection: str, doc_id: str) -> Optional[Dict[str, Any]]:
+        """Get a document, or None if it does not exist."""
+
+    @abstractmethod
+    def get_documents(self, keys: List[DocKey]) -> Dict[DocKey, Optional[Dict[str, Any]]]:
+        """Get several documents in one round trip (None for missing ones)."""
+
+    @abstractmethod
+    def set_document(self, collection: str, doc_id: str, data: Dict[str, Any]) -> None:
+        """Create a document or merge fields into it."""
+
+    @abstractmethod
+    def list_documents(self, collection: str) -> List[Dict[str, Any]]:
+        """Get every document in a collection."""
+
+    @abstractmethod
+    def delete_document(self, collection: str, doc_id: str) -> None:
+        """Delete a document (no-op if missing)."""
+
+    @abstractmethod
+    def run_transaction(self, collection: str, doc_id: str, fn: TransactionFn) -> Any:
+        """
+        Atomically read a document, merge fn's updates into it and return fn's result.
+
+        Args:
+            collection: Collection name
+            doc_id: Document id
+            fn: Transaction body (see TransactionFn); may be retried
+
+        Returns:
+            Result returned by fn
+        """
+
+    @abstractmethod
+    def increment_fields(self, collection: str, doc_id: str, increments: Dict[str, Any]) -> None:
+        """
+        Atomically add to numeric fields, creating the document/fields if missing.
+
+        Args:
+            collection: Collection name
+            doc_id: Document id
+            increments: Map of field -> amount (nested maps address nested fields)
+        """
+
+    # -------------------------------------------------------------------------
+    # Blobs (data files)
+    # -------------------------------------------------------------------------
+
+    @abstractmethod
+    def put_blob(self, path: str, data: bytes, content_type: str) -> str:
+        """Write a blob and return its new generation."""
+
+    @abstractmethod
+    def get_blob(self, path: str) -> Optional[bytes]:
+        """Read a whole blob, or None if it does not exist."""
+
+    @abstractmethod
+    def open_blob(self, path: str) -> Optional[BinaryIO]:
+        """Open a blob for seekable (ranged) reads, or None if it does not exist."""
+
+    @abstractmethod
+    def blob_exists(self, path: str) -> bool:
+        """Check whether a blob exists."""
+
+    @abstractmethod
+    def list_blobs(self, prefix: str = "", max_results: Optional[int] = None) -> List[BlobInfo]:
+        """List blobs whose names start with prefix."""
+
+    @abstractmethod
+    def delete_blob(self, path: str) -> None:
+        """Delete a blob (no-op if missing)."""
+
+    # -------------------------------------------------------------------------
+    # Logs
+    # -------------------------------------------------------------------------
+
+    @abstractmethod
+    def append_logs(self, collection: str, entries: List[Dict[str, Any]]) -> None:
+        """Append log entries in as few round trips as possible."""
+
+    @abstractmethod
+    def get_recent_logs(
+        self,
+        collection: str,
+        limit: int,
+        source: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Get the most recent log entries (optionally for one source), newest first by "timestamp"."""
+
+    @abstractmethod
+    def list_logs(self, collection: str) -> List[Dict[str, Any]]:
+        """Get every log entry in a collection, oldest first by "timestamp"."""
+
+
+# =============================================================================
+# GCP (Firestore + Cloud Storage)
+# =============================================================================
+
+class GCPStorageBackend(StorageBackend):
+    """
+    Firestore documents and Cloud Storage blobs.
+
+    Clients come from the process-wide GCPClients provider and are created
+    on first use, so a backend that only reads metadata never builds a
+    Cloud Storage client.
+
+    Attributes:
+        clients: Shared client provider
+        db: Firestore client (created on first access)
+        bucket: Cloud Storage bucket (created on first access)
+    """
+
+    SERVER_TIMESTAMP = firestore.SERVER_TIMESTAMP
+    DELETE_FIELD = firestore.DELETE_FIELD
+
+    def __init__(self, clients: Optional[GCPClients] = None):
+        """
+        Initialize without connecting; credentials are read from st.secrets on first use.
+
+        Args:
+            clients: Client provider to use instead of the process-wide one
+        """
+        self.clients = clients or get_gcp_clients()
+
+    @property
+    def db(self) -> firestore.Client:
+        return self.clients.firestore_client()
+
+    @property
+    def bucket(self) -> storage.Bucket:
+        return self.clients.bucket()
+
+    @property
+    def bucket_name(self) -> str:
+        return self.clients.bucket_name
+
+    def _doc_ref(self, collection: str, doc_id: str):
+        return self.db.collection(collection).document(doc_id)
+
+    def get_document(self, collection: str, doc_id: str) -> Optional[Dict[str, Any]]:
+        doc = self._doc_ref(collection, doc_id).get()
+        return doc.to_dict() if doc.exists else None
+
+    def get_documents(self, keys: List[DocKey]) -> Dict[DocKey, Optional[Dict[str, Any]]]:
+        results: Dict[DocKey, Optional[Dict[str, Any]]] = {key: None for key in keys}
+        if not keys:
+            return results
+
+        refs = []
+        keys_by_path = {}
+        for collection, doc_id in results:
+            doc_ref = self._doc_ref(collection, doc_id)
+            refs.append(doc_ref)
+            keys_by_path[doc_ref.path] = (collection, doc_id)
+
+        # Single batched read; snapshots may come back in any order
+        for snapshot in self.db.get_all(refs):
+            if snapshot.exists:
+                results[keys_by_path[snapshot.reference.path]] = snapshot.to_dict()
+
+        return results
+
+    def set_document(self, collection: str, doc_id: str, data: Dict[str, Any]) -> None:
+        self._doc_ref(collection, doc_id).set(data, merge=True)
+
+    def list_documents(self, collection: str) -> List[Dict[str, Any]]:
+        return [doc.to_dict() for doc in self.db.collection(collection).stream()]
+
+    def delete_document(self, collection: str, doc_id: str) -> None:
+        self._doc_ref(collection, doc_id).delete()
+
+    def run_transaction(self, collection: str, doc_id: str, fn: TransactionFn) -> Any:
+        doc_ref = self._doc_ref(collection, doc_id)
+
+        @firestore.transactional
+        def _run(transaction):
+            snapshot = doc_ref.get(transaction=transaction)
+            updates, result = fn(snapshot.to_dict() if snapshot.exists else None)
+            if updates:
+                transaction.set(doc_ref, updates, merge=True)
+            return result
+
+        return _run(self.db.transaction())
+
+    def increment_fields(self, collection: str, doc_id: str, increments: Dict[str, Any]) -> None:
+        def _to_transforms(values: Dict[str, Any]) -> Dict[str, Any]:
+            return {
+                key: _to_transforms(value) if isinstance(value, dict) else firestore.Increment(value)
+                for key, value in values.items()
+            }
+
+        # Server-side transform: no read, no contention retries
+        self._doc_ref(collection, doc_id).set(_to_transforms(increments), merge=True)
+
+    def put_blob(self, path: str, data: bytes, content_type: str) -> str:
+        blob = self.bucket.blob(path)
+        blob.upload_from_string(data, content_type=content_type)
+        return str(blob.generation)
+
+    def get_blob(self, path: str) -> Optional[bytes]:
+        try:
+            return self.bucket.blob(path).download_as_bytes()
+        except NotFound:
+            return None
+
+    def open_blob(self, path: str) -> Optional[BinaryIO]:
+        blob = self.bucket.blob(path)
+        try:
+            # Ranged reads of REMOTE_READ_CHUNK_BYTES instead of a full download
+            return blob.open("rb", chunk_size=REMOTE_READ_CHUNK_BYTES)
+        except NotFound:
+            return None
+
+    def blob_exists(self, path: str) -> bool:
+        return self.bucket.blob(path).exists()
+
+    def list_blobs(self, prefix: str = "", max_results: Optional[int] = None) -> List[BlobInfo]:
+        blobs = self.bucket.list_blobs(prefix=prefix or None, max_results=max_results)
+        return [
+            BlobInfo(blob.name, blob.size or 0, blob.time_created, str(blob.generation))
+            for blob in blobs
+        ]
+
+    def delete_blob(self, path: str) -> None:
+        try:
+            self.bucket.blob(path).delete()
+        except NotFound:
+            pass
+
+    def append_logs(self, collection: str, entries: List[Dict[str, Any]]) -> None:
+        # One batch commit per FIRESTORE_BATCH_LIMIT entries instead of one write each
+        for start in range(0, len(entries), FIRESTORE_BATCH_LIMIT):
+            batch = self.db.batch()
+            for entry in entries[start:start + FIRESTORE_BATCH_LIMIT]:
+                batch.set(self.db.collection(collection).document(), entry)
+            batch.commit()
+
+    def get_recent_logs(
+        self,
+        collection: str,
+        limit: int,
+        source: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        query = self.db.collection(collection)
+        if source:
+            # Needs the composite index on (source ASC, timestamp DESC) declared
+            # in firestore.indexes.json; deploy it with
+            # `firebase deploy --only firestore:indexes`
+            query = query.where("source", "==", source)
+        logs = (
+            query
+            .order_by("timestamp", direction=firestore.Query.DESCENDING)
+            .limit(limit)
+            .stream()
+        )
+        return [log.to_dict() for log in logs]
+
+    def list_logs(self, collection: str) -> List[Dict[str, Any]]:
+        logs = self.db.collection(collection).order_by("timestamp").stream()
+        return [log.to_dict() for log in logs]
+
+
+# =============================================================================
+# LOCAL (SQLite + filesystem)
+# =============================================================================
+
+class _Sentinel:
+    """Named placeholder value for the local backend."""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __repr__(self) -> str:
+        return self.name
+
+
+def _encode_value(value: Any) -> Any:
+    """JSON default hook: store datetimes tagged so they round-trip."""
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.astimezone()
+        return {"__datetime__": value.isoformat()}
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _decode_value(obj: Dict[str, Any]) -> Any:
+    """JSON object hook: restore tagged datetimes."""
+    if set(obj) == {"__datetime__"}:
+        return datetime.fromisoformat(obj["__datetime__"])
+    return obj
+
+
+class LocalStorageBackend(StorageBackend):
+    """
+    SQLite documents and filesystem blobs under one root directory.
+
+    Safe to share between threads and between processes on the same machine:
+    SQLite serializes writers, and blobs are written atomically.
+
+    Attributes:
+        root_dir: Directory holding metadata.sqlite3 and blobs/
+    """
+
+    SERVER_TIMESTAMP = _Sentinel("SERVER_TIMESTAMP")
+    DELETE_FIELD = _Sentinel("DELETE_FIELD")
+
+    def __init__(self, root_dir: str):
+        """
+        Initialize the local backend, creating its files if missing.
+
+        Args:
+            root_dir: Directory for the SQLite database and blob files
+        """
+        self.root_dir = Path(root_dir)
+        self.blob_dir = self.root_dir / "blobs"
+        self.blob_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.root_dir / "metadata.sqlite3"
+        self._local = threading.local()
+
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS documents ("
+                " collection TEXT NOT NULL, doc_id TEXT NOT NULL, data TEXT NOT NULL,"
+                " PRIMARY KEY (collection, doc_id))"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS logs ("
+                " id INTEGER PRIMARY KEY AUTOINCREMENT, collection TEXT NOT NULL,"
+                " timestamp REAL NOT NULL, data TEXT NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS logs_by_time ON logs (collection, timestamp)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        """Per-thread connection (sqlite3 connections are not thread-safe)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            self._local.conn = conn
+        return conn
+
+    # -------------------------------------------------------------------------
+    # Documents
+    # -------------------------------------------------------------------------
+
+    def _resolve(self, existing: Dict[str, Any], updates: Dict[str, Any]) -> Dict[str, Any]:
+        """Merge updates into existing (nested maps too), resolving sentinels."""
+        merged = dict(existing)
+        for key, value in updates.items():
+            if value is self.DELETE_FIELD:
+                merged.pop(key, None)
+            elif value is self.SERVER_TIMESTAMP:
+                merged[key] = datetime.now(timezone.utc)
+            elif isinstance(value, dict):
+                current = merged.get(key)
+                merged[key] = self._resolve(current if isinstance(current, dict) else {}, value)
+            else:
+                merged[key] = value
+        return merged
+
+    def _read(self, conn: sqlite3.Connection, collection: str, doc_id: str) -> Optional[Dict[str, Any]]:
+        row = conn.execute(
+            "SELECT data FROM documents WHERE collection = ? AND doc_id = ?",
+            (collection, doc_id)
+        ).fetchone()
+        return json.loads(row[0], object_hook=_decode_value) if row else None
+
+    def _write(self, conn: sqlite3.Connection, collection: str, doc_id: str, data: Dict[str, Any]) -> None:
+        conn.execute(
+            "INSERT OR REPLACE INTO documents (collection, doc_id, data) VALUES (?, ?, ?)",
+            (collection, doc_id, json.dumps(data, default=_encode_value))
+        )
+
+    def get_document(self, collection: str, doc_id: str) -> Optional[Dict[str, Any]]:
+        return self._read(self._connect(), collection, doc_id)
+
+    def get_documents(self, keys: List[DocKey]) -> Dict[DocKey, Optional[Dict[str, Any]]]:
+        conn = self._connect()
+        return {(collection, doc_id): self._read(conn, collection, doc_id) for collection, doc_id in keys}
+
+    def set_document(self, collection: str, doc_id: str, data: Dict[str, Any]) -> None:
+        self.run_transaction(collection, doc_id, lambda current: (data, None))
+
+    def list_documents(self, collection: str) -> List[Dict[str, Any]]:
+        rows = self._connect().execute(
+            "SELECT data FROM documents WHERE collection = ?", (collection,)
+        ).fetchall()
+        return [json.loads(row[0], object_hook=_decode_value) for row in rows]
+
+    def delete_document(self, collection: str, doc_id: str) -> None:
+        self._connect().execute(
+            "DELETE FROM documents WHERE collection = ? AND doc_id = ?", (collection, doc_id)
+        )
+
+    def run_transaction(self, collection: str, doc_id: str, fn: TransactionFn) -> Any:
+        conn = self._connect()
+        # IMMEDIATE takes the write lock up front, so read-modify-write is atomic
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            current = self._read(conn, collection, doc_id)
+            updates, result = fn(current)
+            if updates:
+                self._write(conn, collection, doc_id, self._resolve(current or {}, updates))
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return result
+
+    def increment_fields(self, collection: str, doc_id: str, increments: Dict[str, Any]) -> None:
+        def _add(current: Dict[str, Any], values: Dict[str, Any]) -> Dict[str, Any]:
+            updated = {}
+            for key, value in values.items():
+                existing = current.get(key)
+                if isinstance(value, dict):
+                    updated[key] = _add(existing if isinstance(existing, dict) else {}, value)
+                else:
+                    updated[key] = (existing if isinstance(existing, (int, float)) else 0) + value
+            return updated
+
+        self.run_transaction(collection, doc_id, lambda current: (_add(current or {}, increments), None))
+
+    # -------------------------------------------------------------------------
+    # Blobs
+    # -------------------------------------------------------------------------
+
+    def _blob_path(self, path: str) -> Path:
+        blob_path = (self.blob_dir / path).resolve()
+        if self.blob_dir.resolve() not in blob_path.parents:
+            raise ValueError(f"Blob path escapes storage root: {path}")
+        return blob_path
+
+    def put_blob(self, path: str, data: bytes, content_type: str) -> str:
+        blob_path = self._blob_path(path)
+        blob_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write to a temp file in the same directory, then atomically swap in
+        fd, tmp_name = tempfile.mkstemp(dir=blob_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                tmp_file.write(data)
+            os.replace(tmp_name, blob_path)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+
+        # Modification time (ns) plays the role of a GCS object generation
+        return str(blob_path.stat().st_mtime_ns)
+
+    def get_blob(self, path: str) -> Optional[bytes]:
+        try:
+            return self._blob_path(path).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def open_blob(self, path: str) -> Optional[BinaryIO]:
+        try:
+            return open(self._blob_path(path), "rb")
+        except FileNotFoundError:
+            return None
+
+    def blob_exists(self, path: str) -> bool:
+        return self._blob_path(path).is_file()
+
+    def list_blobs(self, prefix: str = "", max_results: Optional[int] = None) -> List[BlobInfo]:
+        blobs = []
+        for file_path in sorted(self.blob_dir.rglob("*")):
+            if not file_path.is_file() or file_path.suffix == ".tmp":
+                continue
+            name = file_path.relative_to(self.blob_dir).as_posix()
+            if not name.startswith(prefix):
+                continue
+            stat = file_path.stat()
+            blobs.append(BlobInfo(
+                name,
+                stat.st_size,
+                datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc),
+                str(stat.st_mtime_ns)
+            ))
+            if max_results is not None and len(blobs) >= max_results:
+                break
+        return blobs
+
+    def delete_blob(self, path: str) -> None:
+        try:
+            self._blob_path(path).unlink()
+        except FileNotFoundError:
+            pass
+
+    # -------------------------------------------------------------------------
+    # Logs
+    # -------------------------------------------------------------------------
+
+    def append_logs(self, collection: str, entries: List[Dict[str, Any]]) -> None:
+        rows = []
+        for entry in entries:
+            entry = self._resolve({}, entry)
+            timestamp = entry.get("timestamp")
+            sort_key = timestamp.timestamp() if isinstance(timestamp, datetime) else time.time()
+            rows.append((collection, sort_key, json.dumps(entry, default=_encode_value)))
+
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany(
+                "INSERT INTO logs (collection, timestamp, data) VALUES (?, ?, ?)", rows
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def get_recent_logs(
+        self,
+        collection: str,
+        limit: int,
+        source: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        query = "SELECT data FROM logs WHERE collection = ?"
+        params: List[Any] = [collection]
+        if source:
+            query += " AND json_extract(data, '$.source') = ?"
+            params.append(source)
+        query += " ORDER BY timestamp DESC LIMIT ?"
+        params.append(limit)
+
+        rows = self._connect().execute(query, params).fetchall()
+        return [json.loads(row[0], object_hook=_decode_value) for row in rows]
+
+    def list_logs(self, collection: str) -> List[Dict[str, Any]]:
+        rows = self._connect().execute(
+            "SELECT data FROM logs WHERE collection = ? ORDER BY timestamp", (collection,)
+        ).fetchall()
+        return [json.loads(row[0], object_hook=_decode_value) for row in rows]
+
+
+# =============================================================================
+# FACTORY
+# =============================================================================
+
+def create_storage_backend() -> StorageBackend:
+    """
+    Create the storage backend selected in settings.
+
+    Returns:
+        GCPStorageBackend (default) or LocalStorageBackend
+
+    Raises:
+        ValueError: If the configured backend name is unknown
+    """
+    config = get_storage_config()
+
+    if config["backend"] == "gcp":
+        return GCPStorageBackend()
+    if config["backend"] == "local":
+        return LocalStorageBackend(config["local_dir"])
+
+    raise ValueError(f"Unknown storage backend: {config['backend']}. Use 'gcp' or 'local'.")
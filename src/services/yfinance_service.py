@@ -8,8 +8,11 @@ for consistency with other data sources in the portfolio webapp.
 import yfinance as yf
 import polars as pl
 import pandas as pd
-import time
-from typing import Dict, Any, Optional
+from datetime import date, timedelta
+from typing import Dict, Any, List, Optional, Set
+
+from src.services.errors import DataNotFoundError
+from src.services.rate_limiter import get_rate_limiter
 
 
 class YFinanceService:
@@ -22,7 +25,10 @@ class YFinanceService:
     No API key required for yfinance.
 
     Attributes:
-        RATE_LIMIT_DELAY: Delay between requests in seconds (conservative)
+        rate_limiter: Token bucket shared by all Yahoo Finance requests in the process
+        _known_tickers: Tickers that returned data in this process (shared by
+                        all instances), so their empty date windows need no
+                        existence check
 
     Example:
         >>> yf_service = YFinanceService()
@@ -30,7 +36,7 @@ class YFinanceService:
         >>> print(data.head())
     """
 
-    RATE_LIMIT_DELAY = 0.1  # Conservative rate limiting (no official limit)
+    _known_tickers: Set[str] = set()
 
     def __init__(self):
         """
@@ -38,33 +44,45 @@ class YFinanceService:
 
         No credentials needed for yfinance.
         """
-        pass
+        self.rate_limiter = get_rate_limiter("yfinance")
 
     def get_ticker_history(
         self,
         ticker: str,
         period: str = "1y",
-        interval: str = "1d"
+        interval: str = "1d",
+        start: Optional[date] = None,
+        end: Optional[date] = None
     ) -> pl.DataFrame:
         """
         Fetch historical price data for a ticker.
 
+        Either a period or a date window can be requested. With start and/or
+        end only the bars in the window are downloaded, which makes this
+        usable as a CacheManager range_fetch_fn:
+            range_fetch_fn=lambda s, e: yf_service.get_ticker_history(t, period="max", start=s, end=e)
+
         Args:
             ticker: Ticker symbol (e.g., "AAPL", "^GSPC", "^VIX")
                    Special characters like ^ are supported natively
             period: Time period to fetch. Valid values:
                    "1d", "5d", "1mo", "3mo", "6mo", "1y", "2y", "5y", "10y", "ytd", "max"
+                   Ignored if start or end is given.
             interval: Data interval. Valid values:
                      "1m", "2m", "5m", "15m", "30m", "60m", "90m", "1h", "1d", "5d", "1wk", "1mo", "3mo"
+            start: Optional first date to include (None = from first available bar)
+            end: Optional last date to include (None = up to today)
 
         Returns:
             Polars DataFrame with columns: ["date", "open", "high", "low", "close", "volume"]
             - date: Date type
             - open/high/low/close: Float64
             - volume: Int64
+            For a date window with no bars (e.g. a weekend), an empty DataFrame
 
         Raises:
-            ValueError: If ticker not found or data fetch fails
+            DataNotFoundError: If ticker not found or has no data
+            ValueError: If data fetch fails
 
         Example:
             >>> yf_service = YFinanceService()
@@ -74,26 +92,33 @@ class YFinanceService:
             >>>
             >>> # Fetch S&P 500 index (special character ticker)
             >>> sp500 = yf_service.get_ticker_history("^GSPC", period="6mo")
+            >>>
+            >>> # Fetch a fixed window
+            >>> window = yf_service.get_ticker_history("SPY", start=date(2020, 1, 1), end=date(2024, 12, 31))
         """
+        if start is not None or end is not None:
+            return self._get_ticker_window(ticker, interval, start, end)
+
         try:
             # Create ticker object
             ticker_obj = yf.Ticker(ticker)
 
+            # Rate limiting
+            self.rate_limiter.acquire()
+
             # Fetch historical data
             hist = ticker_obj.history(period=period, interval=interval)
 
             # Check if data is empty
             if hist.empty:
-                raise ValueError(
+                raise DataNotFoundError(
                     f"No data available for ticker '{ticker}'. "
                     f"Verify the ticker symbol is correct and data exists for the specified period."
                 )
 
             # Convert to Polars DataFrame
             df_polars = self._convert_history_to_dataframe(hist, ticker)
-
-            # Rate limiting
-            time.sleep(self.RATE_LIMIT_DELAY)
+            self._known_tickers.add(ticker)
 
             return df_polars
 
@@ -105,7 +130,7 @@ class YFinanceService:
 
             # Check for common error patterns
             if "404" in error_str or "not found" in error_str:
-                raise ValueError(
+                raise DataNotFoundError(
                     f"Ticker '{ticker}' not found. "
                     f"Check the ticker symbol spelling and ensure it exists on Yahoo Finance."
                 )
@@ -117,6 +142,247 @@ class YFinanceService:
             else:
                 raise ValueError(f"Failed to fetch data for ticker '{ticker}': {e}")
 
+    def get_ticker_history_since(
+        self,
+        ticker: str,
+        start: date,
+        interval: str = "1d"
+    ) -> pl.DataFrame:
+        """
+        Fetch price data for a ticker from a start date up to today.
+
+        Used for incremental cache refreshes, so only recent bars are
+        downloaded instead of the ticker's full history.
+
+        Args:
+            ticker: Ticker symbol (e.g., "AAPL", "^GSPC")
+            start: First date to include
+            interval: Data interval (see get_ticker_history)
+
+        Returns:
+            Polars DataFrame with columns: ["date", "open", "high", "low", "close", "volume"]
+            Empty DataFrame if there are no bars since start
+
+        Raises:
+            DataNotFoundError: If the ticker has no data at all
+            ValueError: If data fetch fails
+
+        Example:
+            >>> yf_service = YFinanceService()
+            >>> recent = yf_service.get_ticker_history_since("^GSPC", date(2024, 1, 1))
+        """
+        return self._get_ticker_window(ticker, interval, start, None)
+
+    def _get_ticker_window(
+        self,
+        ticker: str,
+        interval: str,
+        start: Optional[date],
+        end: Optional[date]
+    ) -> pl.DataFrame:
+        """
+        Fetch the bars of a ticker between two dates (inclusive).
+
+        yfinance returns an empty frame both for an unknown ticker and for a
+        window without bars (a weekend or holiday, common when the cache
+        extends a dataset by a few days). An empty result from the start of
+        history therefore means the ticker does not exist; an empty bounded
+        window is only returned as such for a ticker known to have data,
+        which is checked with one small request if needed.
+
+        Args:
+            ticker: Ticker symbol
+            interval: Data interval (see get_ticker_history)
+            start: First date to include (None = from first available bar)
+            end: Last date to include (None = up to today)
+
+        Returns:
+            Polars DataFrame (see get_ticker_history); empty if the ticker
+            exists but has no bars in the window
+
+        Raises:
+            DataNotFoundError: If the ticker has no data at all
+            ValueError: If data fetch fails
+        """
+        try:
+            # Rate limiting
+            self.rate_limiter.acquire()
+
+            if start is None:
+                # yfinance needs a start for date windows; take full history
+                hist = yf.Ticker(ticker).history(period="max", interval=interval)
+            else:
+                # yfinance treats end as exclusive
+                hist = yf.Ticker(ticker).history(
+                    start=start.isoformat(),
+                    end=(end + timedelta(days=1)).isoformat() if end is not None else None,
+                    interval=interval
+                )
+
+            if hist.empty:
+                if start is not None and self._ticker_exists(ticker):
+                    return pl.DataFrame()
+                raise DataNotFoundError(
+                    f"No data available for ticker '{ticker}'. "
+                    f"Verify the ticker symbol is correct."
+                )
+
+            df_polars = self._convert_history_to_dataframe(hist, ticker)
+            self._known_tickers.add(ticker)
+
+            # Exchange-timezone timestamps can spill over the window edges
+            if start is not None:
+                df_polars = df_polars.filter(pl.col("date") >= start)
+            if end is not None:
+                df_polars = df_polars.filter(pl.col("date") <= end)
+
+            return df_polars
+
+        except ValueError:
+            raise
+        except Exception as e:
+            raise ValueError(
+                f"Failed to fetch data for ticker '{ticker}' between {start or 'start'} and {end or 'today'}: {e}"
+            )
+
+    def _ticker_exists(self, ticker: str) -> bool:
+        """
+        Check whether a ticker has recent data, unless it is already known to.
+
+        Args:
+            ticker: Ticker symbol
+
+        Returns:
+            True if the ticker returned data in this process or has bars in
+            the last month
+        """
+        if ticker in self._known_tickers:
+            return True
+
+        # Rate limiting
+        self.rate_limiter.acquire()
+
+        if yf.Ticker(ticker).history(period="1mo").empty:
+            return False
+
+        self._known_tickers.add(ticker)
+        return True
+
+    def get_many_histories(
+        self,
+        tickers: List[str],
+        period: str = "1y",
+        interval: str = "1d"
+    ) -> Dict[str, pl.DataFrame]:
+        """
+        Fetch historical price data for several tickers in one batched request.
+
+        Uses yf.download, which fetches the tickers concurrently in a single
+        call instead of one Ticker.history() round trip (plus rate limit
+        delay) per ticker. Suitable as a CacheManager batch_fetch_fn.
+
+        Args:
+            tickers: Ticker symbols (e.g., ["HYG", "TLT", "^GSPC"])
+            period: Time period to fetch (see get_ticker_history)
+            interval: Data interval (see get_ticker_history)
+
+        Returns:
+            Dictionary mapping ticker to a Polars DataFrame with columns
+            ["date", "open", "high", "low", "close", "volume"], in the same
+            format as get_ticker_history. Tickers with no data are omitted.
+
+        Raises:
+            ValueError: If the download fails
+
+        Example:
+            >>> yf_service = YFinanceService()
+            >>> frames = yf_service.get_many_histories(["HYG", "TLT"], period="5y")
+            >>> frames["HYG"].head()
+        """
+        tickers = list(dict.fromkeys(tickers))
+        if not tickers:
+            return {}
+
+        try:
+            # Rate limiting (yf.download sends one request per ticker)
+            self.rate_limiter.acquire(len(tickers))
+
+            wide = yf.download(
+                tickers,
+                period=period,
+                interval=interval,
+                group_by="column",
+                auto_adjust=True,
+                actions=False,
+                threads=True,
+                progress=False
+            )
+
+        except Exception as e:
+            raise ValueError(f"Failed to download data for tickers {tickers}: {e}")
+
+        if wide is None or wide.empty:
+            return {}
+
+        return self._split_download(wide, tickers)
+
+    def _split_download(
+        self,
+        wide: pd.DataFrame,
+        tickers: List[str]
+    ) -> Dict[str, pl.DataFrame]:
+        """
+        Split a yf.download result into one Polars DataFrame per ticker.
+
+        The wide frame (DatetimeIndex x (field, ticker) columns) is reshaped
+        to long format in one pass and converted to Polars once, then
+        partitioned by ticker, rather than slicing and converting each
+        ticker's columns separately.
+
+        Args:
+            wide: pandas DataFrame from yf.download(group_by="column")
+            tickers: Requested ticker symbols
+
+        Returns:
+            Dictionary mapping ticker to its DataFrame (see get_many_histories)
+
+        Raises:
+            ValueError: If conversion fails
+        """
+        try:
+            if not isinstance(wide.columns, pd.MultiIndex):
+                # Older yfinance versions return flat columns for one ticker
+                wide = wide.copy()
+                wide.columns = pd.MultiIndex.from_product([wide.columns, [tickers[0]]])
+
+            long = wide.stack(level=1, future_stack=True)
+            long.index = long.index.set_names(["date", "ticker"])
+            long.columns = [str(col).lower() for col in long.columns]
+
+            required_cols = ["open", "high", "low", "close", "volume"]
+            available_cols = [col for col in required_cols if col in long.columns]
+            if "close" not in available_cols:
+                raise ValueError("Missing required column (close) in downloaded data")
+
+            df_polars = pl.from_pandas(long[available_cols].reset_index())
+
+            # Tickers with a shorter history have null rows before their first bar
+            df_polars = (
+                df_polars
+                .filter(pl.col("close").is_not_null())
+                .with_columns(pl.col("date").cast(pl.Date))
+                .sort("ticker", "date")
+            )
+            if "volume" in df_polars.columns:
+                df_polars = df_polars.with_columns(pl.col("volume").cast(pl.Int64))
+
+            frames = df_polars.partition_by("ticker", as_dict=True, include_key=False)
+            self._known_tickers.update(key[0] for key in frames)
+            return {key[0]: frame for key, frame in frames.items()}
+
+        except Exception as e:
+            raise ValueError(f"Failed to convert downloaded data for tickers {tickers}: {e}")
+
     def get_ticker_info(self, ticker: str) -> Dict[str, Any]:
         """
         Fetch metadata for a ticker (company name, sector, etc.).
@@ -146,6 +412,10 @@ class YFinanceService:
         """
         try:
             ticker_obj = yf.Ticker(ticker)
+
+            # Rate limiting
+            self.rate_limiter.acquire()
+
             info = ticker_obj.info
 
             # Check if ticker exists (empty info dict usually means ticker not found)
@@ -167,9 +437,6 @@ class YFinanceService:
                 "quoteType": info.get("quoteType")
             }
 
-            # Rate limiting
-            time.sleep(self.RATE_LIMIT_DELAY)
-
             return metadata
 
         except ValueError:
@@ -4,7 +4,7 @@ Data fetching and preparation for the Strategy Backtester.
 import streamlit as st
 import polars as pl
 from datetime import date
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 from src.data.cache_manager import CacheManager
 from src.services.fred_api import FredService
@@ -12,6 +12,19 @@ from src.services.yfinance_service import YFinanceService
 from src.tools.strategy_backtester.calculations import calculate_rsi, calculate_moving_average
 from src.config.constants import FRED_SERIES
 
+def _fetch_fred_range(
+    fred: FredService,
+    series_id: str,
+    start: Optional[date],
+    end: Optional[date]
+) -> pl.DataFrame:
+    """Fetch a FRED series between two dates (None = unbounded)."""
+    return fred.get_series(
+        series_id,
+        observation_start=start.isoformat() if start else None,
+        observation_end=end.isoformat() if end else None
+    )
+
 def get_chart_data(
     cache: CacheManager,
     fred: FredService,
@@ -29,10 +42,12 @@ def get_chart_data(
     equity_df: pl.DataFrame = cache.get_or_fetch(
         source="yfinance",
         source_id=equity_ticker,
-        fetch_fn=lambda: yf.get_ticker_history(equity_ticker, start=start_date, end=end_date),
+        fetch_fn=lambda: yf.get_ticker_history(equity_ticker, period="max"),
         frequency="daily",
         metadata_fn=lambda: {"ticker": equity_ticker, "name": equity_ticker},
-        force_refresh=False
+        force_refresh=False,
+        date_range=(start_date, end_date),
+        range_fetch_fn=lambda start, end: yf.get_ticker_history(equity_ticker, period="max", start=start, end=end)
     )
     if equity_df.is_empty():
         return pl.DataFrame()
@@ -58,10 +73,13 @@ def get_chart_data(
         vix_df: pl.DataFrame = cache.get_or_fetch(
             source="yfinance",
             source_id="^VIX",
-            fetch_fn=lambda: yf.get_ticker_history("^VIX", start=start_date, end=end_date),
+            fetch_fn=lambda: yf.get_ticker_history("^VIX", period="max"),
             frequency="daily",
             metadata_fn=lambda: {"ticker": "^VIX", "name": "VIX"},
-            force_refresh=False
+            force_refresh=False,
+            delta_fetch_fn=lambda since: yf.get_ticker_history_since("^VIX", since),
+            date_range=(start_date, end_date),
+            range_fetch_fn=lambda start, end: yf.get_ticker_history("^VIX", period="max", start=start, end=end)
         )
         if not vix_df.is_empty():
             merged_df = merged_df.join(vix_df.select(["date", "close"]).rename({"close": "vix"}), on="date", how="left")
@@ -74,16 +92,20 @@ def get_chart_data(
         short_df: pl.DataFrame = cache.get_or_fetch(
             source="fred",
             source_id=short_id,
-            fetch_fn=lambda: fred.get_series(short_id, start_date=start_date, end_date=end_date),
+            fetch_fn=lambda: fred.get_series(short_id),
             frequency="daily",
-            metadata_fn=lambda: fred.get_series_metadata(short_id)
+            metadata_fn=lambda: fred.get_series_metadata(short_id),
+            date_range=(start_date, end_date),
+            range_fetch_fn=lambda start, end: _fetch_fred_range(fred, short_id, start, end)
         )
         long_df: pl.DataFrame = cache.get_or_fetch(
             source="fred",
             source_id=long_id,
-            fetch_fn=lambda: fred.get_series(long_id, start_date=start_date, end_date=end_date),
+            fetch_fn=lambda: fred.get_series(long_id),
             frequency="daily",
-            metadata_fn=lambda: fred.get_series_metadata(long_id)
+            metadata_fn=lambda: fred.get_series_metadata(long_id),
+            date_range=(start_date, end_date),
+            range_fetch_fn=lambda start, end: _fetch_fred_range(fred, long_id, start, end)
         )
         
         if not short_df.is_empty() and not long_df.is_empty():
@@ -96,7 +118,8 @@ def get_chart_data(
         gdp_df: pl.DataFrame = cache.get_or_fetch(
             source="fred",
             source_id="GDPC1", # Using Real GDP
-            fetch_fn=lambda: fred.get_series("GDPC1", start_date=start_date, end_date=end_date),
+            # Full history: growth on the first quarter needs the one before it
+            fetch_fn=lambda: fred.get_series("GDPC1"),
             frequency="quarterly",
             metadata_fn=lambda: fred.get_series_metadata("GDPC1")
         )
@@ -80,10 +80,12 @@ def render_technical_sandbox_ui(cache: CacheManager, yf: YFinanceService, start_
             equity_df = cache.get_or_fetch(
                 source="yfinance",
                 source_id=equity_ticker,
-                fetch_fn=lambda: yf.get_ticker_history(equity_ticker, start=start_date, end=end_date),
+                fetch_fn=lambda: yf.get_ticker_history(equity_ticker, period="max"),
                 frequency="daily",
                 metadata_fn=lambda: {"ticker": equity_ticker, "name": equity_ticker},
-                force_refresh=False
+                force_refresh=False,
+                date_range=(start_date, end_date),
+                range_fetch_fn=lambda start, end: yf.get_ticker_history(equity_ticker, period="max", start=start, end=end)
             )
             
             if not equity_df.is_empty():
@@ -0,0 +1,54 @@
+"""
+Shared fixtures for the test suite.
+
+Storage tests run offline against LocalStorageBackend (SQLite documents and
+files under a temporary directory) instead of Firestore and Cloud Storage.
+"""
+
+import pytest
+
+import src.services.firebase_service as firebase_module
+from src.data.memory_cache import MemoryFrameCache
+from src.services.firebase_service import FirebaseService
+from src.services.storage_backends import LocalStorageBackend
+
+
+@pytest.fixture
+def make_firebase(tmp_path, monkeypatch):
+    """
+    Build FirebaseService instances sharing one local storage backend.
+
+    Each instance gets its own local Parquet tier unless local_dir is
+    given, like separate app replicas reading the same bucket.
+    """
+    backend = LocalStorageBackend(str(tmp_path / "storage"))
+    counter = {"instances": 0}
+
+    def _make(local_dir=None):
+        counter["instances"] += 1
+        cache_dir = local_dir or str(tmp_path / f"local_{counter['instances']}")
+        monkeypatch.setattr(firebase_module, "get_cache_config", lambda: {
+            "local_dir": cache_dir,
+            "local_max_bytes": 64 * 1024 * 1024
+        })
+        return FirebaseService(backend)
+
+    return _make
+
+
+@pytest.fixture
+def firebase(make_firebase):
+    """FirebaseService on a temporary local storage backend."""
+    return make_firebase()
+
+
+@pytest.fixture
+def cache_manager(firebase, monkeypatch):
+    """CacheManager on the temporary backend, without release checks."""
+    import src.data.cache_manager as cache_module
+    from src.config.settings import get_cache_config
+
+    config = {**get_cache_config(), "release_checks": False, "write_behind": False, "refresh_lease": False}
+    monkeypatch.setattr(cache_module, "get_cache_config", lambda: config)
+    # Own memory tier, so tests don't see each other's frames
+    return cache_module.CacheManager(firebase, memory_cache=MemoryFrameCache(config["memory_max_bytes"]))
@@ -0,0 +1,145 @@
+"""Tests for CacheManager batch loads, coverage extension and negative caching."""
+
+from datetime import date
+
+import polars as pl
+import pytest
+
+from src.data.cache_manager import FetchRequest
+from src.services.errors import DataNotFoundError
+
+
+def frame(start: date, end: date) -> pl.DataFrame:
+    dates = pl.date_range(start, end, interval="1d", eager=True)
+    return pl.DataFrame({"date": dates, "value": [float(i) for i in range(len(dates))]})
+
+
+def missing():
+    raise DataNotFoundError("Series 'NOPE' not found in FRED database")
+
+
+def failing():
+    raise ValueError("upstream timeout")
+
+
+def request(source_id, fetch_fn):
+    return FetchRequest("fred", source_id, fetch_fn, "monthly")
+
+
+def test_many_raises_first_failure_without_errors(cache_manager):
+    with pytest.raises(DataNotFoundError):
+        cache_manager.get_or_fetch_many([
+            request("GDP", lambda: frame(date(2020, 1, 1), date(2020, 12, 31))),
+            request("NOPE", missing)
+        ])
+
+
+def test_many_collects_failures_per_key(cache_manager):
+    gdp = frame(date(2020, 1, 1), date(2020, 12, 31))
+    cache_manager.get_or_fetch("fred", "GDP", lambda: gdp, "monthly")
+
+    errors = {}
+    frames = cache_manager.get_or_fetch_many([
+        request("GDP", failing),
+        request("UNRATE", lambda: frame(date(2021, 1, 1), date(2021, 6, 30))),
+        request("NOPE", missing),
+        request("BROKEN", failing)
+    ], errors=errors)
+
+    assert sorted(frames) == ["GDP", "UNRATE"]
+    assert frames["GDP"].equals(gdp)
+    assert isinstance(errors["NOPE"], DataNotFoundError)
+    assert isinstance(errors["BROKEN"], ValueError)
+
+
+def test_many_skips_negative_cached_key(cache_manager):
+    with pytest.raises(DataNotFoundError):
+        cache_manager.get_or_fetch("fred", "NOPE", missing, "monthly")
+
+    errors = {}
+    frames = cache_manager.get_or_fetch_many([
+        request("NOPE", missing),
+        request("GDP", lambda: frame(date(2020, 1, 1), date(2020, 12, 31)))
+    ], errors=errors)
+
+    assert list(frames) == ["GDP"]
+    assert list(errors) == ["NOPE"]
+
+
+def test_range_request_extends_cached_coverage(cache_manager):
+    full = frame(date(2020, 1, 1), date(2020, 12, 31))
+    fetched = []
+
+    def range_fetch(start, end):
+        fetched.append((start, end))
+        return full.filter(pl.col("date").is_between(start, end))
+
+    def get(start, end):
+        return cache_manager.get_or_fetch(
+            "fred", "DGS10", lambda: full, "daily",
+            date_range=(start, end), range_fetch_fn=range_fetch
+        )
+
+    june = get(date(2020, 6, 1), date(2020, 6, 30))
+    assert len(june) == 30
+
+    cache_manager.memory_cache.invalidate(("fred", "DGS10"))
+    summer = get(date(2020, 5, 1), date(2020, 7, 31))
+
+    assert summer["date"].min() == date(2020, 5, 1)
+    assert summer["date"].max() == date(2020, 7, 31)
+    assert fetched == [
+        (date(2020, 6, 1), date(2020, 6, 30)),
+        (date(2020, 5, 1), date(2020, 5, 31)),
+        (date(2020, 7, 1), date(2020, 7, 31))
+    ]
+
+
+def test_open_ended_request_extends_to_new_end(cache_manager):
+    full = frame(date(2020, 1, 1), date(2021, 12, 31))
+    fetched = []
+
+    def range_fetch(start, end):
+        fetched.append((start, end))
+        window = full.filter(pl.col("date") >= start)
+        return window if end is None else window.filter(pl.col("date") <= end)
+
+    def get(start, end):
+        return cache_manager.get_or_fetch(
+            "fred", "SP500", lambda: full, "daily",
+            date_range=(start, end), range_fetch_fn=range_fetch
+        )
+
+    get(date(2020, 6, 1), date(2021, 6, 30))
+    cache_manager.memory_cache.invalidate(("fred", "SP500"))
+    extended = get(date(2020, 6, 1), None)
+
+    assert extended["date"].min() == date(2020, 6, 1)
+    assert extended["date"].max() == date(2021, 12, 31)
+    assert fetched[-1] == (date(2021, 7, 1), None)
+
+
+def test_many_cold_misses_use_batched_metadata_read(cache_manager, monkeypatch):
+    single_reads = []
+    get_metadata = cache_manager.firebase.get_metadata
+
+    def recording_get_metadata(source, source_id, *args, **kwargs):
+        single_reads.append(source_id)
+        return get_metadata(source, source_id, *args, **kwargs)
+
+    monkeypatch.setattr(cache_manager.firebase, "get_metadata", recording_get_metadata)
+
+    frames = cache_manager.get_or_fetch_many([
+        request(source_id, lambda: frame(date(2020, 1, 1), date(2020, 12, 31)))
+        for source_id in ("X", "Y", "Z")
+    ])
+
+    assert sorted(frames) == ["X", "Y", "Z"]
+    assert single_reads == []
+
+
+def test_cache_managers_share_process_memory_tier(firebase):
+    from src.data.cache_manager import CacheManager
+
+    home, analysis = CacheManager(firebase), CacheManager(firebase)
+    assert home.memory_cache is analysis.memory_cache
@@ -0,0 +1,187 @@
+"""Tests for FirebaseService save/load paths on the local storage backend."""
+
+from datetime import date, datetime, timezone
+
+import polars as pl
+
+from src.config.constants import (
+    CACHE_STATS_COLLECTION,
+    CACHE_STATS_DOC_ID,
+    PARTITION_DIR,
+    get_collection_names
+)
+from src.services.firebase_service import FirebaseService
+
+
+def daily_frame(start: date, end: date) -> pl.DataFrame:
+    """Daily frame with one value per calendar day."""
+    dates = pl.date_range(start, end, interval="1d", eager=True)
+    return pl.DataFrame({"date": dates, "value": [float(i) for i in range(len(dates))]})
+
+
+def save(firebase, source_id, data, frequency="daily"):
+    result = firebase.save_data_complete("fred", source_id, data, {"frequency": frequency})
+    assert result["status"] == "success", result
+    return result
+
+
+def test_partitioned_round_trip(firebase):
+    data = daily_frame(date(2020, 1, 1), date(2022, 12, 31))
+    save(firebase, "DGS10", data)
+
+    metadata = firebase.get_metadata("fred", "DGS10")
+    assert metadata["layout"] == "partitioned"
+    assert sorted(metadata["partitions"]) == ["2020", "2021", "2022"]
+    assert firebase.load_data_complete("fred", "DGS10").equals(data)
+
+
+def test_shortened_history_replaces_partition_manifest(make_firebase):
+    firebase = make_firebase()
+    save(firebase, "DGS10", daily_frame(date(2020, 1, 1), date(2026, 6, 30)))
+
+    shortened = daily_frame(date(2023, 1, 1), date(2026, 6, 30))
+    save(firebase, "DGS10", shortened)
+
+    metadata = firebase.get_metadata("fred", "DGS10")
+    assert sorted(metadata["partitions"]) == ["2023", "2024", "2025", "2026"]
+    assert metadata["row_count"] == len(shortened)
+    assert firebase.load_data_complete("fred", "DGS10").equals(shortened)
+
+    # A replica without the local copies must read the same data
+    replica = make_firebase()
+    assert replica.load_data_complete("fred", "DGS10").equals(shortened)
+
+
+def test_layout_switch_deletes_single_file_versions(firebase):
+    save(firebase, "DGS10", daily_frame(date(2024, 1, 1), date(2024, 3, 31)), frequency="monthly")
+    assert firebase.get_metadata("fred", "DGS10")["layout"] == "single"
+
+    data = daily_frame(date(2024, 1, 1), date(2025, 3, 31))
+    save(firebase, "DGS10", data)
+
+    remaining = firebase.list_data_files("fred", "DGS10")
+    assert remaining
+    assert all(f"/{PARTITION_DIR}/" in path for path in remaining)
+    assert {v["layout"] for v in firebase.list_versions("fred", "DGS10")} == {"partitioned"}
+    assert firebase.load_data_complete("fred", "DGS10").equals(data)
+
+
+def test_layout_switch_deletes_partitions(firebase):
+    save(firebase, "DGS10", daily_frame(date(2024, 1, 1), date(2025, 3, 31)))
+
+    data = daily_frame(date(2024, 1, 1), date(2024, 3, 31))
+    save(firebase, "DGS10", data, frequency="monthly")
+
+    remaining = firebase.list_data_files("fred", "DGS10")
+    assert len(remaining) == 1
+    assert f"/{PARTITION_DIR}/" not in remaining[0]
+    assert firebase.load_data_complete("fred", "DGS10").equals(data)
+
+
+def test_unchanged_save_skips_upload(firebase):
+    data = daily_frame(date(2024, 1, 1), date(2024, 12, 31))
+    save(firebase, "DGS10", data)
+
+    assert save(firebase, "DGS10", data.clone())["unchanged"] is True
+    assert not save(firebase, "DGS10", data.with_columns(pl.col("value") + 1))["unchanged"]
+
+
+def test_content_hash_covers_schema_and_row_order():
+    data = daily_frame(date(2024, 1, 1), date(2024, 1, 10))
+    content_hash = FirebaseService.compute_content_hash
+
+    assert content_hash(data) == content_hash(data.clone())
+    assert content_hash(data) != content_hash(data.reverse())
+    assert content_hash(data) != content_hash(data.with_columns(pl.col("value").cast(pl.Float32)))
+
+
+def test_partition_hashes_match_standalone_hash(firebase):
+    data = daily_frame(date(2022, 1, 1), date(2023, 12, 31))
+    save(firebase, "DGS10", data.reverse())
+
+    partitions = firebase.get_metadata("fred", "DGS10")["partitions"]
+    for year in (2022, 2023):
+        part = data.filter(pl.col("date").dt.year() == year)
+        assert partitions[str(year)]["content_hash"] == FirebaseService.compute_content_hash(part)
+
+
+def test_load_date_range_reads_overlapping_partitions(firebase):
+    save(firebase, "DGS10", daily_frame(date(2020, 1, 1), date(2024, 12, 31)))
+
+    window = firebase.load_data_complete(
+        "fred", "DGS10", columns=["date", "value"], date_range=(date(2022, 6, 1), date(2022, 6, 30))
+    )
+
+    assert window["date"].min() == date(2022, 6, 1)
+    assert window["date"].max() == date(2022, 6, 30)
+    assert len(window) == 30
+
+
+def legacy_log(source_id, day):
+    """Entry as written to the per-source log collections before update_logs."""
+    return {
+        "source": "fred",
+        "source_id": source_id,
+        "action": "saved",
+        "timestamp": datetime(2024, 1, day, tzinfo=timezone.utc),
+        "details": {}
+    }
+
+
+def test_recent_logs_include_unmigrated_legacy_logs(firebase):
+    legacy_collection = get_collection_names("fred")["logs"]
+    firebase.backend.append_logs(legacy_collection, [legacy_log("DGS10", 1), legacy_log("DGS1", 2)])
+    firebase.log_update("yfinance", "SPY", "saved")
+
+    logs = firebase.get_recent_logs()
+    assert [log["source_id"] for log in logs] == ["SPY", "DGS1", "DGS10"]
+    assert [log["source_id"] for log in firebase.get_recent_logs("fred")] == ["DGS1", "DGS10"]
+    assert [log["source_id"] for log in firebase.get_recent_logs(limit=2)] == ["SPY", "DGS1"]
+
+
+def test_migrate_legacy_logs_copies_once(firebase):
+    legacy_collection = get_collection_names("fred")["logs"]
+    firebase.backend.append_logs(legacy_collection, [legacy_log("DGS10", 1), legacy_log("DGS1", 2)])
+
+    assert firebase.migrate_legacy_logs() == {
+        legacy_collection: 2,
+        get_collection_names("yfinance")["logs"]: 0,
+        get_collection_names("statscan")["logs"]: 0
+    }
+    assert firebase.migrate_legacy_logs() == {}
+
+    # Migrated entries are read from update_logs only, not twice
+    assert [log["source_id"] for log in firebase.get_recent_logs()] == ["DGS1", "DGS10"]
+    assert [log["source_id"] for log in firebase.get_recent_logs("fred")] == ["DGS1", "DGS10"]
+    assert firebase.get_recent_logs("statscan") == []
+
+
+def test_cache_stats_rebuilt_after_upgrade(firebase):
+    for series_id in ("GDP", "UNRATE", "CPIAUCSL"):
+        save(firebase, series_id, daily_frame(date(2024, 1, 1), date(2024, 3, 31)), frequency="monthly")
+
+    # Deployment from before the stats doc existed: its first save creates
+    # the doc with that save's increment only
+    firebase.backend.delete_document(CACHE_STATS_COLLECTION, CACHE_STATS_DOC_ID)
+    save(firebase, "PAYEMS", daily_frame(date(2024, 1, 1), date(2024, 3, 31)), frequency="monthly")
+
+    assert firebase.get_cache_stats()["total_datasets"] == 4
+
+    # Later saves build on the rebuilt totals
+    save(firebase, "DGS10", daily_frame(date(2024, 1, 1), date(2024, 3, 31)), frequency="monthly")
+    assert firebase.get_cache_stats()["total_datasets"] == 5
+
+
+def test_load_from_storage_records_bytes_by_source(firebase, monkeypatch):
+    from src.data.metrics import CacheMetrics
+
+    save(firebase, "GDP", daily_frame(date(2024, 1, 1), date(2024, 3, 31)), frequency="monthly")
+    metrics = CacheMetrics()
+    monkeypatch.setattr(firebase, "metrics", metrics)
+
+    storage_path = firebase.get_metadata("fred", "GDP")["storage_path"]
+    assert firebase.load_data_from_storage(storage_path) is not None
+
+    downloaded = metrics.snapshot()["bytes"]
+    assert list(downloaded) == ["fred"]
+    assert downloaded["fred"]["downloaded"] > 0
@@ -0,0 +1,108 @@
+"""Tests for the direct HTTP backend of FredService."""
+
+import json
+from datetime import date
+
+import pytest
+
+import src.services.fred_api as fred_module
+from src.services.errors import DataNotFoundError
+from src.services.fred_api import FredService
+from src.services.rate_limiter import TokenBucket
+
+
+class FakeResponse:
+    def __init__(self, status_code, payload):
+        self.status_code = status_code
+        self.text = json.dumps(payload)
+        self.content = self.text.encode("utf-8")
+
+    def json(self):
+        return json.loads(self.text)
+
+
+class FakeSession:
+    """Serves observations pages in order, recording request params."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def get(self, url, params=None, timeout=None):
+        self.requests.append(params)
+        return self.responses.pop(0)
+
+
+def observations(count, values):
+    """Observations response body with one observation per (date, value)."""
+    return {
+        "count": count,
+        "offset": 0,
+        "limit": 100000,
+        "observations": [
+            {"realtime_start": "2024-01-01", "realtime_end": "2024-01-01", "date": d, "value": v}
+            for d, v in values
+        ]
+    }
+
+
+@pytest.fixture
+def fred(monkeypatch):
+    """FredService on the http backend without secrets or rate-limit waits."""
+    monkeypatch.setattr(fred_module, "get_fred_config", lambda: {"api_key": "test", "backend": "http"})
+    monkeypatch.setattr(fred_module, "get_rate_limiter", lambda upstream: TokenBucket(upstream, 1000, 1000))
+    return FredService()
+
+
+def test_parse_observations_drops_missing_values(fred):
+    content = json.dumps(observations(3, [
+        ("2024-01-01", "4.5"), ("2024-01-02", "."), ("2024-01-03", "4.25")
+    ])).encode("utf-8")
+
+    page = fred._parse_observations(content, "DGS10")
+
+    assert page["count"] == 3
+    assert page["returned"] == 3
+    assert page["observations"]["date"].to_list() == [date(2024, 1, 1), date(2024, 1, 3)]
+    assert page["observations"]["value"].to_list() == [4.5, 4.25]
+
+
+def test_parse_observations_empty_and_invalid(fred):
+    page = fred._parse_observations(json.dumps(observations(0, [])).encode("utf-8"), "DGS10")
+    assert page["returned"] == 0 and page["observations"].is_empty()
+
+    with pytest.raises(ValueError):
+        fred._parse_observations(b"not json", "DGS10")
+
+
+def test_pages_advance_by_returned_count(fred, monkeypatch):
+    monkeypatch.setattr(FredService, "OBSERVATIONS_PAGE_SIZE", 2)
+    fred.session = FakeSession([
+        FakeResponse(200, observations(3, [("2024-01-01", "."), ("2024-01-02", "1.5")])),
+        FakeResponse(200, observations(3, [("2024-01-03", "2.5")]))
+    ])
+
+    data = fred._get_series_http("DGS10", None, None)
+
+    # The first page had a missing value, but the offset still skips both rows
+    assert [request["offset"] for request in fred.session.requests] == [0, 2]
+    assert data["value"].to_list() == [1.5, 2.5]
+
+
+def test_unknown_series_raises_data_not_found(fred):
+    fred.session = FakeSession([
+        FakeResponse(400, {"error_code": 400, "error_message": "Bad Request.  The series does not exist."})
+    ])
+
+    with pytest.raises(DataNotFoundError):
+        fred._get_series_http("NOPE", None, None)
+
+
+def test_bad_api_key_raises_value_error(fred):
+    fred.session = FakeSession([
+        FakeResponse(400, {"error_code": 400, "error_message": "Bad Request.  The value for variable api_key is not registered."})
+    ])
+
+    with pytest.raises(ValueError) as error:
+        fred._get_series_http("DGS10", None, None)
+    assert not isinstance(error.value, DataNotFoundError)
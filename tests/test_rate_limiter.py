@@ -0,0 +1,79 @@
+"""Tests for the token-bucket rate limiter."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+import src.services.rate_limiter as rate_limiter_module
+from src.services.rate_limiter import TokenBucket, get_rate_limiter, get_rate_limiter_stats
+
+
+def test_burst_goes_out_without_waiting():
+    bucket = TokenBucket("test", rate=1, burst=3)
+
+    assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.get_stats()["waited"] == 0
+
+
+def test_sustained_load_is_paced_at_rate():
+    bucket = TokenBucket("test", rate=50, burst=1)
+    bucket.acquire()
+
+    start = time.monotonic()
+    threads = [threading.Thread(target=bucket.acquire) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Five more requests at 50/s need at least 0.1s, spread over all threads
+    assert time.monotonic() - start >= 0.09
+    stats = bucket.get_stats()
+    assert stats["acquired"] == 6
+    assert stats["waited"] == 5
+
+
+def test_acquire_async_waits_without_blocking_loop():
+    bucket = TokenBucket("test", rate=20, burst=1)
+
+    async def run():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        waits = [await bucket.acquire_async() for _ in range(3)]
+        task.cancel()
+        return waits, ticks
+
+    waits, ticks = asyncio.run(run())
+    assert waits[0] == 0.0 and all(wait > 0 for wait in waits[1:])
+    assert ticks > 0
+
+
+@pytest.mark.parametrize("rate, burst", [(0, 1), (-1, 1), (1, 0.5)])
+def test_invalid_limits_raise(rate, burst):
+    with pytest.raises(ValueError):
+        TokenBucket("test", rate=rate, burst=burst)
+
+
+def test_limiters_are_shared_per_upstream(monkeypatch):
+    monkeypatch.setattr(rate_limiter_module, "_limiters", {})
+    config = {"fred": {"rate": 2.0, "burst": 4.0}}
+
+    limiter = get_rate_limiter("fred", config)
+    assert get_rate_limiter("fred") is limiter
+    with pytest.raises(KeyError):
+        get_rate_limiter("unknown", config)
+
+    limiter.acquire()
+    stats = get_rate_limiter_stats()
+    assert list(stats) == ["fred"]
+    assert stats["fred"]["rate"] == 2.0 and stats["fred"]["burst"] == 4.0
+    assert stats["fred"]["acquired"] == 1
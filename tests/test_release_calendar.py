@@ -0,0 +1,65 @@
+"""Tests for the Stats Canada changed-cube lists in ReleaseCalendar."""
+
+import threading
+from datetime import date, timedelta
+
+from src.data.release_calendar import ReleaseCalendar
+
+
+class FakeStatsCan:
+    """Changed-cube lists that block until released, counting requests per day."""
+
+    def __init__(self):
+        self.calls = []
+        self.release = threading.Event()
+
+    def get_changed_cubes_list(self, day):
+        self.calls.append(day)
+        self.release.wait(timeout=5)
+        return [{"productId": 36100434, "releaseTime": f"{day}T08:30"}]
+
+
+def test_concurrent_callers_share_one_request():
+    statscan = FakeStatsCan()
+    calendar = ReleaseCalendar(statscan_service=statscan)
+    day = date.today() - timedelta(days=3)
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(calendar._get_changed_cubes(day)))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    while not statscan.calls:
+        pass
+    statscan.release.set()
+    for thread in threads:
+        thread.join()
+
+    assert statscan.calls == [day.isoformat()]
+    assert len(results) == 4 and all("36100434" in releases for releases in results)
+
+
+def test_cached_day_not_blocked_by_fetch_in_flight():
+    statscan = FakeStatsCan()
+    statscan.release.set()
+    calendar = ReleaseCalendar(statscan_service=statscan)
+    cached_day = date.today() - timedelta(days=3)
+    calendar._get_changed_cubes(cached_day)
+
+    # Another day's request hangs; cached reads must not wait for it
+    statscan.release.clear()
+    slow = threading.Thread(target=calendar._get_changed_cubes, args=(date.today() - timedelta(days=2),))
+    slow.start()
+    while len(statscan.calls) < 2:
+        pass
+
+    reader = threading.Thread(target=calendar._get_changed_cubes, args=(cached_day,))
+    reader.start()
+    reader.join(timeout=1)
+    assert not reader.is_alive()
+
+    statscan.release.set()
+    slow.join()
+    assert len(statscan.calls) == 2
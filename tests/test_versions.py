@@ -0,0 +1,89 @@
+"""Tests for retained dataset versions and diff_frames."""
+
+from datetime import date, datetime
+
+import polars as pl
+
+import src.services.firebase_service as firebase_module
+from src.config.constants import KEEP_VERSIONS
+from src.data.versions import diff_frames
+
+
+def gdp_frame(values):
+    """Quarterly frame starting 2024-01-01 with the given values."""
+    dates = [date(2024, 1, 1), date(2024, 4, 1), date(2024, 7, 1), date(2024, 10, 1)][:len(values)]
+    return pl.DataFrame({"date": dates, "value": values})
+
+
+def save_on(firebase, monkeypatch, day, data):
+    """Save a quarterly series as if on the given day (files are named by save date)."""
+    class SavedOn(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime.combine(day, datetime.min.time(), tzinfo=tz)
+
+    with monkeypatch.context() as patch:
+        patch.setattr(firebase_module, "datetime", SavedOn)
+        result = firebase.save_data_complete("fred", "GDP", data, {"frequency": "quarterly"})
+    assert result["status"] == "success", result
+
+
+def test_diff_frames_reports_added_removed_and_changed():
+    old = gdp_frame([1.0, 2.0, 3.0])
+    new = gdp_frame([1.0, 2.5, 3.0, 4.0]).filter(pl.col("date") != date(2024, 1, 1))
+
+    changes = diff_frames(old, new)
+
+    assert changes["date"].to_list() == [date(2024, 1, 1), date(2024, 4, 1), date(2024, 10, 1)]
+    assert changes["status"].to_list() == ["removed", "changed", "added"]
+    assert changes.row(1, named=True) == {
+        "date": date(2024, 4, 1), "status": "changed", "value_old": 2.0, "value_new": 2.5
+    }
+
+
+def test_diff_frames_compares_missing_columns_to_nulls():
+    old = gdp_frame([1.0])
+    new = old.with_columns(pl.lit("p").alias("flag"))
+
+    changes = diff_frames(old, new)
+
+    assert changes["status"].to_list() == ["changed"]
+    assert changes["flag_old"].to_list() == [None]
+    assert changes["flag_new"].to_list() == ["p"]
+
+
+def test_versions_are_listed_newest_first_and_loadable(firebase, monkeypatch):
+    first = gdp_frame([1.0, 2.0, 3.0])
+    revised = gdp_frame([1.0, 2.5, 3.0, 4.0])
+    save_on(firebase, monkeypatch, date(2024, 11, 1), first)
+    save_on(firebase, monkeypatch, date(2024, 12, 1), revised)
+
+    versions = firebase.list_versions("fred", "GDP")
+    assert [v["is_latest"] for v in versions] == [True, False]
+    assert [v["files"][0]["storage_path"].rsplit("/", 1)[1] for v in versions] == [
+        "20241201.parquet", "20241101.parquet"
+    ]
+
+    assert firebase.load_version("fred", "GDP", versions[1]["version"]).equals(first)
+    assert firebase.load_version("fred", "GDP", "latest").equals(revised)
+    assert firebase.load_version("fred", "GDP", "no-such-generation") is None
+
+
+def test_old_versions_beyond_retention_are_deleted(firebase, monkeypatch):
+    for month in range(1, KEEP_VERSIONS + 2):
+        save_on(firebase, monkeypatch, date(2024, month, 1), gdp_frame([float(month)]))
+
+    versions = firebase.list_versions("fred", "GDP")
+    assert len(versions) == KEEP_VERSIONS
+    assert firebase.load_version("fred", "GDP", versions[-1]["version"])["value"].to_list() == [2.0]
+
+
+def test_diff_versions_between_saves(cache_manager, monkeypatch):
+    save_on(cache_manager.firebase, monkeypatch, date(2024, 11, 1), gdp_frame([1.0, 2.0]))
+    save_on(cache_manager.firebase, monkeypatch, date(2024, 12, 1), gdp_frame([1.0, 2.5]))
+    old_version = cache_manager.list_versions("fred", "GDP")[1]["version"]
+
+    changes = cache_manager.diff_versions("fred", "GDP", old_version)
+
+    assert changes["date"].to_list() == [date(2024, 4, 1)]
+    assert changes["status"].to_list() == ["changed"]
@@ -0,0 +1,111 @@
+"""Tests for YFinanceService date windows and batch splitting (yfinance is faked)."""
+
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import polars as pl
+import pytest
+
+import src.services.yfinance_service as yfinance_module
+from src.services.errors import DataNotFoundError
+from src.services.yfinance_service import YFinanceService
+
+BARS = pd.date_range("2024-01-01", "2024-03-29", freq="B", tz="America/New_York", name="Date")
+
+
+class FakeTicker:
+    """Stands in for yf.Ticker: "SPY" has weekday bars in Q1 2024, others nothing."""
+
+    calls = []
+
+    def __init__(self, ticker):
+        self.ticker = ticker
+
+    def history(self, period=None, interval="1d", start=None, end=None):
+        FakeTicker.calls.append((self.ticker, period, start, end))
+        if self.ticker != "SPY":
+            return pd.DataFrame()
+
+        index = BARS
+        if period == "1mo":
+            index = index[-21:]
+        if start:
+            index = index[index.date >= date.fromisoformat(start)]
+        if end:
+            index = index[index.date < date.fromisoformat(end)]
+        values = np.arange(len(index), dtype=float)
+        return pd.DataFrame(
+            {"Open": values, "High": values, "Low": values, "Close": values, "Volume": 100},
+            index=index
+        )
+
+
+@pytest.fixture
+def yf_service(monkeypatch):
+    monkeypatch.setattr(yfinance_module.yf, "Ticker", FakeTicker, raising=False)
+    monkeypatch.setattr(YFinanceService, "_known_tickers", set())
+    FakeTicker.calls = []
+    return YFinanceService()
+
+
+def test_window_is_inclusive(yf_service):
+    data = yf_service.get_ticker_history("SPY", start=date(2024, 1, 2), end=date(2024, 1, 5))
+
+    assert data["date"].to_list() == [date(2024, 1, d) for d in (2, 3, 4, 5)]
+    assert data.columns == ["date", "open", "high", "low", "close", "volume"]
+
+
+def test_empty_window_of_existing_ticker_is_empty(yf_service):
+    data = yf_service.get_ticker_history("SPY", start=date(2024, 1, 6), end=date(2024, 1, 7))
+
+    assert data.is_empty()
+
+
+def test_unknown_ticker_raises_not_found(yf_service):
+    with pytest.raises(DataNotFoundError):
+        yf_service.get_ticker_history("SPYY", start=date(2024, 1, 2), end=date(2024, 1, 5))
+    with pytest.raises(DataNotFoundError):
+        yf_service.get_ticker_history("SPYY", end=date(2024, 1, 5))
+
+
+def test_known_ticker_skips_existence_check(yf_service):
+    yf_service.get_ticker_history("SPY", start=date(2024, 1, 2), end=date(2024, 1, 5))
+    FakeTicker.calls = []
+
+    yf_service.get_ticker_history("SPY", start=date(2024, 1, 6), end=date(2024, 1, 7))
+
+    assert len(FakeTicker.calls) == 1
+
+
+def test_unknown_ticker_is_negative_cached(yf_service, cache_manager):
+    def fetch():
+        return cache_manager.get_or_fetch(
+            source="yfinance",
+            source_id="SPYY",
+            fetch_fn=lambda: yf_service.get_ticker_history("SPYY", period="max"),
+            frequency="daily",
+            date_range=(date(2024, 1, 1), date(2024, 3, 1)),
+            range_fetch_fn=lambda start, end: yf_service.get_ticker_history("SPYY", period="max", start=start, end=end)
+        )
+
+    with pytest.raises(DataNotFoundError):
+        fetch()
+    FakeTicker.calls = []
+
+    with pytest.raises(DataNotFoundError):
+        fetch()
+    assert FakeTicker.calls == []
+
+
+def test_split_download_partitions_by_ticker(yf_service):
+    columns = pd.MultiIndex.from_product([["Close", "High", "Low", "Open", "Volume"], ["HYG", "TLT"]])
+    wide = pd.DataFrame(np.arange(40, dtype=float).reshape(4, 10), index=BARS[:4], columns=columns)
+    wide.loc[BARS[0], (slice(None), "TLT")] = np.nan
+
+    frames = yf_service._split_download(wide, ["HYG", "TLT"])
+
+    assert sorted(frames) == ["HYG", "TLT"]
+    assert len(frames["HYG"]) == 4
+    assert len(frames["TLT"]) == 3
+    assert frames["TLT"].schema["volume"] == pl.Int64